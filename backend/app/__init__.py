@@ -43,10 +43,11 @@ def create_app(config_name=None):
 
     # 블루프린트 등록
     with app.app_context():
-        from backend.app.routes import films, upload, process
+        from backend.app.routes import films, upload, process, match
         app.register_blueprint(films.bp)
         app.register_blueprint(upload.bp)
         app.register_blueprint(process.bp)
+        app.register_blueprint(match.bp)
 
     # 기본 라우트
     @app.route('/')
@@ -61,4 +62,14 @@ def create_app(config_name=None):
     def health():
         return {'status': 'healthy'}, 200
 
+    # 공유 상태 미리 준비 (WARMUP='preload'이면 gunicorn 워커 fork 전에 완료)
+    from backend.app.services.warmup import Warmup
+    Warmup.start(app)
+
+    @app.route('/health/ready')
+    def health_ready():
+        # 준비 단계(WARMUP)가 끝나야 200 (단계별 소요 시간 포함)
+        status = Warmup.status()
+        return status, 200 if status['ready'] else 503
+
     return app
@@ -109,5 +109,19 @@ class FilmRecipe(db.Model):
 
         return result
 
+    def to_render_dict(self, grain_mode=None, grain_seed=None):
+        """렌더링용 레시피 딕셔너리 (/api/process와 Warmup 공용, ImageProcessor 입력 형식)"""
+        return {
+            'film_name': self.film.name,
+            'type': self.film.type,
+            'grain_intensity': self.grain_intensity or 0.3,
+            'bw_weight_r': self.bw_weight_r,
+            'bw_weight_g': self.bw_weight_g,
+            'bw_weight_b': self.bw_weight_b,
+            'tone_curve': self.tone_curve,
+            'grain_mode': grain_mode,
+            'grain_seed': grain_seed,
+        }
+
     def __repr__(self):
         return f'<FilmRecipe {self.recipe_name} for Film ID {self.film_id}>'
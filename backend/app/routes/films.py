@@ -1,17 +1,24 @@
 """필름 관련 API 엔드포인트"""
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 from backend.app.models.film import Film
-from backend.app.models.recipe import FilmRecipe
+from backend.app.services.film_catalog import FilmCatalog
 from sqlalchemy.exc import SQLAlchemyError
 
 bp = Blueprint('films', __name__, url_prefix='/api')
 
+# 응답 압축 형식 우선순위 (FilmCatalog가 미리 압축한 본문)
+CONTENT_ENCODINGS = ('br', 'gzip')
+
 
 @bp.route('/films', methods=['GET'])
 def get_films():
     """
     필름 목록 조회 API
 
+    응답 본문은 FilmCatalog가 필터 조합별로 미리 직렬화해 둔 바이트를 그대로 사용한다.
+    강한 ETag를 반환하며 If-None-Match가 일치하면 본문 없이 304를 반환한다.
+    Accept-Encoding에 따라 미리 압축한 brotli/gzip 본문을 보낸다.
+
     Query Parameters:
         tier (str): 필름 tier 필터 ('mvp', 'core', 'extended', 'all')
         type (str): 필름 타입 필터 ('color', 'bw', 'all')
@@ -25,47 +32,43 @@ def get_films():
         film_type = request.args.get('type', 'all')
 
         # 유효한 tier 값 검증
-        valid_tiers = ['mvp', 'core', 'extended', 'archive', 'all']
+        valid_tiers = list(FilmCatalog.TIERS)
         if tier not in valid_tiers:
             return jsonify({
                 'error': f'Invalid tier. Must be one of {valid_tiers}'
             }), 400
 
         # 유효한 type 값 검증
-        valid_types = ['color', 'bw', 'all']
+        valid_types = list(FilmCatalog.TYPES)
         if film_type not in valid_types:
             return jsonify({
                 'error': f'Invalid type. Must be one of {valid_types}'
             }), 400
 
-        # 쿼리 시작
-        query = Film.query
-
-        # tier 필터링
-        if tier != 'all':
-            query = query.filter(Film.tier == tier)
-
-        # type 필터링
-        if film_type != 'all':
-            query = query.filter(Film.type == film_type)
-
-        # ISO 순으로 정렬
-        query = query.order_by(Film.iso_base)
-
-        # 결과 조회
-        films = query.all()
-
-        # JSON 변환 (레시피 포함)
-        films_data = [film.to_dict(include_recipes=True) for film in films]
-
-        return jsonify({
-            'count': len(films_data),
-            'films': films_data,
-            'filters': {
-                'tier': tier,
-                'type': film_type
-            }
-        }), 200
+        cached = FilmCatalog.response(tier, film_type)
+
+        # 클라이언트가 받을 수 있는 압축 형식 중 우선순위가 높은 것 (brotli → gzip → 없음)
+        encoding = next(
+            (
+                candidate for candidate in CONTENT_ENCODINGS
+                if candidate in cached.bodies and request.accept_encodings[candidate]
+            ),
+            None
+        )
+        etag = cached.etags[encoding]
+
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(cached.bodies[encoding], mimetype='application/json')
+            if encoding is not None:
+                response.headers['Content-Encoding'] = encoding
+
+        response.set_etag(etag)
+        response.vary.add('Accept-Encoding')
+        # 캐시해 두되 매번 ETag로 재검증
+        response.cache_control.no_cache = True
+        return response
 
     except SQLAlchemyError as e:
         return jsonify({
@@ -0,0 +1,211 @@
+"""필름 매칭 API 엔드포인트 (EXIF 데이터만으로 매칭)"""
+from flask import Blueprint, request, jsonify, Response, stream_with_context
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import json
+import logging
+import math
+import time
+
+from backend.app.services.film_matcher import FilmMatcher
+from backend.app.utils.json_stream import JSONStreamError, JSONStreamReader
+
+bp = Blueprint('match', __name__, url_prefix='/api')
+
+logger = logging.getLogger(__name__)
+
+# 상수
+MAX_MATCH_LIMIT = 20
+BATCH_CHUNK_SIZE = 512  # match_many 한 번에 계산할 레코드 수
+
+# 요청 본문 형식 (MIME type → NDJSON 여부)
+BATCH_CONTENT_TYPES = {
+    'application/json': False,
+    'application/x-ndjson': True,
+    'application/ndjson': True,
+    'application/jsonl': True,
+}
+
+# EXIF 레코드 필드 검증 (EXIFExtractor.extract 결과와 같은 형태, 누락 시 매칭 기본값 사용)
+NUMERIC_FIELDS = ('iso', 'aperture', 'shutter_speed', 'color_temperature')
+STRING_FIELDS = ('white_balance',)
+
+
+@bp.route('/match/batch', methods=['POST'])
+def match_batch() -> Response:
+    """
+    EXIF 레코드 일괄 필름 매칭 (이미지 업로드 없이)
+
+    요청 본문을 스트리밍으로 읽으며 BATCH_CHUNK_SIZE개씩 FilmMatcher.match_many로
+    매칭하고, 레코드마다 NDJSON 한 줄을 바로 내보낸다. 입력 크기와 관계없이
+    메모리 사용량은 청크 하나 분량으로 일정하다.
+
+    Request:
+        Content-Type: application/json (EXIF 객체 배열)
+                      또는 application/x-ndjson (줄마다 EXIF 객체 하나)
+        Query Parameters:
+            - limit (int): 레코드별 반환할 필름 개수 (기본 5, 최대 20)
+
+    Returns:
+        NDJSON: 입력 순서대로 레코드별 한 줄
+            - {"index": 0, "matched_films": [...]} (레코드에 id가 있으면 함께 반환)
+            - {"index": 1, "error": "..."}: 잘못된 레코드 (나머지는 계속 처리)
+            - {"error": "...", "fatal": true}: 본문 형식 오류로 중단 (마지막 줄)
+    """
+    mimetype = request.mimetype
+    if mimetype not in BATCH_CONTENT_TYPES:
+        return jsonify({
+            'error': f'Unsupported Content-Type. Must be one of {list(BATCH_CONTENT_TYPES)}'
+        }), 415
+
+    limit = request.args.get('limit', 5, type=int)
+    if not 1 <= limit <= MAX_MATCH_LIMIT:
+        return jsonify({
+            'error': f'limit must be an integer between 1 and {MAX_MATCH_LIMIT}'
+        }), 400
+
+    ndjson = BATCH_CONTENT_TYPES[mimetype]
+    reader = JSONStreamReader(request.stream)
+
+    def generate() -> Iterator[str]:
+        start_time = time.time()
+        total = 0
+        chunk: List[Tuple[int, Any, Optional[str]]] = []
+        fatal = None
+
+        records = _iter_records(reader, ndjson)
+        while True:
+            try:
+                record, error = next(records)
+            except StopIteration:
+                break
+            except JSONStreamError as e:
+                fatal = str(e)
+                break
+
+            chunk.append((total, record, error))
+            total += 1
+            if len(chunk) >= BATCH_CHUNK_SIZE:
+                yield from _match_chunk(chunk, limit)
+                chunk = []
+
+        if chunk:
+            yield from _match_chunk(chunk, limit)
+
+        if fatal is not None:
+            logger.warning(f"Batch match stopped after {total} record(s): {fatal}")
+            yield _ndjson_line({'error': fatal, 'fatal': True})
+            return
+
+        logger.info(f"Batch matched {total} record(s) in {time.time() - start_time:.2f}s")
+
+    response = Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+    # 리버스 프록시(nginx)가 응답을 모아 두지 않고 줄 단위로 바로 전달하도록 설정
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def _iter_records(
+    reader: JSONStreamReader,
+    ndjson: bool
+) -> Iterator[Tuple[Any, Optional[str]]]:
+    """
+    요청 본문의 레코드를 순서대로 반복
+
+    Args:
+        reader (JSONStreamReader): 본문 리더
+        ndjson (bool): NDJSON 여부 (False면 JSON 배열)
+
+    Yields:
+        Tuple[Any, Optional[str]]: (레코드, 오류 메시지) - 잘못된 레코드는 오류 메시지만 유효
+
+    Raises:
+        JSONStreamError: 본문 형식 오류 (이후 레코드를 읽을 수 없음)
+    """
+    if ndjson:
+        for line in reader.iter_lines():
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield None, f'Invalid JSON: {e}'
+                continue
+            yield record, _validate_record(record)
+    else:
+        for record in reader.iter_array():
+            yield record, _validate_record(record)
+
+
+def _validate_record(record: Any) -> Optional[str]:
+    """
+    EXIF 레코드 검증
+
+    Args:
+        record (Any): 해석된 레코드
+
+    Returns:
+        Optional[str]: 오류 메시지 (유효하면 None)
+    """
+    if not isinstance(record, dict):
+        return 'Record must be a JSON object'
+
+    for field in NUMERIC_FIELDS:
+        value = record.get(field)
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            return f'{field} must be a finite number'
+
+    for field in STRING_FIELDS:
+        value = record.get(field)
+        if value is not None and not isinstance(value, str):
+            return f'{field} must be a string'
+
+    return None
+
+
+def _match_chunk(chunk: List[Tuple[int, Any, Optional[str]]], limit: int) -> Iterator[str]:
+    """
+    레코드 청크를 한 번에 매칭하고 입력 순서대로 NDJSON 줄 생성
+
+    Args:
+        chunk (List[Tuple[int, Any, Optional[str]]]): (인덱스, 레코드, 오류 메시지) 목록
+        limit (int): 레코드별 반환할 필름 개수
+
+    Yields:
+        str: NDJSON 줄
+    """
+    valid = [_exif_fields(record) for _, record, error in chunk if error is None]
+    matches = iter(FilmMatcher.match_many(valid, limit=limit))
+
+    for index, record, error in chunk:
+        line: Dict[str, Any] = {'index': index}
+        if isinstance(record, dict) and 'id' in record:
+            line['id'] = record['id']
+
+        if error is None:
+            line['matched_films'] = next(matches)
+        else:
+            line['error'] = error
+
+        yield _ndjson_line(line)
+
+
+def _exif_fields(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    매칭에 쓰는 필드만 추출 (null 값은 누락으로 처리해 매칭 기본값 사용)
+
+    Args:
+        record (Dict[str, Any]): 검증된 레코드
+
+    Returns:
+        Dict[str, Any]: EXIF 데이터
+    """
+    return {
+        field: record[field]
+        for field in NUMERIC_FIELDS + STRING_FIELDS
+        if record.get(field) is not None
+    }
+
+
+def _ndjson_line(data: Dict[str, Any]) -> str:
+    """NDJSON 한 줄 직렬화"""
+    return json.dumps(data, ensure_ascii=False) + '\n'
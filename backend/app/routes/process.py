@@ -1,19 +1,44 @@
 """이미지 처리 및 다운로드 API"""
-from flask import Blueprint, request, jsonify, send_file, Response
+from flask import Blueprint, request, jsonify, send_file, Response, stream_with_context
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
-import zipfile
-import io
+from typing import List, Dict, Any, Optional, Tuple, Callable
+import functools
+import hashlib
+import json
 import logging
+import threading
 import time
 
 from backend.config import Config
 from backend.app.models.film import Film
+from backend.app.services.batch_scheduler import BatchScheduler
 from backend.app.services.image_processor import ImageProcessor
+from backend.app.services.image_encoder import ImageEncoder
+from backend.app.services.render_executor import RenderExecutor
+from backend.app.services.render_cache import RenderCache
+from backend.app.services.job_queue import JobQueue, JobTracker
+from backend.app.utils.zip_stream import StoredZipStream
 
 bp = Blueprint('process', __name__, url_prefix='/api')
 logger = logging.getLogger(__name__)
 
+# 상수
+MAX_FILMS = 10
+MAX_PREVIEW_FILMS = 50
+PREVIEW_SIZE_RANGE = (256, 2048)
+
+# 렌더링 완료 후 Job 폴더에 저장되는 전체 다운로드 아카이브
+ARCHIVE_FILENAME = 'all_films.zip'
+
+# 출력 파일 확장자별 MIME type
+OUTPUT_MIMETYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.webp': 'image/webp',
+    '.avif': 'image/avif',
+}
+
 
 @bp.route('/process', methods=['POST'])
 def process_images() -> Tuple[Response, int]:
@@ -25,12 +50,27 @@ def process_images() -> Tuple[Response, int]:
             "job_id": "abc123",
             "film_ids": [1, 2, 3, 4, 5],
             "options": {
-                "output_quality": 95
+                "output_profile": "max",
+                "output_format": "jpeg",
+                "output_quality": 95,
+                "subsampling": "4:4:4",
+                "progressive": false,
+                "optimize": true,
+                "full_resolution": false,
+                "grain_mode": "resize",
+                "grain_seed": null,
+                "async": false
             }
         }
 
+        async가 true이면 (또는 ?async=1) 렌더링을 백그라운드 작업으로 넣고
+        202와 함께 작업 핸들을 바로 반환한다. 진행 상태는 GET /api/jobs/<job_id>로 조회한다.
+
+        업로드된 모든 이미지에 선택한 모든 필름을 적용한다. results는 이미지 순서,
+        이미지 안에서는 필름 요청 순서이며 항목마다 image(원본 파일명)가 포함된다.
+
     Returns:
-        JSON: 처리 결과 및 다운로드 URL
+        JSON: 처리 결과 및 다운로드 URL (비동기 모드: job_id, status, status_url)
     """
     start_time = time.time()
 
@@ -43,6 +83,7 @@ def process_images() -> Tuple[Response, int]:
 
         job_id = data.get('job_id', '').strip()
         film_ids = data.get('film_ids', [])
+        options = data.get('options') or {}
 
         # job_id 검증 (길이 및 문자 검증)
         if not job_id or len(job_id) != 12:
@@ -51,20 +92,33 @@ def process_images() -> Tuple[Response, int]:
             }), 400
 
         # film_ids 검증
-        if not film_ids or not isinstance(film_ids, list):
-            return jsonify({
-                'error': 'film_ids must be a non-empty list'
-            }), 400
+        film_ids_error = _validate_film_ids(film_ids, MAX_FILMS)
+        if film_ids_error:
+            return jsonify({'error': film_ids_error}), 400
 
-        if len(film_ids) > 10:
+        if not isinstance(options, dict):
             return jsonify({
-                'error': f'Maximum 10 films allowed (got {len(film_ids)})'
+                'error': 'options must be an object'
             }), 400
 
-        # film_ids가 모두 정수인지 확인
-        if not all(isinstance(fid, int) for fid in film_ids):
+        full_resolution = bool(options.get('full_resolution', Config.FULL_RESOLUTION_RENDER))
+
+        grain_mode = options.get('grain_mode', Config.GRAIN_MODE)
+        grain_seed = options.get('grain_seed')
+        grain_error = _validate_grain_options(grain_mode, grain_seed)
+        if grain_error:
+            return jsonify({'error': grain_error}), 400
+
+        # 출력 인코더 (output_profile 기본값 'max'에 개별 옵션 적용)
+        try:
+            encoder = ImageEncoder.resolve(options)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        run_async = options.get('async', request.args.get('async', '').lower() in ('1', 'true'))
+        if not isinstance(run_async, bool):
             return jsonify({
-                'error': 'All film_ids must be integers'
+                'error': 'options.async must be a boolean'
             }), 400
 
         logger.info(f"Processing request for job {job_id} with {len(film_ids)} films")
@@ -81,12 +135,7 @@ def process_images() -> Tuple[Response, int]:
             return jsonify({'error': f'Invalid job path'}), 500
 
         # 3. 입력 이미지 파일 찾기
-        input_files = list(job_folder.glob('*.[jJ][pP][gG]')) + \
-                     list(job_folder.glob('*.[jJ][pP][eE][gG]')) + \
-                     list(job_folder.glob('*.[pP][nN][gG]'))
-
-        # UUID 접두사가 있는 파일만 (원본 파일)
-        input_files = [f for f in input_files if len(f.stem) > 8 and '_' in f.stem]
+        input_files = _find_input_files(job_folder)
 
         if not input_files:
             logger.error(f"No input images found in job {job_id}")
@@ -102,112 +151,144 @@ def process_images() -> Tuple[Response, int]:
             logger.error(f"Failed to create output folder: {e}")
             return jsonify({'error': 'Failed to create output directory'}), 500
 
-        # 5. 각 입력 이미지 × 각 필름별로 이미지 처리
-        results = []
-        failed_film_ids = []
+        # 5. 이미지 × 필름 작업 행렬 구성 (레시피는 요청 스레드에서 한 번만 조회)
+        film_jobs, failed_film_ids = _prepare_film_jobs(film_ids, grain_mode, grain_seed)
+        image_jobs = _build_image_jobs(
+            input_files, film_jobs, failed_film_ids, ImageEncoder.extension(encoder)
+        )
+        logger.info(
+            f"Processing {len(image_jobs)} image(s) x {len(film_ids)} film(s) for job {job_id}"
+        )
 
-        # MVP: 첫 번째 이미지만 처리 (성능 고려)
-        # TODO: Phase 2에서 다중 이미지 × 다중 필름 처리 추가
-        input_file = input_files[0]
-        logger.info(f"Processing image: {input_file.name} with {len(film_ids)} film(s)")
+        # 진행 상태 목록 (응답 results와 같은 순서: 이미지별 렌더링 대상 → 준비 단계 실패)
+        films = []
+        for image_job in image_jobs:
+            films.extend(
+                {
+                    'film_id': cell['film_id'],
+                    'film_name': cell['film_name'],
+                    'image': cell['image'],
+                    'status': 'queued'
+                }
+                for cell in image_job['cells']
+            )
+            films.extend(image_job['failed'])
 
-        for idx, film_id in enumerate(film_ids, 1):
-            logger.info(f"Processing film {idx}/{len(film_ids)}: ID={film_id}")
+        # 진행 중인 작업 확인과 상태 기록을 한 번에 (동시 요청 중 하나만 선점)
+        tracker = JobTracker(job_folder, job_id, films)
+        if not JobQueue.claim(tracker):
+            return jsonify({
+                'error': f'Job {job_id} is already being processed',
+                'status_url': f"/api/jobs/{job_id}"
+            }), 409
 
-            # 필름 정보 조회
+        render_args = (
+            tracker, job_id, image_jobs, output_folder, full_resolution, encoder, start_time
+        )
+
+        # 비동기 모드: 작업을 큐에 넣고 바로 202 반환
+        if run_async:
             try:
-                film = Film.query.get(film_id)
+                JobQueue.submit(job_id, _run_process_job, *render_args)
             except Exception as e:
-                logger.error(f"Database error querying film {film_id}: {e}", exc_info=True)
-                failed_film_ids.append({
-                    'film_id': film_id,
-                    'error': 'Database error',
-                    'status': 'failed'
-                })
-                continue
-
-            if not film:
-                logger.warning(f"Film not found: {film_id}")
-                failed_film_ids.append({
-                    'film_id': film_id,
-                    'error': 'Film not found',
-                    'status': 'failed'
-                })
-                continue
-
-            if not film.recipes:
-                logger.warning(f"No recipes found for film: {film.name} (ID={film_id})")
-                failed_film_ids.append({
-                    'film_id': film_id,
-                    'film_name': film.name,
-                    'error': 'No active recipe for this film',
-                    'status': 'failed'
-                })
-                continue
+                tracker.fail(str(e))
+                raise
 
-            recipe = film.recipes[0]
-            logger.debug(f"Using recipe for {film.name}: grain_intensity={recipe.grain_intensity}")
+            return jsonify({
+                'job_id': job_id,
+                'status': 'queued',
+                'total': tracker.state['total'],
+                'images': len(image_jobs),
+                'status_url': f"/api/jobs/{job_id}"
+            }), 202
 
-            # 출력 파일명 생성
-            film_slug = film.name.lower().replace(' ', '_').replace('/', '_')
+        response_data = _run_process_job(*render_args)
 
-            # 원본 파일명에서 UUID 제거
-            try:
-                original_name = input_file.stem.split('_', 1)[1] if '_' in input_file.stem else input_file.stem
-            except IndexError:
-                original_name = input_file.stem
+        return jsonify(response_data), 200
 
-            output_filename = f"{original_name}_{film_slug}.jpg"
-            output_path = output_folder / output_filename
+    except Exception as e:
+        logger.error(f"Unexpected error in process_images: {e}", exc_info=True)
+        return jsonify({
+            'error': 'Processing failed',
+            'message': str(e)
+        }), 500
 
-            # 필름 레시피 딕셔너리 생성
-            film_recipe_dict = {
-                'film_name': film.name,
-                'type': film.type,
-                'grain_intensity': recipe.grain_intensity or 0.3,
-                'bw_weight_r': recipe.bw_weight_r,
-                'bw_weight_g': recipe.bw_weight_g,
-                'bw_weight_b': recipe.bw_weight_b,
-            }
 
-            # 이미지 처리
-            film_start_time = time.time()
-            try:
-                logger.info(f"Applying film simulation: {film.name}")
-                ImageProcessor.apply_film_simulation(
-                    str(input_file),
-                    str(output_path),
-                    film_recipe_dict
-                )
+def _run_process_job(
+    tracker: JobTracker,
+    job_id: str,
+    image_jobs: List[Dict[str, Any]],
+    output_folder: Path,
+    full_resolution: bool,
+    encoder: Dict[str, Any],
+    start_time: float
+) -> Dict[str, Any]:
+    """
+    이미지 × 필름 렌더링 실행 및 응답 데이터 생성 (동기 요청과 백그라운드 작업 공용)
 
-                processing_time = time.time() - film_start_time
-                logger.info(f"Successfully processed {film.name} in {processing_time:.2f}s")
+    이미지마다 한 번 디코딩해 그 이미지의 필름을 모두 렌더링하며,
+    이미지 작업의 동시 실행은 BatchScheduler가 메모리 예산 안에서 조절한다.
+    진행 상태는 필름 하나가 끝날 때마다 job.json에 기록된다.
+    DB 조회는 요청 스레드에서 끝났으므로 앱 컨텍스트 없이 실행할 수 있다.
 
-                results.append({
-                    'film_id': film.id,
-                    'film_name': film.name,
-                    'output_url': f"/api/download/{job_id}/{output_filename}",
-                    'status': 'success',
-                    'processing_time': round(processing_time, 2)
-                })
+    Args:
+        tracker (JobTracker): 작업 상태 기록기
+        job_id (str): Job ID
+        image_jobs (List[Dict[str, Any]]): _build_image_jobs() 이미지별 작업 목록
+        output_folder (Path): 출력 폴더
+        full_resolution (bool): 원본 해상도 렌더링 여부
+        encoder (Dict[str, Any]): ImageEncoder.resolve() 출력 인코더 설정
+        start_time (float): 요청 시작 시각 (time.time())
 
-            except Exception as e:
-                processing_time = time.time() - film_start_time
-                logger.error(
-                    f"Failed to process film {film.name} after {processing_time:.2f}s: {e}",
-                    exc_info=True
+    Returns:
+        Dict[str, Any]: /api/process 응답 데이터
+    """
+    try:
+        tracker.start()
+
+        # 여러 이미지 작업 스레드가 같은 job.json을 갱신하므로 직렬화
+        report_lock = threading.Lock()
+
+        def report(image_job: Dict[str, Any], index: int, film_result: Dict[str, Any]) -> None:
+            result = _format_film_result(job_id, image_job['cells'][index], film_result)
+            with report_lock:
+                tracker.update_film(image_job['offset'] + index, result)
+
+        # 이미지 순서대로 실행 (같은 이미지의 필름은 한 작업에서 디코딩 결과 공유)
+        scheduled = [image_job for image_job in image_jobs if image_job['cells']]
+        renders = BatchScheduler.run([
+            (
+                BatchScheduler.estimate_bytes(image_job['input_file'], full_resolution),
+                functools.partial(
+                    _render_image, image_job, output_folder, full_resolution, encoder, report
                 )
-                results.append({
-                    'film_id': film.id,
-                    'film_name': film.name,
-                    'error': str(e),
-                    'status': 'failed'
-                })
-
-        # 6. failed_film_ids를 results에 병합
-        all_results = results + failed_film_ids
-
-        # 7. 응답 생성
+            )
+            for image_job in scheduled
+        ])
+        rendered = {id(image_job): render for image_job, render in zip(scheduled, renders)}
+
+        all_results = []
+        shared_time = 0.0
+        shared_stages: Dict[str, float] = {}
+        cache_hits = 0
+        cache_misses = 0
+
+        for image_job in image_jobs:
+            render = rendered.get(id(image_job))
+            if render is not None:
+                for cell, film_result in zip(image_job['cells'], render['results']):
+                    all_results.append(_format_film_result(job_id, cell, film_result))
+
+                shared_time += render['shared_time']
+                for stage, elapsed in render['stages'].items():
+                    shared_stages[stage] = shared_stages.get(stage, 0.0) + elapsed
+                cache_hits += render['cache_hits']
+                cache_misses += len(image_job['cells']) - render['cache_hits']
+
+            # 준비 단계에서 실패한 필름 결과 병합
+            all_results.extend(image_job['failed'])
+
+        # 응답 생성
         total_time = time.time() - start_time
         success_count = len([r for r in all_results if r.get('status') == 'success'])
         failed_count = len([r for r in all_results if r.get('status') == 'failed'])
@@ -215,35 +296,662 @@ def process_images() -> Tuple[Response, int]:
         response_data = {
             'job_id': job_id,
             'status': 'completed',
-            'total': len(film_ids),
+            'total': len(all_results),
+            'images': len(image_jobs),
             'success': success_count,
             'failed': failed_count,
             'results': all_results,
             'zip_url': f"/api/download/{job_id}/all_films.zip" if success_count > 0 else None,
-            'processing_time': round(total_time, 2)
+            'processing_time': round(total_time, 2),
+            'shared_processing_time': round(shared_time, 2),
+            'shared_stages': {
+                stage: round(elapsed, 3) for stage, elapsed in shared_stages.items()
+            }
         }
 
-        # 여러 이미지 업로드 시 경고 메시지
-        if len(input_files) > 1:
-            response_data['warning'] = f"MVP에서는 첫 번째 이미지만 처리됩니다. (총 {len(input_files)}개 업로드됨)"
-            logger.info(f"Multiple images uploaded ({len(input_files)}), but only first one processed")
+        if RenderCache.is_enabled():
+            response_data['render_cache'] = {
+                'hits': cache_hits,
+                'misses': cache_misses,
+                'process_hit_rate': RenderCache.stats()['hit_rate']
+            }
 
         logger.info(
-            f"Processing completed for job {job_id}: "
+            f"Processing completed for job {job_id}: {len(image_jobs)} image(s), "
             f"{success_count} success, {failed_count} failed, "
             f"total time: {total_time:.2f}s"
         )
 
-        return jsonify(response_data), 200
+        # 반복 다운로드용 아카이브 저장 (실패해도 다운로드 시 스트리밍으로 대체)
+        if success_count > 0:
+            _write_job_archive(output_folder.parent)
+
+        tracker.finish(response_data)
+        return response_data
 
     except Exception as e:
-        logger.error(f"Unexpected error in process_images: {e}", exc_info=True)
+        try:
+            tracker.fail(str(e))
+        except Exception as save_error:
+            logger.error(f"Failed to record job failure for {job_id}: {save_error}")
+        raise
+
+
+def _render_image(
+    image_job: Dict[str, Any],
+    output_folder: Path,
+    full_resolution: bool,
+    encoder: Dict[str, Any],
+    report: Callable[[Dict[str, Any], int, Dict[str, Any]], None]
+) -> Dict[str, Any]:
+    """
+    이미지 하나에 대한 필름 렌더링 (렌더 캐시 조회 → 한 번 디코딩 후 필름별 렌더링)
+
+    디코딩된 버퍼는 렌더러 안에서만 유지되므로 반환 시점에 해제된다.
+    디코딩 실패는 이 이미지의 필름 결과로만 기록하고 다른 이미지 처리는 계속된다.
+
+    Args:
+        image_job (Dict[str, Any]): 이미지별 작업 (input_file, offset, cells)
+        output_folder (Path): 출력 폴더
+        full_resolution (bool): 원본 해상도 렌더링 여부
+        encoder (Dict[str, Any]): ImageEncoder.resolve() 출력 인코더 설정
+        report (Callable): 필름 하나가 끝날 때마다 (이미지 작업, 필름 인덱스, 결과)로 호출
+
+    Returns:
+        Dict[str, Any]: 렌더링 결과
+            - results (List[Dict]): cells 순서대로의 렌더러 결과
+            - shared_time (float): 공유 디코딩 단계 소요 시간 (초)
+            - stages (Dict[str, float]): 공유 단계별 소요 시간 (초)
+            - cache_hits (int): 렌더 캐시 적중 수
+    """
+    input_file = image_job['input_file']
+    cells = image_job['cells']
+
+    film_results: List[Optional[Dict[str, Any]]] = [None] * len(cells)
+    cache_keys: List[Optional[str]] = [None] * len(cells)
+    shared_time = 0.0
+    shared_stages = {}
+
+    # 렌더 캐시 조회 (입력 바이트 + 레시피 + 인코더 설정이 같으면 재사용)
+    if RenderCache.is_enabled():
+        try:
+            input_digest = RenderCache.file_digest(input_file)
+        except OSError as e:
+            logger.warning(f"Failed to hash {input_file.name} for render cache: {e}")
+            input_digest = None
+
+        if input_digest is not None:
+            for index, cell in enumerate(cells):
+                # 렌더링마다 결과가 다른 레시피 (시드 없는 'tile' 그레인)는 캐시하지 않음
+                if not RenderCache.is_cacheable(cell['recipe']):
+                    continue
+
+                lookup_start = time.perf_counter()
+                key = RenderCache.make_key(input_digest, cell['recipe'], encoder, full_resolution)
+                cache_keys[index] = key
+                output_file = output_folder / cell['output_filename']
+
+                if RenderCache.fetch(key, output_file):
+                    elapsed = time.perf_counter() - lookup_start
+                    film_results[index] = {
+                        'output_path': str(output_file),
+                        'status': 'success',
+                        'cached': True,
+                        'processing_time': elapsed,
+                        'stages': {'cache': elapsed}
+                    }
+                    report(image_job, index, film_results[index])
+
+    pending = [index for index, result in enumerate(film_results) if result is None]
+
+    if pending:
+        try:
+            logger.info(
+                f"Applying {len(pending)} film simulation(s) to {input_file.name}: "
+                f"{', '.join(cells[index]['film_name'] for index in pending)}"
+            )
+            # 필름이 여러 개면 프로세스 풀에서 병렬 렌더링 (RENDER_POOL_SIZE > 0)
+            if RenderExecutor.is_enabled() and len(pending) > 1:
+                renderer = RenderExecutor
+            else:
+                renderer = ImageProcessor
+
+            batch = renderer.apply_film_simulations(
+                str(input_file),
+                [
+                    (str(output_folder / cells[index]['output_filename']), cells[index]['recipe'])
+                    for index in pending
+                ],
+                full_resolution=full_resolution,
+                memory_budget=Config.RENDER_MEMORY_BUDGET,
+                on_result=lambda position, result: report(image_job, pending[position], result),
+                encoder=encoder
+            )
+            shared_time = batch['shared_time']
+            shared_stages = batch['stages']
+            rendered = batch['results']
+
+        except Exception as e:
+            logger.error(f"Failed to decode {input_file.name}: {e}", exc_info=True)
+            rendered = [
+                {'status': 'failed', 'error': str(e)} for _ in pending
+            ]
+            for index, film_result in zip(pending, rendered):
+                report(image_job, index, film_result)
+
+        for index, film_result in zip(pending, rendered):
+            film_results[index] = film_result
+            if film_result['status'] == 'success' and cache_keys[index] is not None:
+                RenderCache.store(cache_keys[index], Path(film_result['output_path']))
+
+    return {
+        'results': film_results,
+        'shared_time': shared_time,
+        'stages': shared_stages,
+        'cache_hits': len(cells) - len(pending)
+    }
+
+
+def _format_film_result(
+    job_id: str,
+    job: Dict[str, Any],
+    film_result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    렌더러의 필름별 결과를 API 응답 형식으로 변환
+
+    Args:
+        job_id (str): Job ID
+        job (Dict[str, Any]): 필름 렌더링 작업 (film_id, film_name, output_filename, 선택: image)
+        film_result (Dict[str, Any]): 렌더러 결과 (status, processing_time, stages 또는 error)
+
+    Returns:
+        Dict[str, Any]: 응답용 필름 결과 (작업에 image가 있으면 함께 반환)
+    """
+    if film_result['status'] == 'success':
+        processing_time = film_result['processing_time']
+        logger.info(f"Successfully processed {job['film_name']} in {processing_time:.2f}s")
+
+        result = {
+            'film_id': job['film_id'],
+            'film_name': job['film_name'],
+            'output_url': f"/api/download/{job_id}/{job['output_filename']}",
+            'status': 'success',
+            'processing_time': round(processing_time, 2),
+            'stages': {
+                stage: round(elapsed, 3)
+                for stage, elapsed in film_result['stages'].items()
+            }
+        }
+        if film_result.get('cached'):
+            result['cached'] = True
+        if 'image' in job:
+            result['image'] = job['image']
+
+        return result
+
+    logger.error(f"Failed to process film {job['film_name']}: {film_result['error']}")
+    result = {
+        'film_id': job['film_id'],
+        'film_name': job['film_name'],
+        'error': film_result['error'],
+        'status': 'failed'
+    }
+    if 'image' in job:
+        result['image'] = job['image']
+
+    return result
+
+
+def _validate_film_ids(film_ids: Any, max_films: int) -> Optional[str]:
+    """
+    film_ids 요청 값 검증
+
+    Args:
+        film_ids (Any): 요청의 film_ids 값
+        max_films (int): 최대 필름 수
+
+    Returns:
+        Optional[str]: 오류 메시지 (유효하면 None)
+    """
+    if not film_ids or not isinstance(film_ids, list):
+        return 'film_ids must be a non-empty list'
+
+    if len(film_ids) > max_films:
+        return f'Maximum {max_films} films allowed (got {len(film_ids)})'
+
+    # film_ids가 모두 정수인지 확인
+    if not all(isinstance(fid, int) for fid in film_ids):
+        return 'All film_ids must be integers'
+
+    return None
+
+
+def _validate_grain_options(grain_mode: Any, grain_seed: Any) -> Optional[str]:
+    """
+    그레인 옵션 검증
+
+    Args:
+        grain_mode (Any): options.grain_mode 값
+        grain_seed (Any): options.grain_seed 값
+
+    Returns:
+        Optional[str]: 오류 메시지 (유효하면 None)
+    """
+    if grain_mode not in ImageProcessor.GRAIN_MODES:
+        return f'Invalid grain_mode. Must be one of {list(ImageProcessor.GRAIN_MODES)}'
+
+    # bool은 int의 하위 클래스이므로 JSON true/false를 따로 거부
+    if grain_seed is not None and (
+        isinstance(grain_seed, bool) or not isinstance(grain_seed, int) or grain_seed < 0
+    ):
+        return 'grain_seed must be a non-negative integer'
+
+    return None
+
+
+def _find_input_files(job_folder: Path) -> List[Path]:
+    """
+    Job 폴더의 원본 입력 이미지 목록
+
+    Args:
+        job_folder (Path): Job 폴더
+
+    Returns:
+        List[Path]: UUID 접두사가 있는 원본 이미지 파일 목록
+    """
+    input_files = list(job_folder.glob('*.[jJ][pP][gG]')) + \
+                 list(job_folder.glob('*.[jJ][pP][eE][gG]')) + \
+                 list(job_folder.glob('*.[pP][nN][gG]'))
+
+    # UUID 접두사가 있는 파일만 (원본 파일)
+    return [f for f in input_files if len(f.stem) > 8 and '_' in f.stem]
+
+
+def _original_name(input_file: Path) -> str:
+    """
+    저장된 입력 파일명에서 UUID 접두사 제거
+
+    Args:
+        input_file (Path): 입력 이미지 경로
+
+    Returns:
+        str: 원본 파일명 (확장자 제외)
+    """
+    try:
+        return input_file.stem.split('_', 1)[1] if '_' in input_file.stem else input_file.stem
+    except IndexError:
+        return input_file.stem
+
+
+def _prepare_film_jobs(
+    film_ids: List[int],
+    grain_mode: str,
+    grain_seed: Optional[int]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    필름 ID별 레시피 조회 및 렌더링 작업 구성 (이미지와 무관, 요청당 한 번)
+
+    Args:
+        film_ids (List[int]): 필름 ID 목록
+        grain_mode (str): 그레인 배치 방식
+        grain_seed (Optional[int]): 그레인 오프셋 시드
+
+    Returns:
+        Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+            (렌더링 작업 목록 - film_id, film_name, film_slug, recipe,
+             준비 단계에서 실패한 필름 결과 목록)
+    """
+    film_jobs = []
+    failed_film_ids = []
+
+    for idx, film_id in enumerate(film_ids, 1):
+        logger.info(f"Preparing film {idx}/{len(film_ids)}: ID={film_id}")
+
+        # 필름 정보 조회
+        try:
+            film = Film.query.get(film_id)
+        except Exception as e:
+            logger.error(f"Database error querying film {film_id}: {e}", exc_info=True)
+            failed_film_ids.append({
+                'film_id': film_id,
+                'error': 'Database error',
+                'status': 'failed'
+            })
+            continue
+
+        if not film:
+            logger.warning(f"Film not found: {film_id}")
+            failed_film_ids.append({
+                'film_id': film_id,
+                'error': 'Film not found',
+                'status': 'failed'
+            })
+            continue
+
+        if not film.recipes:
+            logger.warning(f"No recipes found for film: {film.name} (ID={film_id})")
+            failed_film_ids.append({
+                'film_id': film_id,
+                'film_name': film.name,
+                'error': 'No active recipe for this film',
+                'status': 'failed'
+            })
+            continue
+
+        recipe = film.recipes[0]
+        logger.debug(f"Using recipe for {film.name}: grain_intensity={recipe.grain_intensity}")
+
+        # 출력 파일명 접미사 (이미지별 파일명은 _output_filename)
+        film_slug = film.name.lower().replace(' ', '_').replace('/', '_')
+
+        # 필름 레시피 딕셔너리 생성
+        film_recipe_dict = recipe.to_render_dict(grain_mode, grain_seed)
+
+        film_jobs.append({
+            'film_id': film.id,
+            'film_name': film.name,
+            'film_slug': film_slug,
+            'recipe': film_recipe_dict
+        })
+
+    return film_jobs, failed_film_ids
+
+
+def _output_filename(image: str, job: Dict[str, Any], extension: str = '.jpg') -> str:
+    """
+    이미지 × 필름 출력 파일명
+
+    Args:
+        image (str): 원본 파일명 (확장자 제외)
+        job (Dict[str, Any]): 필름 렌더링 작업 (film_slug)
+        extension (str): 출력 파일 확장자
+
+    Returns:
+        str: 출력 파일명
+    """
+    return f"{image}_{job['film_slug']}{extension}"
+
+
+def _build_image_jobs(
+    input_files: List[Path],
+    film_jobs: List[Dict[str, Any]],
+    failed_film_ids: List[Dict[str, Any]],
+    extension: str
+) -> List[Dict[str, Any]]:
+    """
+    이미지 × 필름 작업 행렬 구성 (이미지 순서, 이미지 안에서는 필름 요청 순서)
+
+    같은 원본 파일명이 여러 번 업로드되면 출력 파일명이 겹치지 않도록
+    두 번째부터 이미지 이름에 번호를 붙인다 (IMG_0001, IMG_0001_2, ...).
+
+    Args:
+        input_files (List[Path]): 입력 이미지 목록
+        film_jobs (List[Dict[str, Any]]): _prepare_film_jobs() 렌더링 작업 목록
+        failed_film_ids (List[Dict[str, Any]]): 준비 단계에서 실패한 필름 결과 목록
+        extension (str): 출력 파일 확장자
+
+    Returns:
+        List[Dict[str, Any]]: 이미지별 작업
+            - input_file (Path): 입력 이미지
+            - image (str): 응답에 표시할 이미지 이름 (출력 파일명 접두사)
+            - offset (int): 응답 results에서 이 이미지의 첫 결과 위치
+            - cells (List[Dict]): 필름별 렌더링 작업 (film_jobs 항목 + image, output_filename)
+            - failed (List[Dict]): 준비 단계 실패 결과 (+ image)
+    """
+    image_jobs = []
+    used_names = set()
+    offset = 0
+
+    for input_file in input_files:
+        original_name = _original_name(input_file)
+        image, number = original_name, 2
+        while image in used_names:
+            image = f"{original_name}_{number}"
+            number += 1
+        used_names.add(image)
+
+        cells = [
+            {**job, 'image': image, 'output_filename': _output_filename(image, job, extension)}
+            for job in film_jobs
+        ]
+        failed = [{**result, 'image': image} for result in failed_film_ids]
+
+        image_jobs.append({
+            'input_file': input_file,
+            'image': image,
+            'offset': offset,
+            'cells': cells,
+            'failed': failed
+        })
+        offset += len(cells) + len(failed)
+
+    return image_jobs
+
+
+@bp.route('/preview', methods=['POST'])
+def preview_images() -> Tuple[Response, int]:
+    """
+    필름 선택용 저해상도 미리보기 렌더링
+
+    업로드 원본을 한 번만 preview_size로 축소 디코딩하고(preview/source_<size>.npy로 캐싱)
+    같은 ImageProcessor 단계로 요청된 필름을 모두 렌더링한다.
+    결과는 레시피와 옵션별로 Job의 preview 폴더에 캐싱되어 같은 미리보기를 다시
+    요청하면 렌더링 없이 바로 반환된다. 프로세스 풀과 비동기 작업 큐는 사용하지 않는다.
+
+    Request:
+        {
+            "job_id": "abc123",
+            "film_ids": [1, 2, 3, 4, 5],
+            "options": {
+                "preview_size": 1024,
+                "grain_mode": "resize",
+                "grain_seed": null,
+                "output_profile": "fast"
+            }
+
+        인코더 옵션은 /api/process와 같고 기본 프로파일만 'fast'다.
+        }
+
+    Returns:
+        JSON: 필름별 미리보기 URL 및 처리 시간
+    """
+    start_time = time.time()
+
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({'error': 'No JSON data provided'}), 400
+
+        job_id = data.get('job_id', '').strip()
+        film_ids = data.get('film_ids', [])
+        options = data.get('options') or {}
+
+        if not job_id or len(job_id) != 12:
+            return jsonify({
+                'error': 'Invalid job_id format (must be 12 characters)'
+            }), 400
+
+        film_ids_error = _validate_film_ids(film_ids, MAX_PREVIEW_FILMS)
+        if film_ids_error:
+            return jsonify({'error': film_ids_error}), 400
+
+        if not isinstance(options, dict):
+            return jsonify({
+                'error': 'options must be an object'
+            }), 400
+
+        preview_size = options.get('preview_size', Config.PREVIEW_SIZE)
+        min_size, max_size = PREVIEW_SIZE_RANGE
+        if not isinstance(preview_size, int) or not min_size <= preview_size <= max_size:
+            return jsonify({
+                'error': f'preview_size must be an integer between {min_size} and {max_size}'
+            }), 400
+
+        grain_mode = options.get('grain_mode', Config.GRAIN_MODE)
+        grain_seed = options.get('grain_seed')
+        grain_error = _validate_grain_options(grain_mode, grain_seed)
+        if grain_error:
+            return jsonify({'error': grain_error}), 400
+
+        try:
+            encoder = ImageEncoder.resolve(options, profile='fast')
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        job_folder = Config.UPLOAD_FOLDER / job_id
+
+        if not job_folder.is_dir():
+            return jsonify({'error': f'Job {job_id} not found'}), 404
+
+        input_files = _find_input_files(job_folder)
+
+        if not input_files:
+            return jsonify({'error': 'No input images found'}), 404
+
+        input_file = input_files[0]
+        preview_folder = job_folder / 'preview'
+        film_jobs, failed_film_ids = _prepare_film_jobs(film_ids, grain_mode, grain_seed)
+
+        # 레시피, 인코더, 미리보기 크기가 같으면 같은 파일명 (캐시 키)
+        for job in film_jobs:
+            job['output_filename'] = _preview_filename(
+                _original_name(input_file), job, preview_size, encoder
+            )
+
+        pending = [
+            job for job in film_jobs
+            if not (preview_folder / job['output_filename']).is_file()
+        ]
+
+        shared_time = 0.0
+        shared_stages = {}
+        rendered = {}
+
+        if pending:
+            batch = ImageProcessor.apply_film_simulations(
+                str(input_file),
+                [(str(preview_folder / job['output_filename']), job['recipe']) for job in pending],
+                max_dimension=preview_size,
+                source_cache=str(preview_folder / f"source_{preview_size}.npy"),
+                encoder=encoder
+            )
+            shared_time = batch['shared_time']
+            shared_stages = batch['stages']
+            rendered = {
+                job['output_filename']: film_result
+                for job, film_result in zip(pending, batch['results'])
+            }
+
+        results = []
+        for job in film_jobs:
+            film_result = rendered.get(job['output_filename'])
+
+            if film_result is None:
+                results.append({
+                    'film_id': job['film_id'],
+                    'film_name': job['film_name'],
+                    'preview_url': f"/api/preview/{job_id}/{job['output_filename']}",
+                    'status': 'success',
+                    'cached': True
+                })
+                continue
+
+            result = _format_film_result(job_id, job, film_result)
+            if result['status'] == 'success':
+                del result['output_url']
+                result['preview_url'] = f"/api/preview/{job_id}/{job['output_filename']}"
+                result['cached'] = False
+            results.append(result)
+
+        all_results = results + failed_film_ids
+        total_time = time.time() - start_time
+
+        logger.info(
+            f"Preview for job {job_id}: {len(pending)} rendered, "
+            f"{len(film_jobs) - len(pending)} cached in {total_time:.2f}s"
+        )
+
         return jsonify({
-            'error': 'Processing failed',
+            'job_id': job_id,
+            'preview_size': preview_size,
+            'total': len(film_ids),
+            'success': len([r for r in all_results if r.get('status') == 'success']),
+            'failed': len([r for r in all_results if r.get('status') == 'failed']),
+            'results': all_results,
+            'processing_time': round(total_time, 3),
+            'shared_processing_time': round(shared_time, 3),
+            'shared_stages': {
+                stage: round(elapsed, 3) for stage, elapsed in shared_stages.items()
+            }
+        }), 200
+
+    except Exception as e:
+        logger.error(f"Unexpected error in preview_images: {e}", exc_info=True)
+        return jsonify({
+            'error': 'Preview failed',
             'message': str(e)
         }), 500
 
 
+def _preview_filename(
+    image: str,
+    job: Dict[str, Any],
+    preview_size: int,
+    encoder: Dict[str, Any]
+) -> str:
+    """
+    미리보기 파일명 생성 (레시피·인코더·크기 해시 포함)
+
+    Args:
+        image (str): 원본 파일명 (확장자 제외)
+        job (Dict[str, Any]): 필름 렌더링 작업 (film_slug, recipe)
+        preview_size (int): 미리보기 크기 (px)
+        encoder (Dict[str, Any]): ImageEncoder.resolve() 설정
+
+    Returns:
+        str: 미리보기 파일명
+    """
+    key = json.dumps([job['recipe'], preview_size, encoder], sort_keys=True, default=str)
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:10]
+    return (
+        f"{image}_{job['film_slug']}_{preview_size}_{digest}"
+        f"{ImageEncoder.extension(encoder)}"
+    )
+
+
+@bp.route('/preview/<job_id>/<filename>', methods=['GET'])
+def get_preview(job_id: str, filename: str) -> Tuple[Response, int]:
+    """
+    미리보기 이미지 조회 (inline)
+
+    Args:
+        job_id (str): Job ID
+        filename (str): 미리보기 파일명
+
+    Returns:
+        File: 미리보기 이미지
+    """
+    if not job_id or len(job_id) != 12 or '/' in job_id or '..' in job_id:
+        return jsonify({'error': 'Invalid job_id'}), 400
+
+    mimetype = OUTPUT_MIMETYPES.get(Path(filename).suffix.lower())
+
+    if not filename or '..' in filename or '/' in filename or '\\' in filename \
+            or mimetype is None:
+        logger.warning(f"Invalid preview filename requested: {filename}")
+        return jsonify({'error': 'Invalid filename'}), 400
+
+    file_path = Config.UPLOAD_FOLDER / job_id / 'preview' / filename
+
+    if not file_path.is_file():
+        return jsonify({'error': 'File not found'}), 404
+
+    # 파일명에 레시피 해시가 포함되어 내용이 바뀌지 않으므로 장기 캐싱
+    return send_file(str(file_path), mimetype=mimetype, max_age=86400)
+
+
 @bp.route('/download/<job_id>/<filename>', methods=['GET'])
 def download_file(job_id: str, filename: str) -> Tuple[Response, int]:
     """
@@ -283,11 +991,7 @@ def download_file(job_id: str, filename: str) -> Tuple[Response, int]:
 
         # MIME type 결정
         ext = file_path.suffix.lower()
-        mimetype = {
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png'
-        }.get(ext, 'application/octet-stream')
+        mimetype = OUTPUT_MIMETYPES.get(ext, 'application/octet-stream')
 
         logger.info(f"Downloading file: {filename} for job {job_id}")
 
@@ -306,10 +1010,54 @@ def download_file(job_id: str, filename: str) -> Tuple[Response, int]:
         }), 500
 
 
+def _list_processed_files(processed_folder: Path) -> List[Path]:
+    """
+    처리된 출력 이미지 목록 (파일명 순)
+
+    Args:
+        processed_folder (Path): processed 폴더
+
+    Returns:
+        List[Path]: 출력 이미지 파일 목록
+    """
+    return sorted(
+        f for f in processed_folder.iterdir()
+        if f.is_file() and f.suffix.lower() in OUTPUT_MIMETYPES
+    )
+
+
+def _write_job_archive(job_folder: Path) -> None:
+    """
+    처리된 이미지 전체를 무압축 ZIP으로 Job 폴더에 저장
+
+    Args:
+        job_folder (Path): Job 폴더
+    """
+    archive_path = job_folder / ARCHIVE_FILENAME
+
+    try:
+        image_files = _list_processed_files(job_folder / 'processed')
+        if not image_files:
+            return
+
+        archive_start = time.time()
+        size = StoredZipStream(image_files).write_to(archive_path)
+        logger.info(
+            f"Archive written for job {job_folder.name}: {len(image_files)} file(s), "
+            f"{size / 1024 / 1024:.1f}MB in {time.time() - archive_start:.2f}s"
+        )
+    except Exception as e:
+        logger.error(f"Failed to write archive for job {job_folder.name}: {e}", exc_info=True)
+
+
 def download_zip(job_id: str) -> Tuple[Response, int]:
     """
     선택한 필름들을 ZIP으로 묶어 다운로드
 
+    렌더링 완료 시 저장된 아카이브가 최신이면 디스크에서 그대로 전송하고,
+    그렇지 않으면 무압축(ZIP_STORED) ZIP을 생성하면서 바로 스트리밍한다.
+    스트리밍 시 아카이브 크기를 미리 계산해 Content-Length를 설정한다.
+
     Args:
         job_id (str): Job ID
 
@@ -321,7 +1069,8 @@ def download_zip(job_id: str) -> Tuple[Response, int]:
         if not job_id or len(job_id) != 12:
             return jsonify({'error': 'Invalid job_id'}), 400
 
-        processed_folder = Config.UPLOAD_FOLDER / job_id / 'processed'
+        job_folder = Config.UPLOAD_FOLDER / job_id
+        processed_folder = job_folder / 'processed'
 
         if not processed_folder.exists():
             logger.warning(f"Processed folder not found for job {job_id}")
@@ -332,51 +1081,41 @@ def download_zip(job_id: str) -> Tuple[Response, int]:
             return jsonify({'error': 'Invalid processed folder'}), 500
 
         # 처리된 모든 이미지 파일 찾기
-        image_files = list(processed_folder.glob('*.[jJ][pP][gG]')) + \
-                     list(processed_folder.glob('*.[jJ][pP][eE][gG]')) + \
-                     list(processed_folder.glob('*.[pP][nN][gG]'))
-
-        # 실제 파일인지 확인 (디렉토리 제외)
-        image_files = [f for f in image_files if f.is_file()]
+        image_files = _list_processed_files(processed_folder)
 
         if not image_files:
             logger.warning(f"No processed images found in {processed_folder}")
             return jsonify({'error': 'No images to download'}), 404
 
-        logger.info(f"Creating ZIP with {len(image_files)} file(s) for job {job_id}")
+        download_name = f'filmrecipe_{job_id}.zip'
+
+        # 저장된 아카이브가 모든 출력 파일보다 새로우면 그대로 전송
+        archive_path = job_folder / ARCHIVE_FILENAME
+        if archive_path.is_file():
+            newest = max(f.stat().st_mtime for f in image_files)
+            if archive_path.stat().st_mtime >= newest:
+                logger.info(f"Serving stored archive for job {job_id}")
+                return send_file(
+                    str(archive_path),
+                    mimetype='application/zip',
+                    as_attachment=True,
+                    download_name=download_name
+                )
 
-        # 메모리에 ZIP 파일 생성
-        zip_buffer = io.BytesIO()
+        logger.info(f"Streaming ZIP with {len(image_files)} file(s) for job {job_id}")
 
-        try:
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                for img_path in image_files:
-                    try:
-                        # ZIP 내부 파일명 (경로 없이 파일명만)
-                        arcname = img_path.name
-                        zip_file.write(str(img_path), arcname=arcname)
-                        logger.debug(f"Added to ZIP: {arcname}")
-                    except Exception as e:
-                        logger.error(f"Failed to add {img_path.name} to ZIP: {e}")
-                        # 일부 파일 실패해도 계속 진행
-
-            zip_buffer.seek(0)
-
-            logger.info(f"ZIP created successfully for job {job_id}")
-
-            return send_file(
-                zip_buffer,
-                mimetype='application/zip',
-                as_attachment=True,
-                download_name=f'filmrecipe_{job_id}.zip'
-            )
+        archive = StoredZipStream(image_files)
+        response = Response(
+            stream_with_context(iter(archive)),
+            mimetype='application/zip',
+            headers={'Content-Disposition': f'attachment; filename={download_name}'}
+        )
 
-        except zipfile.BadZipFile as e:
-            logger.error(f"ZIP file creation failed: {e}", exc_info=True)
-            return jsonify({
-                'error': 'ZIP creation failed',
-                'message': 'Invalid ZIP file'
-            }), 500
+        content_length = archive.content_length()
+        if content_length is not None:
+            response.content_length = content_length
+
+        return response
 
     except Exception as e:
         logger.error(f"Unexpected error in download_zip for job {job_id}: {e}", exc_info=True)
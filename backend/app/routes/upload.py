@@ -1,17 +1,23 @@
 """이미지 업로드 및 EXIF 분석 API"""
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Flask, current_app, request, jsonify
 from werkzeug.utils import secure_filename
 from werkzeug.datastructures import FileStorage
 from pathlib import Path
 from PIL import Image
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 import uuid
+import io
 import os
 import logging
+import threading
+import time
 
 from backend.config import Config
 from backend.app.services.exif_extractor import EXIFExtractor
 from backend.app.services.film_matcher import FilmMatcher
+from backend.app.services.job_queue import JobQueue
+from backend.app.services.upload_store import UploadStore
 
 bp = Blueprint('upload', __name__, url_prefix='/api')
 logger = logging.getLogger(__name__)
@@ -20,6 +26,13 @@ logger = logging.getLogger(__name__)
 MAX_FILES = 10
 MAX_FILE_SIZE = Config.MAX_CONTENT_LENGTH
 
+# 헤더만으로 검증하는 형식 (Pillow의 JPEG verify()는 데이터를 검사하지 않아 전체 검증과 같음)
+HEADER_ONLY_FORMATS = {'JPEG'}
+
+# 파일별 분석 스레드 풀 (첫 업로드 시 생성)
+_analysis_executor: Optional[ThreadPoolExecutor] = None
+_analysis_lock = threading.Lock()
+
 
 def allowed_file(filename: str) -> bool:
     """
@@ -57,6 +70,43 @@ def verify_image_file(filepath: Path) -> bool:
         return False
 
 
+def verify_image_header(header: bytes, complete: bool, filepath: Path) -> bool:
+    """
+    업로드 시 캡처한 파일 앞부분으로 이미지 검증 (가능하면 디스크 재읽기 없음)
+
+    header가 파일 전체이면 Image.verify()로 전체를 검증한다. 파일 일부만 있으면
+    JPEG은 헤더 파싱(형식, 크기)으로 검증하고, verify()가 데이터 무결성을
+    검사하는 형식(PNG의 청크 CRC 등)과 헤더만으로 열 수 없는 파일은
+    저장된 파일 전체로 검증한다 (verify_image_file).
+
+    Args:
+        header (bytes): 파일 앞부분 바이트
+        complete (bool): header가 파일 전체인지 여부
+        filepath (Path): 저장된 파일 경로 (전체 검증용)
+
+    Returns:
+        bool: 유효한 이미지 파일 여부
+    """
+    try:
+        with Image.open(io.BytesIO(header)) as img:
+            if complete:
+                img.verify()
+            elif img.format in HEADER_ONLY_FORMATS:
+                width, height = img.size
+                if width <= 0 or height <= 0:
+                    raise ValueError(f"Invalid image size: {img.size}")
+            else:
+                return verify_image_file(filepath)
+        return True
+    except Exception as e:
+        if complete:
+            logger.warning(f"Image verification failed for {filepath}: {e}")
+            return False
+
+        logger.debug(f"Header-only verification unavailable for {filepath.name}: {e}")
+        return verify_image_file(filepath)
+
+
 @bp.route('/upload', methods=['POST'])
 def upload_images():
     """
@@ -117,8 +167,8 @@ def upload_images():
         job_folder = Config.UPLOAD_FOLDER / job_id
         job_folder.mkdir(parents=True, exist_ok=True)
 
-        # 4. 각 이미지 처리
-        results = []
+        # 4. 각 이미지 처리 (파일별 분석은 스레드 풀에서 동시 실행, 결과는 업로드 순서 유지)
+        tasks = []
 
         for file in files:
             if not file or file.filename == '':
@@ -130,55 +180,14 @@ def upload_images():
             # 파일명 안전하게 처리
             original_filename = secure_filename(file.filename)
             filename = f"{uuid.uuid4().hex[:8]}_{original_filename}"
-            filepath = job_folder / filename
+            tasks.append((file, job_folder / filename, original_filename))
 
-            try:
-                # 파일 저장
-                file.save(str(filepath))
-
-                # 이미지 파일 검증 (보안 강화)
-                if not verify_image_file(filepath):
-                    logger.warning(f"Invalid image file uploaded: {original_filename}")
-                    filepath.unlink()  # 유효하지 않은 파일 삭제
-                    continue
-
-                # EXIF 추출
-                exif_data = EXIFExtractor.extract(str(filepath))
-                logger.info(
-                    f"EXIF extracted from {original_filename}: "
-                    f"ISO {exif_data.get('iso')}, "
-                    f"f/{exif_data.get('aperture')}"
-                )
-
-                # 필름 매칭 (상위 5개)
-                matched_films = FilmMatcher.match(exif_data, limit=5)
-                logger.info(
-                    f"Top matched film for {original_filename}: "
-                    f"{matched_films[0]['film_name']} "
-                    f"(score: {matched_films[0]['score']})"
-                    if matched_films else "No matches"
-                )
-
-                # 결과 추가
-                results.append({
-                    'filename': filename,
-                    'original_filename': original_filename,
-                    'exif': exif_data,
-                    'matched_films': matched_films
-                })
-
-            except Exception as e:
-                logger.error(
-                    f"Failed to process file {original_filename}: {e}",
-                    exc_info=True
-                )
-                # 에러 발생 시 저장된 파일 삭제
-                if filepath.exists():
-                    try:
-                        filepath.unlink()
-                    except Exception as unlink_error:
-                        logger.error(f"Failed to delete file {filepath}: {unlink_error}")
-                continue
+        app = current_app._get_current_object()
+        futures = [
+            _get_analysis_executor().submit(_analyze_upload, app, file, filepath, original_filename)
+            for file, filepath, original_filename in tasks
+        ]
+        results = [result for result in (future.result() for future in futures) if result is not None]
 
         if not results:
             # 저장된 파일이 없으면 에러
@@ -200,6 +209,132 @@ def upload_images():
         }), 500
 
 
+def _get_analysis_executor() -> ThreadPoolExecutor:
+    """
+    업로드 파일 분석 스레드 풀 반환 (없으면 생성)
+
+    풀은 gunicorn fork 이후 첫 업로드에서 프로세스마다 생성되며,
+    동시 요청 전체에서 분석 스레드 수를 UPLOAD_WORKERS로 제한한다.
+
+    Returns:
+        ThreadPoolExecutor: 분석 스레드 풀
+    """
+    global _analysis_executor
+
+    with _analysis_lock:
+        if _analysis_executor is None:
+            _analysis_executor = ThreadPoolExecutor(
+                max_workers=max(1, Config.UPLOAD_WORKERS),
+                thread_name_prefix='upload-analysis'
+            )
+        return _analysis_executor
+
+
+def _analyze_upload(
+    app: Flask,
+    file: FileStorage,
+    filepath: Path,
+    original_filename: str
+) -> Optional[Dict[str, Any]]:
+    """
+    업로드 파일 하나의 저장, 검증, EXIF 추출, 필름 매칭 (분석 스레드에서 실행)
+
+    실패한 파일은 저장된 파일을 삭제하고 None을 반환하므로
+    다른 파일 처리에 영향을 주지 않는다.
+
+    Args:
+        app (Flask): 애플리케이션 (DB 조회용 앱 컨텍스트)
+        file (FileStorage): 업로드 파일
+        filepath (Path): 저장 경로
+        original_filename (str): 안전하게 처리된 원본 파일명
+
+    Returns:
+        Optional[Dict[str, Any]]: 이미지 결과 (실패 시 None)
+    """
+    filename = filepath.name
+
+    try:
+        with app.app_context():
+            # 한 번의 읽기로 저장 + 해시 계산 + 헤더 캡처
+            stages = {}
+            stage_start = time.perf_counter()
+            ingested = UploadStore.ingest(file.stream, filepath)
+            digest = ingested['digest']
+            stages['ingest'] = time.perf_counter() - stage_start
+
+            # 이미 업로드된 내용이면 저장소 링크와 분석 결과 재사용
+            stage_start = time.perf_counter()
+            analysis = UploadStore.get_analysis(digest)
+            duplicate = analysis is not None and UploadStore.link_duplicate(digest, filepath)
+            stages['dedup'] = time.perf_counter() - stage_start
+
+            if duplicate:
+                exif_data = analysis['exif']
+                logger.info(f"Duplicate upload {original_filename} ({digest[:12]}), reusing analysis")
+            else:
+                # 이미지 파일 검증 (보안 강화, 캡처한 헤더 사용)
+                stage_start = time.perf_counter()
+                valid = verify_image_header(ingested['header'], ingested['complete'], filepath)
+                stages['verify'] = time.perf_counter() - stage_start
+
+                if not valid:
+                    logger.warning(f"Invalid image file uploaded: {original_filename}")
+                    filepath.unlink()  # 유효하지 않은 파일 삭제
+                    return None
+
+                # EXIF 추출 (캡처한 헤더의 APP1 세그먼트 사용)
+                stage_start = time.perf_counter()
+                exif_data = EXIFExtractor.extract_from_header(
+                    ingested['header'], str(filepath), complete=ingested['complete']
+                )
+                stages['exif'] = time.perf_counter() - stage_start
+                logger.info(
+                    f"EXIF extracted from {original_filename}: "
+                    f"ISO {exif_data.get('iso')}, "
+                    f"f/{exif_data.get('aperture')}"
+                )
+
+                # 검증된 원본과 분석 결과를 해시별로 저장
+                UploadStore.add(digest, filepath)
+                UploadStore.put_analysis(digest, {
+                    'exif': exif_data
+                })
+
+            # 필름 매칭 (상위 5개, 현재 레시피 카탈로그 기준이므로 중복 업로드도 매번 계산)
+            stage_start = time.perf_counter()
+            matched_films = FilmMatcher.match(exif_data, limit=5)
+            stages['match'] = time.perf_counter() - stage_start
+            logger.info(
+                f"Top matched film for {original_filename}: "
+                f"{matched_films[0]['film_name']} "
+                f"(score: {matched_films[0]['score']})"
+                if matched_films else "No matches"
+            )
+
+        return {
+            'filename': filename,
+            'original_filename': original_filename,
+            'content_hash': digest,
+            'duplicate': duplicate,
+            'exif': exif_data,
+            'matched_films': matched_films,
+            'stages': {stage: round(elapsed, 4) for stage, elapsed in stages.items()}
+        }
+
+    except Exception as e:
+        logger.error(
+            f"Failed to process file {original_filename}: {e}",
+            exc_info=True
+        )
+        # 에러 발생 시 저장된 파일 삭제
+        if filepath.exists():
+            try:
+                filepath.unlink()
+            except Exception as unlink_error:
+                logger.error(f"Failed to delete file {filepath}: {unlink_error}")
+        return None
+
+
 @bp.route('/jobs/<job_id>', methods=['GET'])
 def get_job_info(job_id: str):
     """
@@ -209,9 +344,16 @@ def get_job_info(job_id: str):
         job_id (str): Job ID
 
     Returns:
-        JSON: Job 폴더 내 파일 목록
+        JSON: Job 폴더 내 파일 목록 및 처리 상태
+            처리 요청이 있었던 Job은 필름별 상태(status, output_url, error)와
+            진행률(progress, done, total)을 함께 반환한다.
     """
     try:
+        if len(job_id) != 12 or '/' in job_id or '..' in job_id:
+            return jsonify({
+                'error': 'Invalid job_id format'
+            }), 400
+
         job_folder = Config.UPLOAD_FOLDER / job_id
 
         if not job_folder.exists():
@@ -229,15 +371,43 @@ def get_job_info(job_id: str):
         processed_files = []
 
         if processed_folder.exists():
-            processed_files = list(processed_folder.glob('*.[jJ][pP][gG]')) + \
-                            list(processed_folder.glob('*.[pP][nN][gG]'))
+            processed_files = [
+                f for f in processed_folder.iterdir()
+                if f.suffix.lower() in ('.jpg', '.jpeg', '.png', '.webp', '.avif')
+            ]
 
-        return jsonify({
+        response_data = {
             'job_id': job_id,
             'original_count': len(original_files),
             'processed_count': len(processed_files),
             'status': 'completed' if processed_files else 'uploaded'
-        }), 200
+        }
+
+        # 처리 작업 상태 (job.json)
+        job_state = JobQueue.read_state(job_folder)
+        if job_state is not None:
+            response_data.update({
+                'status': job_state['status'],
+                'progress': job_state.get('progress', 0.0),
+                'done': job_state.get('done', 0),
+                'total': job_state.get('total', 0),
+                'films': job_state.get('films', []),
+                'created_at': job_state.get('created_at'),
+                'started_at': job_state.get('started_at'),
+                'finished_at': job_state.get('finished_at'),
+            })
+
+            if job_state.get('error'):
+                response_data['error'] = job_state['error']
+
+            result = job_state.get('result')
+            if result:
+                response_data['zip_url'] = result.get('zip_url')
+                response_data['processing_time'] = result.get('processing_time')
+                if result.get('warning'):
+                    response_data['warning'] = result['warning']
+
+        return jsonify(response_data), 200
 
     except Exception as e:
         return jsonify({
@@ -0,0 +1,176 @@
+"""이미지 × 필름 일괄 렌더링 스케줄러 (메모리 예산 기반 동시 실행)"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, TypeVar
+import logging
+import threading
+
+from PIL import Image
+
+from backend.config import Config
+from backend.app.services.image_processor import ImageProcessor
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class BatchScheduler:
+    """
+    이미지 × 필름 작업 행렬을 이미지 단위 작업으로 실행하는 클래스
+
+    같은 이미지의 필름은 한 작업으로 묶어 디코딩한 버퍼를 모든 필름에 공유하고,
+    작업이 끝나면 (마지막 필름 렌더링 직후) 버퍼를 해제한다.
+    동시에 실행되는 이미지 작업은 스레드 수(BATCH_WORKERS)와 메모리 예산
+    (BATCH_MEMORY_BUDGET, 이미지별 추정치 = 디코딩 메가픽셀 × BATCH_BYTES_PER_MEGAPIXEL)으로
+    제한한다. 예산은 프로세스 전체에서 공유되므로 동시에 처리 중인 Job들이 함께 나눠 쓴다.
+
+    작업은 입력 순서대로 예산을 확보한 뒤 시작하며, 예산보다 큰 이미지는
+    실행 중인 작업이 없을 때 단독으로 실행한다.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _lock = threading.Lock()
+
+    # 실행 중인 작업의 추정 메모리 합계
+    _budget = threading.Condition()
+    _in_use = 0
+    _running = 0
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """
+        이미지 작업 스레드 풀 반환 (없으면 생성)
+
+        Returns:
+            ThreadPoolExecutor: 이미지 작업 스레드 풀
+        """
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=max(1, Config.BATCH_WORKERS),
+                    thread_name_prefix='batch-render'
+                )
+                logger.info(
+                    f"Batch scheduler started: {max(1, Config.BATCH_WORKERS)} worker thread(s), "
+                    f"memory budget {Config.BATCH_MEMORY_BUDGET / 1024 / 1024:.0f}MB"
+                )
+            return cls._executor
+
+    @staticmethod
+    def decoded_pixels(input_file: Path, full_resolution: bool = False) -> int:
+        """
+        디코딩 단계의 최대 픽셀 수 (헤더만 읽어 계산)
+
+        MAX_DIMENSION 축소 시 JPEG은 draft 모드로 축소 디코딩되지만,
+        다른 형식은 원본 크기로 디코딩한 뒤 리사이즈하므로 원본 픽셀 수를 사용한다.
+
+        Args:
+            input_file (Path): 입력 이미지 경로
+            full_resolution (bool): 원본 해상도 렌더링 여부
+
+        Returns:
+            int: 픽셀 수 (헤더를 읽을 수 없으면 MAX_DIMENSION² 기준)
+        """
+        try:
+            with Image.open(input_file) as img:
+                width, height = img.size
+                image_format = img.format
+        except Exception as e:
+            logger.debug(f"Failed to read image size of {input_file.name}: {e}")
+            return ImageProcessor.MAX_DIMENSION ** 2
+
+        limit = ImageProcessor.MAX_DIMENSION
+        if full_resolution or max(width, height) <= limit or image_format != 'JPEG':
+            return width * height
+
+        ratio = limit / max(width, height)
+        return int(width * ratio) * int(height * ratio)
+
+    @classmethod
+    def estimate_bytes(cls, input_file: Path, full_resolution: bool = False) -> int:
+        """
+        이미지 작업 하나의 추정 메모리 (bytes)
+
+        Args:
+            input_file (Path): 입력 이미지 경로
+            full_resolution (bool): 원본 해상도 렌더링 여부
+
+        Returns:
+            int: 디코딩 메가픽셀 × BATCH_BYTES_PER_MEGAPIXEL
+        """
+        pixels = cls.decoded_pixels(input_file, full_resolution)
+        return int(pixels / 1_000_000 * Config.BATCH_BYTES_PER_MEGAPIXEL)
+
+    @classmethod
+    def _acquire(cls, estimate: int) -> None:
+        """
+        메모리 예산 확보 (부족하면 실행 중인 작업이 끝날 때까지 대기)
+
+        Args:
+            estimate (int): 작업의 추정 메모리 (bytes)
+        """
+        budget = Config.BATCH_MEMORY_BUDGET
+
+        with cls._budget:
+            while budget > 0 and cls._running > 0 and cls._in_use + estimate > budget:
+                cls._budget.wait()
+            cls._in_use += estimate
+            cls._running += 1
+
+    @classmethod
+    def _release(cls, estimate: int) -> None:
+        """메모리 예산 반환"""
+        with cls._budget:
+            cls._in_use -= estimate
+            cls._running -= 1
+            cls._budget.notify_all()
+
+    @classmethod
+    def _run_task(cls, estimate: int, func: Callable[[], T]) -> T:
+        """작업 실행 후 예산 반환 (디코딩 버퍼는 func 반환 시 해제됨)"""
+        try:
+            return func()
+        finally:
+            cls._release(estimate)
+
+    @classmethod
+    def run(cls, tasks: List[Tuple[int, Callable[[], T]]]) -> List[T]:
+        """
+        이미지 작업 실행 (입력 순서대로 시작, 결과도 입력 순서)
+
+        호출 스레드는 다음 작업의 예산이 확보될 때까지 기다렸다가 스레드 풀에 제출한다.
+        작업이 하나면 호출 스레드에서 바로 실행한다.
+
+        Args:
+            tasks (List[Tuple[int, Callable[[], T]]]): (추정 메모리, 이미지 작업 함수) 목록
+
+        Returns:
+            List[T]: 작업별 반환값
+
+        Raises:
+            Exception: 작업 함수에서 발생한 예외 (다른 작업은 끝까지 실행됨)
+        """
+        if len(tasks) == 1:
+            estimate, func = tasks[0]
+            cls._acquire(estimate)
+            return [cls._run_task(estimate, func)]
+
+        executor = cls._get_executor()
+        futures: List[Future] = []
+
+        try:
+            for estimate, func in tasks:
+                cls._acquire(estimate)
+                try:
+                    futures.append(executor.submit(cls._run_task, estimate, func))
+                except Exception:
+                    cls._release(estimate)
+                    raise
+        finally:
+            # 제출한 작업은 모두 끝날 때까지 기다림 (예외 시에도 출력 파일 경합 방지)
+            for future in futures:
+                future.exception()
+
+        return [future.result() for future in futures]
+
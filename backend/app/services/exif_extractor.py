@@ -1,14 +1,25 @@
 """EXIF 메타데이터 추출 서비스"""
 import exifread
+import io
 import logging
 from typing import Dict, Optional
 from pathlib import Path
 
+from backend.app.services.exif_reader import Buffer, ExifHeaderReader
+
 logger = logging.getLogger(__name__)
 
 
 class EXIFExtractor:
-    """이미지 파일에서 EXIF 메타데이터를 추출하는 클래스"""
+    """
+    이미지 파일에서 EXIF 메타데이터를 추출하는 클래스
+
+    먼저 ExifHeaderReader로 파일 앞부분의 필요한 태그만 읽고,
+    지원하지 않는 형식이거나 앞부분만으로 부족하면 exifread로 전체를 해석한다.
+    """
+
+    # 경량 파서에 넘길 파일 앞부분 크기 (JPEG APP1 Exif 세그먼트는 최대 64KB)
+    FAST_READ_BYTES = 128 * 1024
 
     @staticmethod
     def extract(image_path: str) -> Dict:
@@ -33,24 +44,12 @@ class EXIFExtractor:
 
         try:
             with open(image_path, 'rb') as f:
-                tags = exifread.process_file(f, details=False)
+                tags = ExifHeaderReader.read_tags(f.read(EXIFExtractor.FAST_READ_BYTES))
+                if tags is None:
+                    tags = exifread.process_file(f, details=False)
                 logger.debug(f"EXIF tags extracted from {path.name}: {len(tags)} tags")
 
-            # 모든 EXIF 데이터 추출
-            exif_data = {
-                'iso': EXIFExtractor._extract_iso(tags),
-                'shutter_speed': EXIFExtractor._extract_shutter_speed(tags),
-                'aperture': EXIFExtractor._extract_aperture(tags),
-                'focal_length': EXIFExtractor._extract_focal_length(tags),
-                'white_balance': EXIFExtractor._extract_white_balance(tags),
-                'color_temperature': EXIFExtractor._extract_color_temperature(tags),
-                'camera_make': EXIFExtractor._extract_camera_make(tags),
-                'camera_model': EXIFExtractor._extract_camera_model(tags),
-                'lens_model': EXIFExtractor._extract_lens_model(tags),
-                'datetime': EXIFExtractor._extract_datetime(tags),
-            }
-
-            return exif_data
+            return EXIFExtractor._parse_tags(tags)
 
         except FileNotFoundError:
             logger.warning(f"파일을 찾을 수 없습니다: {image_path}")
@@ -59,6 +58,90 @@ class EXIFExtractor:
             logger.error(f"EXIF 추출 중 오류 발생: {str(e)}")
             return EXIFExtractor._default_exif()
 
+    @staticmethod
+    def extract_from_header(header: bytes, image_path: str, complete: bool = False) -> Dict:
+        """
+        업로드 시 캡처한 파일 앞부분에서 EXIF 데이터 추출
+
+        JPEG의 EXIF(APP1)는 항상 이미지 데이터 앞에 있으므로 헤더만으로 충분하다.
+        TIFF/PNG처럼 EXIF 위치가 파일 뒤쪽일 수 있는 형식은 헤더에서 찾지 못하면
+        (헤더가 파일 전체가 아닌 경우에만) 파일을 다시 읽는다.
+
+        Args:
+            header (bytes): 파일 앞부분 바이트
+            image_path (str): 이미지 파일 경로 (대체 경로)
+            complete (bool): header가 파일 전체인지 여부
+
+        Returns:
+            Dict: EXIF 데이터 딕셔너리
+        """
+        is_jpeg = header[:2] == b'\xff\xd8'
+
+        tags = ExifHeaderReader.read_tags(header)
+        if tags is None:
+            try:
+                tags = exifread.process_file(io.BytesIO(header), details=False)
+            except Exception as e:
+                logger.debug(f"EXIF header parse failed for {Path(image_path).name}: {e}")
+                tags = {}
+
+        if tags or complete or is_jpeg:
+            logger.debug(f"EXIF tags extracted from header of {Path(image_path).name}: {len(tags)} tags")
+            try:
+                return EXIFExtractor._parse_tags(tags)
+            except Exception as e:
+                logger.error(f"EXIF 추출 중 오류 발생: {str(e)}")
+                return EXIFExtractor._default_exif()
+
+        return EXIFExtractor.extract(image_path)
+
+    @staticmethod
+    def extract_from_bytes(data: Buffer) -> Dict:
+        """
+        메모리 버퍼(파일 전체 또는 EXIF를 포함한 앞부분)에서 EXIF 데이터 추출
+
+        파일로 저장하기 전의 업로드 데이터나 일괄 처리 도구가 보낸 헤더에 사용한다.
+
+        Args:
+            data (Buffer): 이미지 바이트 (bytes, bytearray, memoryview)
+
+        Returns:
+            Dict: EXIF 데이터 딕셔너리
+        """
+        try:
+            tags = ExifHeaderReader.read_tags(data)
+            if tags is None:
+                tags = exifread.process_file(io.BytesIO(bytes(data)), details=False)
+            return EXIFExtractor._parse_tags(tags)
+        except Exception as e:
+            logger.error(f"EXIF 추출 중 오류 발생: {str(e)}")
+            return EXIFExtractor._default_exif()
+
+    @staticmethod
+    def _parse_tags(tags) -> Dict:
+        """
+        exifread 태그에서 필요한 EXIF 항목 추출
+
+        Args:
+            tags: exifread.process_file 또는 ExifHeaderReader.read_tags 결과
+
+        Returns:
+            Dict: EXIF 데이터 딕셔너리
+        """
+        # 모든 EXIF 데이터 추출
+        return {
+            'iso': EXIFExtractor._extract_iso(tags),
+            'shutter_speed': EXIFExtractor._extract_shutter_speed(tags),
+            'aperture': EXIFExtractor._extract_aperture(tags),
+            'focal_length': EXIFExtractor._extract_focal_length(tags),
+            'white_balance': EXIFExtractor._extract_white_balance(tags),
+            'color_temperature': EXIFExtractor._extract_color_temperature(tags),
+            'camera_make': EXIFExtractor._extract_camera_make(tags),
+            'camera_model': EXIFExtractor._extract_camera_model(tags),
+            'lens_model': EXIFExtractor._extract_lens_model(tags),
+            'datetime': EXIFExtractor._extract_datetime(tags),
+        }
+
     @staticmethod
     def _extract_iso(tags) -> int:
         """ISO 감도 추출"""
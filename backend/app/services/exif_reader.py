@@ -0,0 +1,280 @@
+"""필요한 EXIF 태그만 읽는 경량 파서 (JPEG APP1 / TIFF 헤더)"""
+from typing import Dict, Optional, Tuple, Union
+import struct
+
+from exifread.tags import EXIF_TAGS, FIELD_TYPES
+from exifread.utils import Ratio
+
+# 입력 버퍼 형식 (bytes, bytearray, memoryview)
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class ExifHeaderReader:
+    """
+    파일 앞부분 버퍼에서 EXIFExtractor가 쓰는 태그만 해석하는 클래스
+
+    exifread.process_file은 모든 IFD(썸네일, GPS, Interop 등)의 모든 항목을
+    해석하지만, 여기서는 IFD0과 EXIF 하위 IFD의 항목 표만 훑으면서
+    필요한 태그의 값만 읽는다. 결과는 exifread와 같은 키('Image Make',
+    'EXIF ExposureTime' 등)와 같은 문자열 표현(printable)을 가지므로
+    EXIFExtractor._parse_tags에 그대로 전달할 수 있다.
+
+    JPEG(APP1 Exif 세그먼트)와 TIFF만 지원하며, 필요한 데이터가 버퍼 밖에 있거나
+    구조가 손상된 경우 None을 반환한다 (호출자가 exifread로 대체).
+    """
+
+    # EXIFExtractor._parse_tags가 사용하는 태그 (IFD0, EXIF 하위 IFD)
+    IMAGE_TAGS = (0x010F, 0x0110, 0x0132)  # Make, Model, DateTime
+    EXIF_IFD_TAGS = (
+        0x8827,  # ISOSpeedRatings
+        0x829A,  # ExposureTime
+        0x829D,  # FNumber
+        0x9205,  # MaxApertureValue
+        0x920A,  # FocalLength
+        0xA403,  # WhiteBalance
+        0x9208,  # LightSource
+        0xA434,  # LensModel
+        0x9003,  # DateTimeOriginal
+    )
+    EXIF_OFFSET_TAG = 0x8769
+
+    # exifread와 같은 규칙: 이 개수 이상인 숫자 태그는 값을 읽지 않음
+    MAX_VALUE_COUNT = 1000
+
+    # JPEG 마커
+    SOI = b'\xff\xd8'
+    APP1 = 0xE1
+    SOS = 0xDA
+    EOI = 0xD9
+
+    class _Truncated(Exception):
+        """필요한 데이터가 버퍼 밖에 있음"""
+
+    @classmethod
+    def read_tags(cls, data: Buffer) -> Optional[Dict[str, str]]:
+        """
+        버퍼에서 필요한 EXIF 태그 추출
+
+        Args:
+            data (Buffer): 파일 앞부분 (또는 전체) 바이트
+
+        Returns:
+            Optional[Dict[str, str]]: exifread 형식 키 → printable 문자열
+                (EXIF가 없으면 빈 딕셔너리, 지원하지 않는 형식이거나 버퍼가 부족하면 None)
+        """
+        view = memoryview(data).cast('B')
+        magic = bytes(view[:4])
+
+        try:
+            if magic[:2] == cls.SOI:
+                tiff = cls._find_jpeg_tiff(view)
+                if tiff is None:
+                    return {}
+            elif magic in (b'II*\x00', b'MM\x00*'):
+                tiff = view
+            else:
+                return None
+
+            return cls._read_tiff(tiff)
+        except (cls._Truncated, struct.error, IndexError):
+            return None
+
+    @classmethod
+    def _find_jpeg_tiff(cls, data: memoryview) -> Optional[memoryview]:
+        """
+        JPEG 세그먼트를 따라가며 첫 APP1 Exif 세그먼트의 TIFF 블록 찾기
+
+        Returns:
+            Optional[memoryview]: TIFF 헤더부터의 데이터 (Exif가 없으면 None)
+
+        Raises:
+            _Truncated: 세그먼트가 버퍼 밖으로 이어짐
+        """
+        pos = 2
+        size = len(data)
+
+        while True:
+            if pos + 4 > size:
+                raise cls._Truncated()
+            if data[pos] != 0xFF:
+                return None
+
+            marker = data[pos + 1]
+            if marker == 0xFF:
+                # 채움 바이트
+                pos += 1
+                continue
+            if marker in (cls.SOS, cls.EOI):
+                # 이미지 데이터 시작 - 이후에는 메타데이터 세그먼트가 없음
+                return None
+
+            length = (data[pos + 2] << 8) | data[pos + 3]
+            if marker == cls.APP1 and bytes(data[pos + 4:pos + 8]) == b'Exif':
+                end = pos + 2 + length
+                if end > size:
+                    raise cls._Truncated()
+                # APP1 페이로드: 'Exif\0\0' + TIFF 블록
+                return data[pos + 10:end]
+
+            pos += 2 + length
+
+    @classmethod
+    def _read_tiff(cls, tiff: memoryview) -> Dict[str, str]:
+        """
+        TIFF 블록의 IFD0과 EXIF 하위 IFD에서 필요한 태그 읽기
+
+        Args:
+            tiff (memoryview): TIFF 헤더부터의 데이터 (오프셋 기준점)
+
+        Returns:
+            Dict[str, str]: exifread 형식 키 → printable 문자열
+        """
+        if len(tiff) < 8:
+            raise cls._Truncated()
+
+        # exifread와 같이 첫 바이트가 'I'가 아니면 빅 엔디언으로 처리
+        endian = '<' if tiff[0] == ord('I') else '>'
+        tags: Dict[str, str] = {}
+
+        ifd0 = cls._unpack(tiff, endian + 'I', 4)
+        entries = cls._scan_ifd(tiff, endian, ifd0, cls.IMAGE_TAGS + (cls.EXIF_OFFSET_TAG,))
+
+        exif_offset = None
+        for tag, entry in entries.items():
+            _, values, printable = cls._read_entry(tiff, endian, tag, entry)
+            if tag == cls.EXIF_OFFSET_TAG:
+                exif_offset = values[0] if values else None
+            else:
+                tags['Image ' + EXIF_TAGS[tag][0]] = printable
+
+        if exif_offset:
+            entries = cls._scan_ifd(tiff, endian, exif_offset, cls.EXIF_IFD_TAGS)
+            for tag, entry in entries.items():
+                _, _, printable = cls._read_entry(tiff, endian, tag, entry)
+                tags['EXIF ' + EXIF_TAGS[tag][0]] = printable
+
+        return tags
+
+    @classmethod
+    def _scan_ifd(
+        cls,
+        tiff: memoryview,
+        endian: str,
+        offset: int,
+        wanted: Tuple[int, ...]
+    ) -> Dict[int, int]:
+        """
+        IFD 항목 표에서 원하는 태그의 항목 위치 찾기 (같은 태그가 여러 번 있으면 마지막 항목)
+
+        Returns:
+            Dict[int, int]: 태그 ID → 항목 오프셋 (알 수 없는 필드 형식은 제외)
+        """
+        count = cls._unpack(tiff, endian + 'H', offset)
+        if offset + 2 + 12 * count > len(tiff):
+            raise cls._Truncated()
+
+        found = {}
+        for i in range(count):
+            entry = offset + 2 + 12 * i
+            tag, field_type = struct.unpack_from(endian + 'HH', tiff, entry)
+            if tag in wanted and 0 < field_type < len(FIELD_TYPES):
+                found[tag] = entry
+
+        return found
+
+    @classmethod
+    def _read_entry(
+        cls,
+        tiff: memoryview,
+        endian: str,
+        tag: int,
+        entry: int
+    ) -> Tuple[int, object, str]:
+        """
+        IFD 항목 값 읽기 (exifread의 값/printable 변환 규칙과 동일)
+
+        Returns:
+            Tuple[int, object, str]: (필드 형식, 값 목록 또는 문자열, printable)
+        """
+        field_type, count = struct.unpack_from(endian + 'HI', tiff, entry + 2)
+        type_length = FIELD_TYPES[field_type][0]
+
+        # 4바이트 이하 값은 항목 안에 있고, 그보다 크면 항목에 오프셋이 있음
+        offset = entry + 8
+        if count * type_length > 4:
+            offset = cls._unpack(tiff, endian + 'I', offset)
+
+        if field_type == 2:
+            values = cls._read_ascii(tiff, offset, count)
+        else:
+            values = cls._read_values(tiff, endian, field_type, type_length, count, offset)
+
+        if count == 1 and field_type != 2:
+            printable = str(values[0])
+        elif count > 50 and len(values) > 20 and not isinstance(values, str):
+            printable = str(values[0:20])[0:-1] + ', ... ]'
+        else:
+            printable = str(values)
+
+        # 열거형 태그 (WhiteBalance, LightSource 등)는 이름으로 변환
+        tag_entry = EXIF_TAGS.get(tag)
+        if tag_entry and len(tag_entry) > 1 and isinstance(tag_entry[1], dict):
+            printable = ''.join(tag_entry[1].get(value, repr(value)) for value in values)
+
+        return field_type, values, printable
+
+    @classmethod
+    def _read_ascii(cls, tiff: memoryview, offset: int, count: int) -> Union[str, bytes]:
+        """ASCII 값 (첫 NUL 이후 버림, UTF-8로 해석 실패 시 bytes 유지)"""
+        if count == 0:
+            return ''
+        if offset + count > len(tiff):
+            raise cls._Truncated()
+
+        raw = bytes(tiff[offset:offset + count]).split(b'\x00', 1)[0]
+        try:
+            return raw.decode('utf-8')
+        except UnicodeDecodeError:
+            return raw
+
+    @classmethod
+    def _read_values(
+        cls,
+        tiff: memoryview,
+        endian: str,
+        field_type: int,
+        type_length: int,
+        count: int,
+        offset: int
+    ) -> list:
+        """숫자 값 목록 (유리수는 exifread Ratio, 실수는 exifread와 같이 1-튜플)"""
+        if count >= cls.MAX_VALUE_COUNT:
+            return []
+        if offset + count * type_length > len(tiff):
+            raise cls._Truncated()
+
+        signed = field_type in (6, 8, 9, 10)
+        values = []
+
+        for i in range(count):
+            position = offset + i * type_length
+            if field_type in (5, 10):
+                fmt = endian + ('ii' if signed else 'II')
+                values.append(Ratio(*struct.unpack_from(fmt, tiff, position)))
+            elif field_type in (11, 12):
+                fmt = endian + ('f' if field_type == 11 else 'd')
+                values.append(struct.unpack_from(fmt, tiff, position))
+            else:
+                fmt = endian + {1: 'B', 2: 'H', 4: 'I'}[type_length]
+                if signed:
+                    fmt = fmt.lower()
+                values.append(struct.unpack_from(fmt, tiff, position)[0])
+
+        return values
+
+    @classmethod
+    def _unpack(cls, tiff: memoryview, fmt: str, offset: int) -> int:
+        """오프셋 위치의 정수 하나 읽기 (버퍼 밖이면 _Truncated)"""
+        if offset + struct.calcsize(fmt) > len(tiff):
+            raise cls._Truncated()
+        return struct.unpack_from(fmt, tiff, offset)[0]
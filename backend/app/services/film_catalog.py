@@ -0,0 +1,159 @@
+"""필름 목록 API 응답 캐시 (필터 조합별 사전 직렬화 + 압축 본문)"""
+from typing import Dict, Optional, Tuple
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from sqlalchemy.orm import selectinload
+
+from backend.config import Config
+from backend.app.models.film import Film
+from backend.app.services.recipe_catalog import RecipeCatalog
+
+logger = logging.getLogger(__name__)
+
+# brotli는 설치된 경우에만 사용 (선택 의존성, 없으면 gzip만 제공)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class FilmsResponse:
+    """
+    필터 조합 하나의 /api/films 응답 본문 (인코딩별 바이트와 ETag)
+
+    ETag는 본문 해시로 만들기 때문에 같은 카탈로그라면 워커 프로세스가 달라도 같다.
+    인코딩마다 바이트가 다르므로 강한 ETag도 인코딩별로 구분한다.
+    """
+
+    __slots__ = ('bodies', 'etags')
+
+    def __init__(self, body: bytes):
+        """
+        Args:
+            body (bytes): 직렬화된 JSON 본문
+        """
+        digest = hashlib.sha256(body).hexdigest()[:32]
+
+        # 인코딩 → 본문 (None은 압축하지 않은 원본)
+        self.bodies: Dict[Optional[str], bytes] = {
+            None: body,
+            'gzip': gzip.compress(body, compresslevel=9, mtime=0),
+        }
+        if brotli is not None:
+            self.bodies['br'] = brotli.compress(body, quality=11)
+
+        self.etags: Dict[Optional[str], str] = {
+            encoding: digest if encoding is None else f'{digest}-{encoding}'
+            for encoding in self.bodies
+        }
+
+    def __setattr__(self, name: str, value) -> None:
+        # 생성자에서 한 번만 설정 (워커 스레드 간 공유)
+        if hasattr(self, name):
+            raise AttributeError(f"FilmsResponse is immutable: {name}")
+        object.__setattr__(self, name, value)
+
+
+class FilmCatalog:
+    """
+    필름 목록 응답을 (tier, type) 조합별로 미리 직렬화해 보관하는 클래스
+
+    필름과 레시피를 두 번의 쿼리(필름 + selectinload 레시피)로 한 번에 읽어
+    모든 필터 조합의 JSON 본문과 gzip/brotli 본문을 만든다.
+    (레시피의 film 역참조는 세션 identity map에서 바로 채워져 추가 쿼리가 없다)
+    변경 감지는 RecipeCatalog와 같은 기준(필름/레시피 개수, updated_at 최댓값)으로
+    CATALOG_CHECK_INTERVAL초마다 확인하며, invalidate()를 호출하면 즉시 다시 만든다.
+    """
+
+    TIERS = ('mvp', 'core', 'extended', 'archive', 'all')
+    TYPES = ('color', 'bw', 'all')
+
+    _responses: Optional[Dict[Tuple[str, str], FilmsResponse]] = None
+    _fingerprint: Optional[Tuple] = None
+    _checked_at = 0.0
+    _lock = threading.Lock()
+
+    @classmethod
+    def response(cls, tier: str, film_type: str) -> FilmsResponse:
+        """
+        필터 조합의 응답 반환 (없거나 카탈로그가 바뀌었으면 다시 생성, 앱 컨텍스트 필요)
+
+        Args:
+            tier (str): TIERS 중 하나
+            film_type (str): TYPES 중 하나
+
+        Returns:
+            FilmsResponse: 사전 직렬화된 응답
+        """
+        responses = cls._responses
+        now = time.monotonic()
+
+        if responses is not None and now - cls._checked_at < Config.CATALOG_CHECK_INTERVAL:
+            return responses[(tier, film_type)]
+
+        with cls._lock:
+            if cls._responses is None or now - cls._checked_at >= Config.CATALOG_CHECK_INTERVAL:
+                fingerprint = RecipeCatalog.fingerprint()
+                if cls._responses is None or fingerprint != cls._fingerprint:
+                    cls._responses = cls._build()
+                    cls._fingerprint = fingerprint
+                cls._checked_at = time.monotonic()
+
+            return cls._responses[(tier, film_type)]
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """캐시 폐기 (다음 조회 시 다시 생성)"""
+        with cls._lock:
+            cls._responses = None
+            cls._fingerprint = None
+            cls._checked_at = 0.0
+
+    @classmethod
+    def _build(cls) -> Dict[Tuple[str, str], FilmsResponse]:
+        """
+        필름 전체를 읽어 모든 필터 조합의 응답 생성
+
+        Returns:
+            Dict[Tuple[str, str], FilmsResponse]: (tier, type) → 응답
+        """
+        start = time.perf_counter()
+
+        # ISO 순 (같은 ISO는 ID 순으로 고정해 워커 간 ETag 일치)
+        films = (
+            Film.query
+            .options(selectinload(Film.recipes))
+            .order_by(Film.iso_base, Film.id)
+            .all()
+        )
+        films_data = [(film.tier, film.type, film.to_dict(include_recipes=True)) for film in films]
+
+        responses = {}
+        for tier in cls.TIERS:
+            for film_type in cls.TYPES:
+                selected = [
+                    data for film_tier, type_, data in films_data
+                    if (tier == 'all' or film_tier == tier)
+                    and (film_type == 'all' or type_ == film_type)
+                ]
+                # jsonify 기본 설정과 같은 형식 (키 정렬, ASCII 이스케이프, 공백 없음)
+                body = json.dumps({
+                    'count': len(selected),
+                    'films': selected,
+                    'filters': {
+                        'tier': tier,
+                        'type': film_type
+                    }
+                }, sort_keys=True, separators=(',', ':')).encode('utf-8') + b'\n'
+                responses[(tier, film_type)] = FilmsResponse(body)
+
+        logger.info(
+            f"Film list cache built: {len(films)} film(s), {len(responses)} filter combination(s) "
+            f"in {time.perf_counter() - start:.3f}s"
+        )
+        return responses
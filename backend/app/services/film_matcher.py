@@ -1,58 +1,83 @@
 """필름 매칭 알고리즘 서비스"""
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import logging
-from backend.app.models.film import Film
-from backend.app.models.recipe import FilmRecipe
+import threading
+
+import numpy as np
+
+from backend.config import Config
+from backend.app.services.match_table import MatchTable
+from backend.app.services.recipe_catalog import RecipeCatalog, RecipeColumns, RecipeEntry
 
 logger = logging.getLogger(__name__)
 
 
 class FilmMatcher:
-    """EXIF 데이터를 기반으로 최적의 필름을 매칭하는 클래스"""
+    """
+    EXIF 데이터를 기반으로 최적의 필름을 매칭하는 클래스
+
+    레시피는 RecipeCatalog의 프로세스별 스냅샷을 사용하므로
+    매칭 중에는 SQL을 실행하지 않는다. match()는 레시피별로 점수를 계산하는
+    기준 구현이며, match_many()는 같은 규칙을 EXIF × 레시피 행렬에 대한
+    NumPy 연산으로 계산해 여러 장을 한 번에 매칭한다 (결과는 동일).
+    MATCH_TABLE이 켜져 있으면 match()는 스냅샷마다 한 번 만든 MatchTable에서
+    결과를 조회하고, 격자 밖의 입력만 직접 계산한다.
+    """
+
+    # 화이트 밸런스 문자열 분류 (점수 규칙과 동일)
+    TUNGSTEN_WB = ('Tungsten', 'Manual')
+    DAYLIGHT_WB = ('Daylight', 'Auto', 'Flash', 'Fine Weather')
+
+    # 저조도 판단 셔터 속도 (1/60초 이상)
+    LOW_LIGHT_SHUTTER_THRESHOLD = 1.0 / 60.0
+
+    # 상위 후보 선택 시 여유폭 (반올림 후 동점이 될 수 있는 점수까지 포함)
+    TOP_K_MARGIN = 0.2
+
+    _table: Optional[MatchTable] = None
+    _table_lock = threading.Lock()
 
     @staticmethod
-    def match(exif_data: Dict, limit: int = 5) -> List[Dict]:
+    def match(exif_data: Dict, limit: int = 5, use_table: bool = True) -> List[Dict]:
         """
         EXIF 데이터를 기반으로 필름 매칭
 
         Args:
             exif_data (Dict): EXIF 메타데이터
             limit (int): 반환할 필름 개수 (기본 5개)
+            use_table (bool): 사전 계산 테이블 사용 여부 (False면 항상 직접 계산)
 
         Returns:
             List[Dict]: 매칭된 필름 목록 (점수 순 정렬)
         """
         try:
-            # 활성화된 레시피만 조회
-            recipes = FilmRecipe.query.filter_by(is_active=True).all()
+            # 활성화된 레시피 스냅샷 (필요할 때만 DB에서 다시 생성)
+            recipes = RecipeCatalog.entries()
 
             if not recipes:
                 logger.warning("No active film recipes found in database")
                 return []
 
             logger.debug(f"Found {len(recipes)} active recipes for matching")
+
+            table = FilmMatcher.match_table() if use_table and Config.MATCH_TABLE else None
         except Exception as e:
             logger.error(f"Database error while querying recipes: {e}", exc_info=True)
             return []
 
+        ranked = table.lookup(exif_data, limit) if table is not None else None
+        if ranked is not None:
+            return [
+                FilmMatcher._build_result(exif_data, recipe, score)
+                for recipe, score in ranked
+            ]
+
         results = []
 
         for recipe in recipes:
             # 각 레시피에 대해 점수 계산
             score = FilmMatcher._calculate_score(exif_data, recipe)
-
-            results.append({
-                'film_id': recipe.film_id,
-                'film_name': recipe.film.name,
-                'manufacturer': recipe.film.manufacturer,
-                'tier': recipe.film.tier,
-                'recipe_id': recipe.id,
-                'recipe_name': recipe.recipe_name,
-                'score': round(score, 1),
-                'reason': FilmMatcher._generate_reason(exif_data, recipe, score),
-                'iso_base': recipe.film.iso_base,
-                'type': recipe.film.type,
-            })
+            results.append(FilmMatcher._build_result(exif_data, recipe, score))
 
         # 점수 순으로 정렬 (높은 점수가 먼저)
         results.sort(key=lambda x: x['score'], reverse=True)
@@ -61,7 +86,232 @@ class FilmMatcher:
         return results[:limit]
 
     @staticmethod
-    def _calculate_score(exif_data: Dict, recipe: FilmRecipe) -> float:
+    def match_many(exif_list: List[Dict], limit: int = 5) -> List[List[Dict]]:
+        """
+        여러 EXIF 데이터를 한 번에 매칭 (벡터화된 점수 계산)
+
+        점수 항목을 EXIF × 레시피 행렬 연산으로 계산한 뒤 행마다 argpartition으로
+        상위 후보만 골라 정렬한다. 결과(점수, 순서, 이유)는 각 EXIF에 대해
+        match()를 호출한 것과 같다.
+
+        Args:
+            exif_list (List[Dict]): EXIF 메타데이터 목록
+            limit (int): EXIF별 반환할 필름 개수 (기본 5개)
+
+        Returns:
+            List[List[Dict]]: EXIF 순서대로 매칭된 필름 목록 (각각 점수 순 정렬)
+        """
+        if not exif_list:
+            return []
+
+        try:
+            recipes, columns = RecipeCatalog.columns()
+
+            if not recipes:
+                logger.warning("No active film recipes found in database")
+                return [[] for _ in exif_list]
+        except Exception as e:
+            logger.error(f"Database error while querying recipes: {e}", exc_info=True)
+            return [[] for _ in exif_list]
+
+        scores = FilmMatcher._calculate_score_matrix(exif_list, columns)
+
+        return [
+            [FilmMatcher._build_result(exif_data, recipes[index], score) for index, score in row]
+            for exif_data, row in zip(exif_list, FilmMatcher._rank(scores, limit))
+        ]
+
+    @staticmethod
+    def match_table() -> MatchTable:
+        """
+        현재 카탈로그 스냅샷의 사전 계산 테이블 (스냅샷이 바뀌면 다시 생성, 앱 컨텍스트 필요)
+
+        Returns:
+            MatchTable: 매칭 테이블
+        """
+        recipes, columns = RecipeCatalog.columns()
+        table = FilmMatcher._table
+
+        if table is None or table.entries is not recipes:
+            with FilmMatcher._table_lock:
+                table = FilmMatcher._table
+                if table is None or table.entries is not recipes:
+                    table = MatchTable(
+                        recipes, columns,
+                        FilmMatcher._calculate_score_matrix, FilmMatcher._rank,
+                        FilmMatcher.TUNGSTEN_WB, FilmMatcher.DAYLIGHT_WB
+                    )
+                    FilmMatcher._table = table
+
+        return table
+
+    @staticmethod
+    def _rank(scores: np.ndarray, limit: int) -> List[List[Tuple[int, float]]]:
+        """
+        점수 행렬의 행별 상위 레시피 선택 (match()의 정렬과 같은 순서)
+
+        Args:
+            scores (np.ndarray): (행 수, 레시피 수) 반올림 전 점수
+            limit (int): 행별 반환할 개수
+
+        Returns:
+            List[List[Tuple[int, float]]]: 행별 (레시피 인덱스, 반올림 전 점수) 목록
+        """
+        recipe_count = scores.shape[1]
+
+        # 상위 k개의 최저 점수 - 여유폭 이상인 레시피만 후보로 남김
+        # (반올림은 단조 증가이므로 후보 밖의 레시피는 상위 k개에 들 수 없음)
+        k = limit if 0 < limit < recipe_count else recipe_count
+        if k < recipe_count:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            kth = np.take_along_axis(scores, top, axis=1).min(axis=1)
+            candidates = scores >= (kth - FilmMatcher.TOP_K_MARGIN)[:, None]
+        else:
+            candidates = np.ones(scores.shape, dtype=bool)
+
+        ranked = []
+
+        for row, mask in zip(scores, candidates):
+            # 레시피 순서를 유지한 후보를 반올림 점수로 안정 정렬
+            indices = np.flatnonzero(mask).tolist()
+            row_scores = row[indices].tolist()
+            order = sorted(
+                range(len(indices)),
+                key=lambda i: round(row_scores[i], 1),
+                reverse=True
+            )[:limit]
+            ranked.append([(indices[i], row_scores[i]) for i in order])
+
+        return ranked
+
+    @staticmethod
+    def _build_result(exif_data: Dict, recipe: RecipeEntry, score: float) -> Dict:
+        """
+        매칭 결과 항목 생성
+
+        Args:
+            exif_data (Dict): EXIF 데이터
+            recipe (RecipeEntry): 필름 레시피
+            score (float): 매칭 점수 (반올림 전)
+
+        Returns:
+            Dict: 매칭 결과
+        """
+        return {
+            'film_id': recipe.film_id,
+            'film_name': recipe.film_name,
+            'manufacturer': recipe.manufacturer,
+            'tier': recipe.tier,
+            'recipe_id': recipe.recipe_id,
+            'recipe_name': recipe.recipe_name,
+            'score': round(score, 1),
+            'reason': FilmMatcher._generate_reason(exif_data, recipe, score),
+            'iso_base': recipe.iso_base,
+            'type': recipe.film_type,
+        }
+
+    @staticmethod
+    def _calculate_score_matrix(exif_list: List[Dict], columns: RecipeColumns) -> np.ndarray:
+        """
+        EXIF × 레시피 점수 행렬 계산 (_calculate_score와 같은 규칙, 같은 연산 순서)
+
+        Args:
+            exif_list (List[Dict]): EXIF 메타데이터 목록
+            columns (RecipeColumns): 레시피 열 배치
+
+        Returns:
+            np.ndarray: (EXIF 수, 레시피 수) float64 점수 (0 ~ 100, 반올림 전)
+        """
+        iso = np.array([e.get('iso', 200) for e in exif_list], dtype=np.float64)
+        aperture = np.array([e.get('aperture', 5.6) for e in exif_list], dtype=np.float64)
+        shutter = np.array([e.get('shutter_speed', 0.008) for e in exif_list], dtype=np.float64)
+        color_temp = np.array(
+            [e.get('color_temperature', 5500) for e in exif_list], dtype=np.float64
+        )
+        wb = [e.get('white_balance', 'Auto') for e in exif_list]
+        wb_tungsten = np.array([w in FilmMatcher.TUNGSTEN_WB for w in wb], dtype=bool)
+        wb_daylight = np.array([w in FilmMatcher.DAYLIGHT_WB for w in wb], dtype=bool)
+
+        # 텅스텐 조명 환경 (WB 점수와 저조도 보너스에서 공통 사용)
+        tungsten_light = wb_tungsten | (color_temp <= 3500)
+
+        # 1. ISO (행: EXIF, 열: 레시피)
+        iso_col = iso[:, None]
+        below = iso_col < columns.iso_min
+        in_range = (columns.iso_min <= iso_col) & (iso_col <= columns.iso_max)
+        diff = np.where(below, columns.iso_min - iso_col, iso_col - columns.iso_max)
+        penalty = (diff / columns.iso_divisor) * 50
+        iso_score = np.where(in_range, 100.0, np.maximum(0.0, 100.0 - penalty))
+
+        # 2. 색온도 (컬러 필름만, 흑백은 80점)
+        temp_col = color_temp[:, None]
+        tungsten_score = np.select(
+            [tungsten_light, color_temp <= 4000], [100.0, 90.0], 40.0
+        )[:, None]
+        daylight_score = np.where(
+            (wb_daylight | (color_temp >= 5000))[:, None], 100.0,
+            np.where(
+                temp_col >= 4500, 85.0,
+                np.maximum(40.0, 100.0 - (np.abs(temp_col - columns.film_temp) / 50))
+            )
+        )
+        wb_score = np.where(
+            columns.is_tungsten, tungsten_score,
+            np.where(columns.film_temp >= 5000, daylight_score, 75.0)
+        )
+        wb_score = np.where(columns.is_color, wb_score, 80.0)
+
+        # 3. 조리개 (규칙별 점수를 계산한 뒤 레시피 규칙으로 선택)
+        rule_scores = {
+            'default': np.full_like(aperture, 80.0),
+            'landscape': np.select([aperture >= 8.0, aperture >= 5.6], [100.0, 85.0], 65.0),
+            'portrait': np.select(
+                [aperture <= 2.8, aperture <= 4.0, aperture <= 5.6], [100.0, 90.0, 80.0], 65.0
+            ),
+            'versatile': np.where((2.8 <= aperture) & (aperture <= 8.0), 95.0, 75.0),
+            'landscape_fine': np.select([aperture >= 8.0, aperture >= 5.6], [100.0, 90.0], 75.0),
+            'neutral': np.where((4.0 <= aperture) & (aperture <= 8.0), 90.0, 80.0),
+            'consumer': np.full_like(aperture, 75.0),
+            'budget': np.full_like(aperture, 70.0),
+            'bw_fast': np.where(aperture <= 4.0, 90.0, 80.0),
+            'bw_classic': np.full_like(aperture, 78.0),
+        }
+        by_rule = np.stack([rule_scores[rule] for rule in RecipeColumns.APERTURE_RULES], axis=1)
+        aperture_score = by_rule[:, columns.aperture_rule]
+
+        # 4. 셔터 속도
+        shutter_score = np.where(
+            (shutter >= 0.1)[:, None],
+            np.where(columns.has_reciprocity, 100.0, 70.0),
+            np.where(
+                (shutter <= 0.001)[:, None],
+                np.where(columns.iso_base >= 400, 100.0, 75.0),
+                85.0
+            )
+        )
+
+        # 5. 저조도 보너스
+        is_low_light = (iso >= 800) | (shutter >= FilmMatcher.LOW_LIGHT_SHUTTER_THRESHOLD)
+        bonus_scores = {
+            None: np.zeros_like(iso),
+            'tungsten': np.where(tungsten_light, 15.0, 10.0),
+            'portra_400': np.full_like(iso, 8.0),
+            'slow': np.full_like(iso, -5.0),
+        }
+        by_bonus = np.stack([bonus_scores[rule] for rule in RecipeColumns.LOW_LIGHT_RULES], axis=1)
+        low_light_bonus = np.where(is_low_light[:, None], by_bonus[:, columns.low_light_rule], 0.0)
+
+        # 가중 합산 (스칼라 경로와 같은 순서로 더해야 부동소수점 결과가 같음)
+        score = iso_score * 0.5
+        score = score + wb_score * 0.2
+        score = score + aperture_score * 0.15
+        score = score + shutter_score * 0.15
+        score = score + low_light_bonus
+
+        return np.minimum(100.0, np.maximum(0.0, score))
+
+    @staticmethod
+    def _calculate_score(exif_data: Dict, recipe: RecipeEntry) -> float:
         """
         EXIF 데이터와 필름 레시피를 비교하여 매칭 점수 계산
 
@@ -81,7 +331,7 @@ class FilmMatcher:
         score += iso_score * 0.5
 
         # 2. 색온도 매칭 (20% 가중치 - 컬러 필름만)
-        if recipe.film.type == 'color':
+        if recipe.is_color:
             wb_score = FilmMatcher._calculate_wb_score(exif_data, recipe)
             score += wb_score * 0.2
         else:
@@ -104,20 +354,20 @@ class FilmMatcher:
         return min(100.0, max(0.0, score))
 
     @staticmethod
-    def _calculate_iso_score(exif_iso: int, recipe: FilmRecipe) -> float:
+    def _calculate_iso_score(exif_iso: int, recipe: RecipeEntry) -> float:
         """
         ISO 점수 계산 (0~100)
 
         Args:
             exif_iso (int): 촬영 ISO
-            recipe (FilmRecipe): 필름 레시피
+            recipe (RecipeEntry): 필름 레시피
 
         Returns:
             float: ISO 매칭 점수
         """
-        iso_min = recipe.iso_min or recipe.film.iso_base
-        iso_max = recipe.iso_max or recipe.film.iso_base
-        iso_base = recipe.film.iso_base or 100  # Division by zero 방지
+        iso_min = recipe.iso_min
+        iso_max = recipe.iso_max
+        iso_base = recipe.iso_divisor
 
         # ISO 범위 내에 있으면 100점
         if iso_min <= exif_iso <= iso_max:
@@ -137,23 +387,23 @@ class FilmMatcher:
             return max(0.0, 100.0 - penalty)
 
     @staticmethod
-    def _calculate_wb_score(exif_data: Dict, recipe: FilmRecipe) -> float:
+    def _calculate_wb_score(exif_data: Dict, recipe: RecipeEntry) -> float:
         """
         화이트 밸런스/색온도 점수 계산 (0~100)
 
         Args:
             exif_data (Dict): EXIF 데이터
-            recipe (FilmRecipe): 필름 레시피
+            recipe (RecipeEntry): 필름 레시피
 
         Returns:
             float: WB 매칭 점수
         """
         wb = exif_data.get('white_balance', 'Auto')
         color_temp = exif_data.get('color_temperature', 5500)
-        film_temp = recipe.color_temperature or 5500
+        film_temp = recipe.film_temp
 
         # Vision3 500T: 텅스텐 필름 특화
-        if 'Vision3' in recipe.film.name and '500T' in recipe.film.name:
+        if recipe.is_tungsten:
             if wb in ['Tungsten', 'Manual'] or color_temp <= 3500:
                 # 명시적 텅스텐 환경
                 return 100.0
@@ -179,7 +429,7 @@ class FilmMatcher:
         return 75.0
 
     @staticmethod
-    def _calculate_aperture_score(exif_data: Dict, recipe: FilmRecipe) -> float:
+    def _calculate_aperture_score(exif_data: Dict, recipe: RecipeEntry) -> float:
         """
         조리개 점수 계산 (0~100)
 
@@ -189,16 +439,16 @@ class FilmMatcher:
 
         Args:
             exif_data (Dict): EXIF 데이터
-            recipe (FilmRecipe): 필름 레시피
+            recipe (RecipeEntry): 필름 레시피
 
         Returns:
             float: 조리개 매칭 점수
         """
         aperture = exif_data.get('aperture', 5.6)
-        matching_reason = recipe.matching_reason or ''
+        rule = recipe.aperture_rule
 
         # Velvia: 풍경 필름 (큰 조리개 선호)
-        if 'Velvia' in recipe.film.name:
+        if rule == 'landscape':
             if aperture >= 8.0:
                 return 100.0  # f/8 이상 → 심도 깊음 (풍경)
             elif aperture >= 5.6:
@@ -207,7 +457,7 @@ class FilmMatcher:
                 return 65.0
 
         # Portra: 인물 필름 (작은 조리개 선호)
-        if 'Portra' in recipe.film.name:
+        if rule == 'portrait':
             if aperture <= 2.8:
                 return 100.0  # f/2.8 이하 → 얕은 심도 (인물)
             elif aperture <= 4.0:
@@ -218,14 +468,14 @@ class FilmMatcher:
                 return 65.0
 
         # Provia: 만능형
-        if 'Provia' in recipe.film.name:
+        if rule == 'versatile':
             if 2.8 <= aperture <= 8.0:
                 return 95.0  # 중간 범위
             else:
                 return 75.0
 
         # Ektar: 풍경 특화, 최고 입자
-        if 'Ektar' in recipe.film.name:
+        if rule == 'landscape_fine':
             if aperture >= 8.0:
                 return 100.0  # 풍경 촬영 (큰 조리개)
             elif aperture >= 5.6:
@@ -234,42 +484,42 @@ class FilmMatcher:
                 return 75.0
 
         # Ektachrome: 중립적 리버설
-        if 'Ektachrome' in recipe.film.name:
+        if rule == 'neutral':
             if 4.0 <= aperture <= 8.0:
                 return 90.0  # 중간 범위
             else:
                 return 80.0
 
         # Gold/UltraMax: 소비자용, 웜톤
-        if 'Gold' in recipe.film.name or 'UltraMax' in recipe.film.name:
+        if rule == 'consumer':
             return 75.0  # 기본 점수
 
         # ProImage: 저가형
-        if 'ProImage' in recipe.film.name:
+        if rule == 'budget':
             return 70.0  # 기본 점수 낮음
 
         # T-Max 400: 고감도 흑백
-        if 'T-Max 400' in recipe.film.name:
+        if rule == 'bw_fast':
             if aperture <= 4.0:
                 return 90.0  # 저조도/액션
             else:
                 return 80.0
 
         # Rollei RPX: 전통 흑백
-        if 'Rollei' in recipe.film.name or 'RPX' in recipe.film.name:
+        if rule == 'bw_classic':
             return 78.0  # 중간 점수
 
         # 기타 필름: 중립적 점수
         return 80.0
 
     @staticmethod
-    def _calculate_shutter_score(exif_data: Dict, recipe: FilmRecipe) -> float:
+    def _calculate_shutter_score(exif_data: Dict, recipe: RecipeEntry) -> float:
         """
         셔터 속도 점수 계산 (0~100)
 
         Args:
             exif_data (Dict): EXIF 데이터
-            recipe (FilmRecipe): 필름 레시피
+            recipe (RecipeEntry): 필름 레시피
 
         Returns:
             float: 셔터 속도 매칭 점수
@@ -279,7 +529,7 @@ class FilmMatcher:
         # 장노출 (1/10s 이상, >= 0.1초)
         if shutter_speed >= 0.1:
             # 상반칙 불궤 데이터가 있으면 유리
-            if recipe.reciprocity_failure:
+            if recipe.has_reciprocity:
                 return 100.0
             else:
                 return 70.0
@@ -287,7 +537,7 @@ class FilmMatcher:
         # 초고속 셔터 (1/1000s 이하, <= 0.001초)
         elif shutter_speed <= 0.001:
             # 고감도 필름에 유리
-            if recipe.film.iso_base >= 400:
+            if recipe.iso_base >= 400:
                 return 100.0
             else:
                 return 75.0
@@ -297,7 +547,7 @@ class FilmMatcher:
             return 85.0
 
     @staticmethod
-    def _calculate_low_light_bonus(exif_data: Dict, recipe: FilmRecipe) -> float:
+    def _calculate_low_light_bonus(exif_data: Dict, recipe: RecipeEntry) -> float:
         """
         저조도 환경 보너스 점수 계산
 
@@ -314,7 +564,7 @@ class FilmMatcher:
 
         Args:
             exif_data (Dict): EXIF 데이터
-            recipe (FilmRecipe): 필름 레시피
+            recipe (RecipeEntry): 필름 레시피
 
         Returns:
             float: 보너스 점수
@@ -331,8 +581,10 @@ class FilmMatcher:
         if not is_low_light:
             return 0.0
 
+        rule = recipe.low_light_rule
+
         # Vision3 500T: 저조도 특화 필름
-        if 'Vision3' in recipe.film.name and '500T' in recipe.film.name:
+        if rule == 'tungsten':
             # 텅스텐 조명 환경
             if wb in ['Tungsten', 'Manual'] or color_temp <= 3500:
                 return 15.0  # 최대 보너스
@@ -340,23 +592,23 @@ class FilmMatcher:
                 return 10.0  # 일반 저조도
 
         # Portra 400: 저조도 대응 가능
-        if 'Portra' in recipe.film.name and recipe.film.iso_base == 400:
+        if rule == 'portra_400':
             return 8.0
 
         # 저감도 필름: 저조도에서 불리
-        if recipe.film.iso_base < 200:
+        if rule == 'slow':
             return -5.0  # 패널티
 
         return 0.0
 
     @staticmethod
-    def _generate_reason(exif_data: Dict, recipe: FilmRecipe, score: float) -> str:
+    def _generate_reason(exif_data: Dict, recipe: RecipeEntry, score: float) -> str:
         """
         매칭 이유 생성
 
         Args:
             exif_data (Dict): EXIF 데이터
-            recipe (FilmRecipe): 필름 레시피
+            recipe (RecipeEntry): 필름 레시피
             score (float): 매칭 점수
 
         Returns:
@@ -0,0 +1,115 @@
+"""필름 프로파일 (사전 계산된 톤 LUT)"""
+import cv2
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class FilmProfile:
+    """
+    필름 레시피의 그레인 이전 단계를 채널별 8-bit LUT로 컴파일한 프로파일
+
+    컬러 필름은 Gamma Decode → 톤 커브 → 게인까지 모든 단계가 채널별
+    점 연산이므로 채널당 256개 항목 테이블 하나로 합쳐진다.
+    흑백 필름은 Gamma Decode와 RGB 가중치를 테이블로 합친 뒤
+    채널 합산과 톤 커브만 이미지 단위로 계산한다.
+    """
+
+    def __init__(
+        self,
+        luts: np.ndarray,
+        gray_tone: Optional[Callable[[np.ndarray], np.ndarray]] = None
+    ):
+        """
+        Args:
+            luts (np.ndarray): 채널별 테이블 (256, 3) float32
+            gray_tone (Optional[Callable]): 흑백 톤 커브 함수.
+                지정 시 흑백 프로파일로 동작 (테이블은 가중치가 반영된 Linear 값)
+        """
+        self.luts = np.ascontiguousarray(luts, dtype=np.float32)
+        self.luts.setflags(write=False)
+        self.gray_tone = gray_tone
+
+        # cv2.LUT용 (256, 1, 3) 배치
+        self._cv_lut = self.luts.reshape(256, 1, 3)
+
+    def apply(self, img: np.ndarray) -> np.ndarray:
+        """
+        uint8 sRGB 이미지에 프로파일 적용
+
+        Args:
+            img (np.ndarray): sRGB 이미지 (uint8, H×W×3)
+
+        Returns:
+            np.ndarray: 그레인 적용 전 Linear RGB 이미지 (float32, 0~1)
+        """
+        mapped = cv2.LUT(np.ascontiguousarray(img), self._cv_lut)
+
+        if self.gray_tone is None:
+            return mapped
+
+        # 흑백: 가중치가 반영된 채널 합산 후 톤 커브
+        gray = mapped[:, :, 0] + mapped[:, :, 1] + mapped[:, :, 2]
+
+        return np.stack([self.gray_tone(gray)] * 3, axis=-1)
+
+    @property
+    def is_bw(self) -> bool:
+        """흑백 프로파일 여부"""
+        return self.gray_tone is not None
+
+    @staticmethod
+    def parse_tone_curve(tone_curve: Optional[Dict]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        FilmRecipe.tone_curve_data를 채널별 제어점으로 변환
+
+        형식: {"rgb": [[x, y], ...], "r": [[x, y], ...], ...}
+        x, y는 Linear RGB 값 (0~1). 채널별 키가 "rgb"보다 우선한다.
+
+        Args:
+            tone_curve (Optional[Dict]): 톤 커브 데이터
+
+        Returns:
+            Dict[str, Tuple[np.ndarray, np.ndarray]]: 채널 키별 (x, y) 배열
+        """
+        curves = {}
+
+        if not tone_curve or not isinstance(tone_curve, dict):
+            return curves
+
+        for key in ('rgb', 'r', 'g', 'b'):
+            points = tone_curve.get(key)
+            if not points:
+                continue
+
+            try:
+                points = sorted((float(x), float(y)) for x, y in points)
+            except (TypeError, ValueError):
+                logger.warning(f"Invalid tone curve points for channel '{key}', ignoring")
+                continue
+
+            if len(points) < 2:
+                continue
+
+            xs = np.array([p[0] for p in points], dtype=np.float64)
+            ys = np.clip(np.array([p[1] for p in points], dtype=np.float64), 0, 1)
+            curves[key] = (xs, ys)
+
+        return curves
+
+    @staticmethod
+    def channel_curves(
+        curves: Dict[str, Tuple[np.ndarray, np.ndarray]]
+    ) -> List[Optional[Tuple[np.ndarray, np.ndarray]]]:
+        """
+        R, G, B 순서의 채널별 커브 목록 반환 (없으면 None)
+
+        Args:
+            curves (Dict): parse_tone_curve 결과
+
+        Returns:
+            List[Optional[Tuple[np.ndarray, np.ndarray]]]: 채널별 커브
+        """
+        return [curves.get(channel, curves.get('rgb')) for channel in ('r', 'g', 'b')]
@@ -0,0 +1,203 @@
+"""출력 이미지 인코더 (형식/품질 프로파일)"""
+from PIL import Image
+from typing import Any, Dict, Optional
+from pathlib import Path
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# AVIF는 pillow-avif-plugin 설치 시에만 지원 (선택 의존성)
+try:
+    import pillow_avif  # noqa: F401
+except ImportError:
+    pass
+
+
+class ImageEncoder:
+    """
+    렌더링 결과를 요청 옵션에 맞는 형식으로 저장하는 클래스
+
+    인코더 설정은 프로파일('fast', 'balanced', 'max')을 기본값으로 하고
+    요청 옵션(output_format, output_quality, subsampling, progressive, optimize)으로
+    개별 항목을 덮어쓴다. resolve()로 한 번 검증한 설정 딕셔너리는
+    피클링 가능하므로 렌더링 워커 프로세스에 그대로 전달할 수 있다.
+    """
+
+    # 형식별 (PIL 형식 이름, 확장자, MIME type)
+    FORMATS = {
+        'jpeg': ('JPEG', '.jpg', 'image/jpeg'),
+        'webp': ('WEBP', '.webp', 'image/webp'),
+        'avif': ('AVIF', '.avif', 'image/avif'),
+        'png': ('PNG', '.png', 'image/png'),
+    }
+
+    # 프로파일
+    # - 'fast': 미리보기용 (Huffman 최적화 생략, 4:2:0)
+    # - 'balanced': 품질 90, 4:2:0, 최적화 생략
+    # - 'max': 최종 다운로드용 (기존 출력과 동일: 품질 95, 4:4:4, Huffman 최적화)
+    PROFILES = {
+        'fast': {
+            'format': 'jpeg', 'quality': 80, 'subsampling': '4:2:0',
+            'progressive': False, 'optimize': False,
+        },
+        'balanced': {
+            'format': 'jpeg', 'quality': 90, 'subsampling': '4:2:0',
+            'progressive': False, 'optimize': False,
+        },
+        'max': {
+            'format': 'jpeg', 'quality': 95, 'subsampling': '4:4:4',
+            'progressive': False, 'optimize': True,
+        },
+    }
+    DEFAULT_PROFILE = 'max'
+
+    SUBSAMPLING = {'4:4:4': 0, '4:2:2': 1, '4:2:0': 2}
+
+    @classmethod
+    def resolve(
+        cls,
+        options: Optional[Dict[str, Any]] = None,
+        profile: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        요청 옵션을 검증하고 완전한 인코더 설정으로 변환
+
+        Args:
+            options (Optional[Dict[str, Any]]): 요청 옵션
+                - output_profile: 'fast' | 'balanced' | 'max'
+                - output_format: 'jpeg' | 'webp' | 'avif' | 'png'
+                - output_quality: 1~100
+                - subsampling: '4:4:4' | '4:2:2' | '4:2:0' (JPEG)
+                - progressive, optimize: bool
+            profile (Optional[str]): 옵션에 output_profile이 없을 때 사용할 프로파일
+
+        Returns:
+            Dict[str, Any]: 인코더 설정 (profile, format, quality, subsampling, progressive, optimize)
+
+        Raises:
+            ValueError: 잘못된 옵션 또는 지원되지 않는 형식
+        """
+        options = options or {}
+
+        profile_name = options.get('output_profile', profile or cls.DEFAULT_PROFILE)
+        if profile_name not in cls.PROFILES:
+            raise ValueError(
+                f"Invalid output_profile. Must be one of {list(cls.PROFILES)}"
+            )
+
+        settings = dict(cls.PROFILES[profile_name], profile=profile_name)
+
+        output_format = options.get('output_format')
+        if output_format is not None:
+            output_format = str(output_format).lower()
+            if output_format == 'jpg':
+                output_format = 'jpeg'
+            if output_format not in cls.FORMATS:
+                raise ValueError(
+                    f"Invalid output_format. Must be one of {list(cls.FORMATS)}"
+                )
+            if not cls.is_supported(output_format):
+                raise ValueError(f"Output format not available on this server: {output_format}")
+            settings['format'] = output_format
+
+        quality = options.get('output_quality')
+        if quality is not None:
+            if not isinstance(quality, int) or isinstance(quality, bool) or not 1 <= quality <= 100:
+                raise ValueError('output_quality must be an integer between 1 and 100')
+            settings['quality'] = quality
+
+        subsampling = options.get('subsampling')
+        if subsampling is not None:
+            if subsampling not in cls.SUBSAMPLING:
+                raise ValueError(
+                    f"Invalid subsampling. Must be one of {list(cls.SUBSAMPLING)}"
+                )
+            settings['subsampling'] = subsampling
+
+        for flag in ('progressive', 'optimize'):
+            value = options.get(flag)
+            if value is not None:
+                if not isinstance(value, bool):
+                    raise ValueError(f'{flag} must be a boolean')
+                settings[flag] = value
+
+        return settings
+
+    @classmethod
+    def is_supported(cls, output_format: str) -> bool:
+        """
+        현재 Pillow 빌드에서 저장 가능한 형식인지 확인
+
+        Args:
+            output_format (str): 형식 키 ('jpeg', 'webp', 'avif', 'png')
+
+        Returns:
+            bool: 지원 여부
+        """
+        Image.init()
+        return cls.FORMATS[output_format][0] in Image.SAVE
+
+    @classmethod
+    def extension(cls, settings: Dict[str, Any]) -> str:
+        """설정에 맞는 파일 확장자 ('.jpg' 등)"""
+        return cls.FORMATS[settings['format']][1]
+
+    @classmethod
+    def mimetype(cls, settings: Dict[str, Any]) -> str:
+        """설정에 맞는 MIME type"""
+        return cls.FORMATS[settings['format']][2]
+
+    @classmethod
+    def save(
+        cls,
+        img: Image.Image,
+        output_file: Path,
+        settings: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        이미지를 설정에 맞게 저장
+
+        Args:
+            img (Image.Image): RGB 이미지
+            output_file (Path): 출력 파일 경로
+            settings (Optional[Dict[str, Any]]): resolve() 결과 (None이면 기본 프로파일)
+
+        Returns:
+            Dict[str, Any]: 인코딩 결과
+                - save (float): 파일 인코딩 소요 시간 (초)
+                - bytes (int): 출력 파일 크기
+        """
+        settings = settings or cls.resolve()
+        pil_format = cls.FORMATS[settings['format']][0]
+        quality = settings['quality']
+
+        if pil_format == 'JPEG':
+            params = {
+                'quality': quality,
+                'subsampling': cls.SUBSAMPLING[settings['subsampling']],
+                'optimize': settings['optimize'],
+                'progressive': settings['progressive'],
+            }
+        elif pil_format == 'WEBP':
+            # method: 0(빠름)~6(작은 파일), optimize를 압축 노력 수준으로 사용
+            params = {'quality': quality, 'method': 6 if settings['optimize'] else 4}
+        elif pil_format == 'AVIF':
+            params = {'quality': quality, 'speed': 4 if settings['optimize'] else 8}
+        else:
+            # PNG: 무손실 (품질 무시), optimize 시 최대 압축
+            params = {'optimize': settings['optimize'], 'compress_level': 6}
+
+        start = time.perf_counter()
+        # 기존 파일은 덮어쓰지 않고 새로 생성 (렌더 캐시와 하드 링크로 공유될 수 있음)
+        Path(output_file).unlink(missing_ok=True)
+        img.save(output_file, format=pil_format, **params)
+        elapsed = time.perf_counter() - start
+
+        size = Path(output_file).stat().st_size
+        logger.debug(
+            f"Encoded {output_file.name} as {pil_format} "
+            f"({settings['profile']}, q={quality}): {size} bytes in {elapsed:.3f}s"
+        )
+
+        return {'save': elapsed, 'bytes': size}
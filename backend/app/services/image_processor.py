@@ -1,11 +1,23 @@
 """이미지 처리 파이프라인"""
 import numpy as np
 from PIL import Image, ImageFile
-from typing import Dict, Optional
+from typing import Dict, Optional, List, Tuple, Any, Iterator, Callable
 from pathlib import Path
+from contextlib import contextmanager
+import json
 import logging
+import os
+import tempfile
+import threading
+import time
 from functools import lru_cache
 
+from backend.config import Config
+from backend.app.services.film_profile import FilmProfile
+from backend.app.services.image_encoder import ImageEncoder
+from backend.app.utils.byte_lru_cache import ByteLRUCache
+from backend.app.utils.grain_assets import GrainAssets
+
 logger = logging.getLogger(__name__)
 
 # PIL이 잘린 이미지도 로드할 수 있도록 설정
@@ -17,18 +29,50 @@ class ImageProcessor:
 
     # 클래스 상수
     MAX_DIMENSION = 4096  # 4K 해상도 제한
+    PREVIEW_DIMENSION = 1024  # 필름 미리보기 해상도
     MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
     SUPPORTED_FORMATS = {'JPEG', 'PNG', 'TIFF', 'BMP'}
 
-    # 그레인 캐시
-    _grain_cache: Dict[str, np.ndarray] = {}
+    # 축소 리샘플링 시 정수 배율 박스 축소(Image.reduce)를 먼저 적용하는 기준
+    # (3.0 이상이면 LANCZOS 직접 리사이즈와 사실상 구분되지 않음)
+    RESIZE_REDUCING_GAP = 3.0
+
+    # sRGB 감마 변환 모드
+    # - 'lut': 룩업 테이블 (기본값, 디코딩은 정확히 일치, 인코딩은 최대 1 LSB 오차)
+    # - 'exact': piecewise sRGB 공식 직접 계산 (참조용)
+    GAMMA_MODE = 'lut'
+    GAMMA_ENCODE_LUT_SIZE = 4096  # 인코딩 테이블 해상도
+
+    # 행 단위(밴드) 렌더링 설정
+    # 톤/그레인/인코딩 단계는 모두 점 연산이므로 밴드로 나눠도 결과가 동일하다.
+    TILE_MEMORY_BUDGET = 256 * 1024 * 1024  # 밴드 작업 메모리 예산 (bytes)
+    TILE_BYTES_PER_PIXEL = 96  # 밴드 1픽셀당 float32 임시 배열 추정치
+
+    # 그레인 배치 방식 (레시피의 'grain_mode'로 필름별 지정 가능)
+    # - 'resize': 텍스처를 이미지 크기로 LANCZOS 리사이즈 (해상도에 따라 입자 크기 변화)
+    # - 'tile': 원본 스케일 그대로 미러 타일링 + 랜덤 오프셋 (리샘플링 없음)
+    GRAIN_MODE = 'resize'
+    GRAIN_MODES = ('resize', 'tile')
+
+    # 그레인 캐시 (원본 텍스처 + 이미지 크기로 리사이즈된 레이어, uint8)
+    GRAIN_CACHE_MAX_BYTES = 512 * 1024 * 1024
+    _grain_cache = ByteLRUCache(GRAIN_CACHE_MAX_BYTES, name='grain')
+    # 메모리 매핑된 그레인 텍스처 (파일명 → 배열, 페이지 캐시를 워커 간 공유하므로 캐시 용량에 포함하지 않음)
+    _grain_assets: Dict[str, np.ndarray] = {}
+
+    # 컴파일된 필름 프로파일 캐시
+    _profile_cache: Dict[Tuple, FilmProfile] = {}
+    _profile_lock = threading.Lock()
 
     @classmethod
     def apply_film_simulation(
         cls,
         input_path: str,
         output_path: str,
-        film_recipe: Dict
+        film_recipe: Dict,
+        full_resolution: bool = False,
+        memory_budget: Optional[int] = None,
+        encoder: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         필름 시뮬레이션 적용
@@ -45,6 +89,9 @@ class ImageProcessor:
             input_path (str): 입력 이미지 경로
             output_path (str): 출력 이미지 경로
             film_recipe (Dict): 필름 레시피 정보
+            full_resolution (bool): True면 MAX_DIMENSION 축소 없이 원본 해상도로 처리
+            memory_budget (Optional[int]): 밴드 작업 메모리 예산 (bytes)
+            encoder (Optional[Dict[str, Any]]): ImageEncoder.resolve() 설정 (None이면 'max' 프로파일)
 
         Returns:
             str: 출력 파일 경로
@@ -63,57 +110,132 @@ class ImageProcessor:
         # 출력 디렉토리 생성
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        img = None
-        try:
-            # 1. 이미지 로드 (context manager 사용)
-            with Image.open(input_file) as img_temp:
-                # 이미지 복사 (context manager 밖에서 사용하기 위해)
-                img = img_temp.copy()
+        with cls._handle_errors():
+            # 1~4. 디코딩 (공유 단계)
+            img_rgb = cls._load_image(input_file, full_resolution=full_resolution)
 
-            # 2. 대용량 이미지 처리 (메모리 효율성)
-            if max(img.size) > cls.MAX_DIMENSION:
-                logger.warning(
-                    f"Large image detected ({img.size}), "
-                    f"resizing to {cls.MAX_DIMENSION}px"
-                )
-                ratio = cls.MAX_DIMENSION / max(img.size)
-                new_size = tuple(int(dim * ratio) for dim in img.size)
-                img = img.resize(new_size, Image.Resampling.LANCZOS)
+            # 5~10. 필름별 톤/그레인/인코딩
+            cls._render_film(
+                img_rgb, output_file, film_recipe,
+                memory_budget=memory_budget, encoder=encoder
+            )
 
-            # 3. RGBA → RGB 변환 (PNG 알파 채널 처리)
-            img = cls._convert_to_rgb(img)
+            logger.info(f"Image processed successfully: {output_file}")
+            return str(output_file)
 
-            # 4. Numpy 배열로 변환 (0~1 범위)
-            img_array = np.array(img, dtype=np.float32) / 255.0
+    @classmethod
+    def apply_film_simulations(
+        cls,
+        input_path: str,
+        outputs: List[Tuple[str, Dict]],
+        full_resolution: bool = False,
+        memory_budget: Optional[int] = None,
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        max_dimension: Optional[int] = None,
+        source_cache: Optional[str] = None,
+        encoder: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 필름 시뮬레이션을 한 번의 디코딩으로 적용
 
-            # 5. Gamma Decode (sRGB → Linear RGB)
-            img_linear = cls._gamma_decode(img_array)
+        이미지 로드, 리사이즈, RGB 변환은 한 번만 수행하고 디코딩된
+        uint8 버퍼를 각 필름의 톤(Gamma Decode 포함)/그레인/인코딩 단계에 공유한다.
+        필름별 실패는 결과에 기록되며 다른 필름 처리를 중단하지 않는다.
 
-            # 6. 톤 커브 적용 (필름별 특성)
-            img_toned = cls._apply_tone_curve(img_linear, film_recipe)
+        Args:
+            input_path (str): 입력 이미지 경로
+            outputs (List[Tuple[str, Dict]]): (출력 경로, 필름 레시피) 목록
+            full_resolution (bool): True면 MAX_DIMENSION 축소 없이 원본 해상도로 처리
+            memory_budget (Optional[int]): 밴드 작업 메모리 예산 (bytes)
+            on_result (Optional[Callable]): 필름 하나가 끝날 때마다 (인덱스, 결과)로 호출 (진행률 보고용)
+            max_dimension (Optional[int]): 축소 기준 크기 (None이면 MAX_DIMENSION, 미리보기는 PREVIEW_DIMENSION)
+            source_cache (Optional[str]): 디코딩된 버퍼(.npy) 캐시 경로 (있으면 디코딩 생략)
+            encoder (Optional[Dict[str, Any]]): ImageEncoder.resolve() 설정 (None이면 'max' 프로파일)
 
-            # 7. 그레인 오버레이
-            img_grain = cls._apply_grain_overlay(img_toned, film_recipe)
-
-            # 8. Gamma Encode (Linear RGB → sRGB)
-            img_srgb = cls._gamma_encode(img_grain)
-
-            # 9. 0~255 범위로 변환 및 클리핑
-            img_final = (np.clip(img_srgb, 0, 1) * 255).astype(np.uint8)
-
-            # 10. PIL Image로 변환 및 저장
-            output_img = Image.fromarray(img_final, mode='RGB')
-            output_img.save(
-                output_file,
-                format='JPEG',
-                quality=95,
-                optimize=True,
-                subsampling=0  # 최고 품질 chroma subsampling
-            )
+        Returns:
+            Dict[str, Any]: 처리 결과
+                - shared_time (float): 공유 단계 소요 시간 (초)
+                - stages (Dict[str, float]): 공유 단계별 소요 시간 (초)
+                - results (List[Dict]): 입력 순서대로의 필름별 결과
+                  (output_path, status, processing_time, stages 또는 error)
 
-            logger.info(f"Image processed successfully: {output_file}")
-            return str(output_file)
+        Raises:
+            ValueError: 입력 검증 실패
+            IOError: 파일 읽기 실패
+            RuntimeError: 공유 단계 처리 실패
+        """
+        input_file = Path(input_path)
+        cls._validate_input_file(input_file)
+
+        stages: Dict[str, float] = {}
+        shared_start = time.perf_counter()
+
+        with cls._handle_errors():
+            if source_cache is not None:
+                img_rgb = cls._load_cached_image(
+                    input_file, Path(source_cache), stages,
+                    full_resolution=full_resolution, max_dimension=max_dimension
+                )
+            else:
+                img_rgb = cls._load_image(
+                    input_file, stages,
+                    full_resolution=full_resolution, max_dimension=max_dimension
+                )
+
+        shared_time = time.perf_counter() - shared_start
+        logger.debug(f"Shared decode stage finished in {shared_time:.3f}s for {input_file.name}")
+
+        results = []
+        for index, (output_path, film_recipe) in enumerate(outputs):
+            output_file = Path(output_path)
+            film_stages: Dict[str, float] = {}
+            film_start = time.perf_counter()
+
+            try:
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                with cls._handle_errors():
+                    cls._render_film(
+                        img_rgb, output_file, film_recipe, film_stages,
+                        memory_budget=memory_budget, encoder=encoder
+                    )
+
+                result = {
+                    'output_path': str(output_file),
+                    'status': 'success',
+                    'processing_time': time.perf_counter() - film_start,
+                    'stages': film_stages
+                }
+                logger.info(f"Image processed successfully: {output_file}")
+
+            except Exception as e:
+                result = {
+                    'output_path': str(output_file),
+                    'status': 'failed',
+                    'processing_time': time.perf_counter() - film_start,
+                    'error': str(e)
+                }
+
+            results.append(result)
+            if on_result is not None:
+                on_result(index, result)
+
+        return {
+            'shared_time': shared_time,
+            'stages': stages,
+            'results': results
+        }
 
+    @classmethod
+    @contextmanager
+    def _handle_errors(cls) -> Iterator[None]:
+        """
+        처리 단계 예외를 공통 규칙으로 로깅 및 변환
+
+        ValueError/IOError는 그대로 전달하고,
+        그 외 예외는 RuntimeError로 감싼다.
+        """
+        try:
+            yield
         except ValueError as e:
             logger.error(f"Validation error: {e}")
             raise
@@ -123,10 +245,249 @@ class ImageProcessor:
         except Exception as e:
             logger.error(f"Image processing failed: {e}", exc_info=True)
             raise RuntimeError(f"Image processing failed: {e}") from e
-        finally:
-            # 리소스 정리
-            if img is not None:
-                img.close()
+
+    @classmethod
+    def _load_image(
+        cls,
+        input_file: Path,
+        stages: Optional[Dict[str, float]] = None,
+        full_resolution: bool = False,
+        max_dimension: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        이미지 로드 → 리사이즈 → RGB 변환 (공유 단계)
+
+        MAX_DIMENSION보다 큰 JPEG은 draft 모드로 목표 크기 이상인 가장 작은
+        DCT 스케일에서 디코딩한 뒤 남은 배율만 LANCZOS로 리샘플링한다.
+        단계별 시간은 load, resize(축소 시), decode(전체)로 기록한다.
+
+        Args:
+            input_file (Path): 입력 파일 경로
+            stages (Optional[Dict[str, float]]): 단계별 소요 시간 기록용
+            full_resolution (bool): True면 MAX_DIMENSION 축소를 건너뜀
+            max_dimension (Optional[int]): 축소 기준 크기 (None이면 MAX_DIMENSION)
+
+        Returns:
+            np.ndarray: sRGB 이미지 (uint8, H×W×3)
+        """
+        stage_start = time.perf_counter()
+        limit = max_dimension or cls.MAX_DIMENSION
+
+        # 1. 이미지 로드 (context manager 사용, 별도 복사본 없이 처리)
+        with Image.open(input_file) as source:
+            original_size = source.size
+            target_size = None
+
+            if not full_resolution and max(original_size) > limit:
+                ratio = limit / max(original_size)
+                target_size = tuple(int(dim * ratio) for dim in original_size)
+
+                # JPEG: 목표 크기 이상인 가장 작은 DCT 스케일(1/2, 1/4, 1/8)로 바로 디코딩
+                if source.format == 'JPEG':
+                    source.draft(None, target_size)
+
+            source.load()
+            img = source
+
+            if stages is not None:
+                stages['load'] = time.perf_counter() - stage_start
+
+            # 2. 대용량 이미지 처리 (메모리 효율성)
+            if target_size is not None:
+                logger.warning(
+                    f"Large image detected ({original_size}), "
+                    f"resizing to {limit}px"
+                )
+                if img.size != original_size:
+                    logger.debug(f"JPEG draft decode: {original_size} -> {img.size}")
+
+                resize_start = time.perf_counter()
+                if img.size != target_size:
+                    img = img.resize(
+                        target_size, Image.Resampling.LANCZOS,
+                        reducing_gap=cls.RESIZE_REDUCING_GAP
+                    )
+                if stages is not None:
+                    stages['resize'] = time.perf_counter() - resize_start
+
+            # 3. RGBA → RGB 변환 (PNG 알파 채널 처리)
+            img_rgb = cls._convert_to_rgb(img)
+
+            try:
+                # 4. Numpy 배열로 변환 (uint8, 0~255)
+                img_array = np.array(img_rgb, dtype=np.uint8)
+            finally:
+                # 중간 이미지 해제 (원본은 context manager가 정리)
+                if img_rgb is not img:
+                    img_rgb.close()
+                if img is not source:
+                    img.close()
+
+        if stages is not None:
+            stages['decode'] = time.perf_counter() - stage_start
+
+        return img_array
+
+    @classmethod
+    def _load_cached_image(
+        cls,
+        input_file: Path,
+        cache_file: Path,
+        stages: Optional[Dict[str, float]] = None,
+        full_resolution: bool = False,
+        max_dimension: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        디코딩된 버퍼를 .npy 파일로 캐싱하여 로드
+
+        캐시가 입력 파일보다 오래되었거나 읽을 수 없으면 다시 디코딩한다.
+        캐시는 임시 파일 작성 후 os.replace로 교체하므로 동시 요청이
+        불완전한 파일을 읽지 않는다. 캐시 적중 시 stages에 'cache'를 기록한다.
+
+        Args:
+            input_file (Path): 입력 파일 경로
+            cache_file (Path): 캐시 파일 경로 (.npy)
+            stages (Optional[Dict[str, float]]): 단계별 소요 시간 기록용
+            full_resolution (bool): True면 MAX_DIMENSION 축소를 건너뜀
+            max_dimension (Optional[int]): 축소 기준 크기 (None이면 MAX_DIMENSION)
+
+        Returns:
+            np.ndarray: sRGB 이미지 (uint8, H×W×3)
+        """
+        stage_start = time.perf_counter()
+
+        try:
+            if cache_file.stat().st_mtime >= input_file.stat().st_mtime:
+                img_array = np.load(cache_file, allow_pickle=False)
+                if stages is not None:
+                    stages['cache'] = time.perf_counter() - stage_start
+                return img_array
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read decoded image cache {cache_file}: {e}")
+
+        img_array = cls._load_image(
+            input_file, stages,
+            full_resolution=full_resolution, max_dimension=max_dimension
+        )
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=cache_file.parent, prefix='.source.', suffix='.npy'
+            )
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    np.save(f, img_array, allow_pickle=False)
+                os.replace(tmp_path, cache_file)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            # 캐시 저장 실패는 렌더링을 막지 않음
+            logger.warning(f"Failed to write decoded image cache {cache_file}: {e}")
+
+        return img_array
+
+    @classmethod
+    def _render_film(
+        cls,
+        img_rgb: np.ndarray,
+        output_file: Path,
+        film_recipe: Dict,
+        stages: Optional[Dict[str, float]] = None,
+        memory_budget: Optional[int] = None,
+        encoder: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        공유된 uint8 sRGB 버퍼에 필름별 단계 적용 후 저장
+
+        톤/그레인/인코딩은 메모리 예산에 맞는 행 단위 밴드로 나눠 처리한다.
+        모든 단계가 점 연산이고 그레인은 전체 크기 기준으로 한 번 준비한 뒤
+        밴드별로 잘라 쓰므로, 밴드 분할과 관계없이 결과는 동일하고
+        밴드 경계에서 그레인이 끊기지 않는다.
+        입력 버퍼는 수정하지 않는다.
+        stages의 'encode'는 Gamma Encode와 파일 저장을 합한 시간이고,
+        'save'와 'bytes'는 인코더의 파일 저장 시간과 출력 크기다.
+
+        Args:
+            img_rgb (np.ndarray): sRGB 이미지 (uint8)
+            output_file (Path): 출력 파일 경로
+            film_recipe (Dict): 필름 레시피 정보
+            stages (Optional[Dict[str, float]]): 단계별 소요 시간 기록용
+            memory_budget (Optional[int]): 밴드 작업 메모리 예산 (bytes)
+            encoder (Optional[Dict[str, Any]]): ImageEncoder.resolve() 설정 (None이면 'max' 프로파일)
+        """
+        height, width = img_rgb.shape[:2]
+        elapsed = {'tone': 0.0, 'grain': 0.0, 'encode': 0.0}
+
+        # 그레인 레이어 준비 (전체 크기, uint8)
+        stage_start = time.perf_counter()
+        grain_layer = cls._get_grain_layer(film_recipe, width, height)
+        grain_intensity = film_recipe.get('grain_intensity', 0.3)
+        elapsed['grain'] += time.perf_counter() - stage_start
+
+        profile = cls.get_film_profile(film_recipe) if cls.GAMMA_MODE == 'lut' else None
+        img_final = np.empty_like(img_rgb)
+        band_rows = cls._band_rows(width, height, memory_budget)
+
+        for top in range(0, height, band_rows):
+            bottom = min(top + band_rows, height)
+            stage_start = time.perf_counter()
+
+            # 5~6. Gamma Decode + 톤 커브 적용 (필름별 특성)
+            if profile is not None:
+                band = profile.apply(img_rgb[top:bottom])
+            else:
+                band = cls._apply_tone_curve(cls._gamma_decode(img_rgb[top:bottom]), film_recipe)
+
+            elapsed['tone'] += time.perf_counter() - stage_start
+            stage_start = time.perf_counter()
+
+            # 7. 그레인 오버레이
+            if grain_layer is not None:
+                band = cls._apply_grain_overlay(band, grain_layer[top:bottom], grain_intensity)
+
+            elapsed['grain'] += time.perf_counter() - stage_start
+            stage_start = time.perf_counter()
+
+            # 8~9. Gamma Encode (Linear RGB → sRGB, 0~255 uint8)
+            img_final[top:bottom] = cls._gamma_encode(band)
+            del band
+
+            elapsed['encode'] += time.perf_counter() - stage_start
+
+        # 10. PIL Image로 변환 및 저장
+        stage_start = time.perf_counter()
+        output_img = Image.fromarray(img_final, mode='RGB')
+        del img_final
+        encoded = ImageEncoder.save(output_img, output_file, encoder)
+        output_img.close()
+        elapsed['encode'] += time.perf_counter() - stage_start
+
+        if stages is not None:
+            stages.update(elapsed)
+            stages.update(encoded)
+            if band_rows < height:
+                stages['bands'] = -(-height // band_rows)
+
+    @classmethod
+    def _band_rows(cls, width: int, height: int, memory_budget: Optional[int] = None) -> int:
+        """
+        메모리 예산에 맞는 밴드 행 수 계산
+
+        Args:
+            width (int): 이미지 너비
+            height (int): 이미지 높이
+            memory_budget (Optional[int]): 밴드 작업 메모리 예산 (bytes)
+
+        Returns:
+            int: 밴드당 행 수 (1 이상)
+        """
+        budget = memory_budget or cls.TILE_MEMORY_BUDGET
+        rows = budget // max(1, width * cls.TILE_BYTES_PER_PIXEL)
+        return int(min(height, max(1, rows)))
 
     @classmethod
     def _validate_input_file(cls, file_path: Path) -> None:
@@ -186,10 +547,93 @@ class ImageProcessor:
             return img.convert('RGB')
         return img
 
+    @classmethod
+    def _gamma_decode(cls, img: np.ndarray) -> np.ndarray:
+        """
+        Gamma Decode: sRGB → Linear RGB
+
+        입력은 항상 8-bit 데이터이므로 'lut' 모드에서는 256개 항목 테이블을
+        조회한다. 테이블은 정확한 공식으로 만들어지므로 결과는 'exact' 모드와
+        비트 단위로 동일하다.
+
+        Args:
+            img (np.ndarray): sRGB 이미지 (uint8, 0~255)
+
+        Returns:
+            np.ndarray: Linear RGB 이미지 (float32, 0~1)
+        """
+        if cls.GAMMA_MODE == 'lut':
+            return cls._gamma_decode_lut()[img]
+
+        return cls._srgb_to_linear(img.astype(np.float32) / 255.0)
+
+    @classmethod
+    def _gamma_encode(cls, img: np.ndarray) -> np.ndarray:
+        """
+        Gamma Encode: Linear RGB → sRGB (0~255 uint8)
+
+        'lut' 모드에서는 [0, 1] 범위를 GAMMA_ENCODE_LUT_SIZE 단계로 양자화한 뒤
+        uint8로 바로 매핑되는 테이블을 조회한다. 양자화 오차는 최대
+        0.5 / (GAMMA_ENCODE_LUT_SIZE - 1)이고 sRGB 곡선의 최대 기울기는 12.92이므로
+        4096 단계에서 'exact' 모드 대비 오차는 최대 1 LSB이다.
+        범위를 벗어난 값은 [0, 1]로 자르고 NaN은 0으로 인코딩한다.
+
+        Args:
+            img (np.ndarray): Linear RGB 이미지 (0~1)
+
+        Returns:
+            np.ndarray: sRGB 이미지 (uint8, 0~255)
+        """
+        if cls.GAMMA_MODE == 'lut':
+            scale = cls.GAMMA_ENCODE_LUT_SIZE - 1
+            index = np.clip(img, 0, 1)
+            # NaN은 clip을 그대로 통과해 인덱싱 오류를 내므로 'exact' 모드처럼 0으로 변환
+            np.nan_to_num(index, copy=False, nan=0.0)
+            index *= scale
+            index += 0.5
+            return cls._gamma_encode_lut(cls.GAMMA_ENCODE_LUT_SIZE)[index.astype(np.intp)]
+
+        img_srgb = cls._linear_to_srgb(img)
+        return (np.clip(img_srgb, 0, 1) * 255).astype(np.uint8)
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _gamma_decode_lut() -> np.ndarray:
+        """
+        8-bit sRGB → Linear RGB 디코딩 테이블 (256개 항목)
+
+        Returns:
+            np.ndarray: float32 테이블 (읽기 전용)
+        """
+        table = ImageProcessor._srgb_to_linear(
+            np.arange(256, dtype=np.float32) / 255.0
+        ).astype(np.float32)
+        table.setflags(write=False)
+        return table
+
     @staticmethod
-    def _gamma_decode(img: np.ndarray) -> np.ndarray:
+    @lru_cache(maxsize=4)
+    def _gamma_encode_lut(size: int) -> np.ndarray:
+        """
+        Linear RGB → 8-bit sRGB 인코딩 테이블
+
+        'exact' 모드와 동일하게 0~255 변환 시 소수점 이하를 버린다.
+
+        Args:
+            size (int): 테이블 항목 수
+
+        Returns:
+            np.ndarray: uint8 테이블 (읽기 전용)
         """
-        Gamma Decode: sRGB → Linear RGB (정확한 sRGB 공식 사용)
+        levels = np.linspace(0.0, 1.0, size, dtype=np.float32)
+        table = (np.clip(ImageProcessor._linear_to_srgb(levels), 0, 1) * 255).astype(np.uint8)
+        table.setflags(write=False)
+        return table
+
+    @staticmethod
+    def _srgb_to_linear(img: np.ndarray) -> np.ndarray:
+        """
+        sRGB → Linear RGB 정확한 공식 (참조 구현)
 
         sRGB는 piecewise 함수:
         - V <= 0.04045: V / 12.92
@@ -201,8 +645,6 @@ class ImageProcessor:
         Returns:
             np.ndarray: Linear RGB 이미지
         """
-        # 간단한 gamma 2.2 사용 (성능 고려)
-        # 정확한 sRGB 변환이 필요하면 piecewise 함수 사용
         return np.where(
             img <= 0.04045,
             img / 12.92,
@@ -210,9 +652,9 @@ class ImageProcessor:
         )
 
     @staticmethod
-    def _gamma_encode(img: np.ndarray) -> np.ndarray:
+    def _linear_to_srgb(img: np.ndarray) -> np.ndarray:
         """
-        Gamma Encode: Linear RGB → sRGB (정확한 sRGB 공식 사용)
+        Linear RGB → sRGB 정확한 공식 (참조 구현)
 
         sRGB는 piecewise 함수:
         - V <= 0.0031308: V * 12.92
@@ -230,13 +672,92 @@ class ImageProcessor:
             1.055 * np.power(img, 1.0 / 2.4) - 0.055
         )
 
+    @classmethod
+    def get_film_profile(cls, film_recipe: Dict) -> FilmProfile:
+        """
+        레시피에 해당하는 컴파일된 필름 프로파일 반환 (캐싱 사용)
+
+        Args:
+            film_recipe (Dict): 필름 레시피 정보
+
+        Returns:
+            FilmProfile: 그레인 이전 단계를 합친 채널별 LUT 프로파일
+        """
+        key = cls._profile_cache_key(film_recipe)
+
+        profile = cls._profile_cache.get(key)
+        if profile is not None:
+            return profile
+
+        with cls._profile_lock:
+            profile = cls._profile_cache.get(key)
+            if profile is None:
+                profile = cls._compile_film_profile(film_recipe)
+                cls._profile_cache[key] = profile
+                logger.debug(f"Film profile compiled and cached: {film_recipe.get('film_name', '')}")
+
+        return profile
+
+    @staticmethod
+    def _profile_cache_key(film_recipe: Dict) -> Tuple:
+        """
+        프로파일 캐시 키 (톤 단계에 영향을 주는 레시피 값만 사용)
+
+        Args:
+            film_recipe (Dict): 필름 레시피 정보
+
+        Returns:
+            Tuple: 캐시 키
+        """
+        return (
+            film_recipe.get('film_name', ''),
+            film_recipe.get('type', 'color'),
+            film_recipe.get('bw_weight_r', 0.299),
+            film_recipe.get('bw_weight_g', 0.587),
+            film_recipe.get('bw_weight_b', 0.114),
+            json.dumps(film_recipe.get('tone_curve') or {}, sort_keys=True),
+        )
+
+    @classmethod
+    def _compile_film_profile(cls, film_recipe: Dict) -> FilmProfile:
+        """
+        필름 레시피를 채널별 LUT 프로파일로 컴파일
+
+        256단계 입력 각각을 참조 구현(_gamma_decode → _apply_tone_curve)에
+        그대로 통과시켜 테이블을 만들므로 결과는 참조 구현과 동일하다.
+
+        Args:
+            film_recipe (Dict): 필름 레시피 정보
+
+        Returns:
+            FilmProfile: 컴파일된 프로파일
+        """
+        # (1, 256, 3): 채널마다 0~255 전체 입력을 Linear RGB로 디코딩한 값
+        levels = np.repeat(cls._gamma_decode_lut().reshape(1, 256, 1), 3, axis=2)
+
+        if cls._is_bw_recipe(film_recipe):
+            weights = (
+                film_recipe.get('bw_weight_r', 0.299),
+                film_recipe.get('bw_weight_g', 0.587),
+                film_recipe.get('bw_weight_b', 0.114),
+            )
+            luts = np.stack(
+                [levels[0, :, channel] * weight for channel, weight in enumerate(weights)],
+                axis=-1
+            )
+            curves = FilmProfile.parse_tone_curve(film_recipe.get('tone_curve'))
+            return FilmProfile(luts, gray_tone=lambda gray: cls._apply_bw_tone(gray, curves))
+
+        return FilmProfile(cls._apply_tone_curve(levels, film_recipe)[0])
+
     @classmethod
     def _apply_tone_curve(cls, img: np.ndarray, film_recipe: Dict) -> np.ndarray:
         """
-        필름별 톤 커브 적용
+        필름별 톤 커브 적용 (참조 구현)
 
-        MVP 단계에서는 간단한 S-curve 적용
-        향후 실제 Characteristic Curves 데이터 사용 예정
+        레시피에 tone_curve 데이터가 있으면 해당 커브를, 없으면
+        필름별 S-curve 근사를 사용한다. 'lut' 모드에서는 이 함수로
+        컴파일된 FilmProfile이 대신 사용된다.
 
         Args:
             img (np.ndarray): Linear RGB 이미지
@@ -245,9 +766,86 @@ class ImageProcessor:
         Returns:
             np.ndarray: 톤 커브 적용된 이미지
         """
+        curves = FilmProfile.parse_tone_curve(film_recipe.get('tone_curve'))
+
+        if cls._is_bw_recipe(film_recipe):
+            # 흑백 변환 (Rec. 709 가중치)
+            bw_weight_r = film_recipe.get('bw_weight_r', 0.299)
+            bw_weight_g = film_recipe.get('bw_weight_g', 0.587)
+            bw_weight_b = film_recipe.get('bw_weight_b', 0.114)
+
+            gray = (img[:, :, 0] * bw_weight_r +
+                   img[:, :, 1] * bw_weight_g +
+                   img[:, :, 2] * bw_weight_b)
+
+            # 3채널로 복사 (흑백 이미지)
+            return np.stack([cls._apply_bw_tone(gray, curves)] * 3, axis=-1)
+
+        if curves:
+            # 특성 곡선 데이터 (채널별 보간)
+            return np.stack([
+                np.interp(img[:, :, channel], *curve).astype(np.float32) if curve else img[:, :, channel]
+                for channel, curve in enumerate(FilmProfile.channel_curves(curves))
+            ], axis=-1)
+
+        return cls._apply_color_tone(img, film_recipe)
+
+    @staticmethod
+    def _is_bw_recipe(film_recipe: Dict) -> bool:
+        """
+        흑백 톤 처리 대상 여부
+
+        Args:
+            film_recipe (Dict): 필름 레시피 정보
+
+        Returns:
+            bool: 흑백 변환 적용 여부
+        """
         film_name = film_recipe.get('film_name', '')
         film_type = film_recipe.get('type', 'color')
 
+        # 컬러 전용 톤 처리가 있는 필름은 우선 적용
+        if any(name in film_name for name in ('Velvia', 'Provia', 'Portra', 'Vision3')):
+            return False
+
+        return 'T-Max' in film_name or film_type == 'bw'
+
+    @classmethod
+    def _apply_bw_tone(cls, gray: np.ndarray, curves: Dict) -> np.ndarray:
+        """
+        흑백 톤 커브 적용
+
+        Args:
+            gray (np.ndarray): 흑백 Linear 이미지 (H×W)
+            curves (Dict): parse_tone_curve 결과
+
+        Returns:
+            np.ndarray: 톤 커브 적용된 흑백 이미지
+        """
+        curve = curves.get('rgb') or curves.get('g')
+        if curve is not None:
+            return np.interp(gray, *curve).astype(np.float32)
+
+        # 강한 대비 (S-curve)
+        return cls._s_curve(gray, strength=0.25)
+
+    @classmethod
+    def _apply_color_tone(cls, img: np.ndarray, film_recipe: Dict) -> np.ndarray:
+        """
+        컬러 필름 S-curve 근사 톤 적용
+
+        MVP 단계에서는 간단한 S-curve 적용
+        향후 실제 Characteristic Curves 데이터로 대체 (tone_curve)
+
+        Args:
+            img (np.ndarray): Linear RGB 이미지
+            film_recipe (Dict): 필름 레시피 정보
+
+        Returns:
+            np.ndarray: 톤 커브 적용된 이미지
+        """
+        film_name = film_recipe.get('film_name', '')
+
         # 이미지 복사 (원본 보존)
         img_result = img.copy()
 
@@ -273,23 +871,6 @@ class ImageProcessor:
             img_result = cls._s_curve(img_result, strength=0.18)
             img_result = np.clip(img_result * 0.98, 0, 1)
 
-        # T-Max 100: 흑백 변환 + 강한 대비
-        elif 'T-Max' in film_name or film_type == 'bw':
-            # 흑백 변환 (Rec. 709 가중치)
-            bw_weight_r = film_recipe.get('bw_weight_r', 0.299)
-            bw_weight_g = film_recipe.get('bw_weight_g', 0.587)
-            bw_weight_b = film_recipe.get('bw_weight_b', 0.114)
-
-            gray = (img_result[:, :, 0] * bw_weight_r +
-                   img_result[:, :, 1] * bw_weight_g +
-                   img_result[:, :, 2] * bw_weight_b)
-
-            # 3채널로 복사 (흑백 이미지)
-            img_result = np.stack([gray] * 3, axis=-1)
-
-            # 강한 대비 (S-curve)
-            img_result = cls._s_curve(img_result, strength=0.25)
-
         # 기타: 기본 S-curve
         else:
             img_result = cls._s_curve(img_result, strength=0.10)
@@ -315,16 +896,22 @@ class ImageProcessor:
         return np.clip(y, 0, 1)
 
     @classmethod
-    def _apply_grain_overlay(cls, img: np.ndarray, film_recipe: Dict) -> np.ndarray:
+    def _get_grain_layer(
+        cls,
+        film_recipe: Dict,
+        width: int,
+        height: int
+    ) -> Optional[np.ndarray]:
         """
-        필름 그레인 오버레이 적용 (캐싱 사용)
+        이미지 크기에 맞춘 그레인 레이어 준비 (캐싱 사용)
 
         Args:
-            img (np.ndarray): Linear RGB 이미지 (0~1)
             film_recipe (Dict): 필름 레시피 정보
+            width (int): 이미지 너비
+            height (int): 이미지 높이
 
         Returns:
-            np.ndarray: 그레인 적용된 이미지
+            Optional[np.ndarray]: 그레인 레이어 (uint8, H×W) 또는 None (그레인 생략)
         """
         try:
             film_name = film_recipe.get('film_name', '')
@@ -332,7 +919,7 @@ class ImageProcessor:
 
             # 그레인 강도가 0이면 스킵
             if grain_intensity <= 0.0:
-                return img
+                return None
 
             # 필름별 그레인 파일 선택
             grain_file = cls._get_grain_file(film_name)
@@ -342,22 +929,46 @@ class ImageProcessor:
 
             if grain_array is None:
                 logger.warning(f"Grain file not found: {grain_file}, skipping grain overlay")
-                return img
+                return None
 
-            # 이미지 크기에 맞게 리사이즈
-            target_size = (img.shape[1], img.shape[0])  # (width, height)
+            # 원본 스케일 타일링 (렌더링마다 오프셋이 다르므로 캐싱하지 않음)
+            if film_recipe.get('grain_mode', cls.GRAIN_MODE) == 'tile':
+                return cls._tile_grain(grain_array, width, height, film_recipe.get('grain_seed'))
 
-            # 원본 그레인 크기와 다르면 리사이즈
-            if grain_array.shape[:2] != (target_size[1], target_size[0]):
-                grain_resized = Image.fromarray((grain_array * 255).astype(np.uint8))
-                grain_resized = grain_resized.resize(
-                    target_size,
-                    Image.Resampling.LANCZOS
-                )
-                grain_array = np.array(grain_resized, dtype=np.float32) / 255.0
+            # 원본 그레인 크기와 같으면 그대로 사용
+            if grain_array.shape[:2] == (height, width):
+                return grain_array
 
-            # 그레인을 3채널로 확장
-            grain_3ch = np.stack([grain_array] * 3, axis=-1)
+            # 이미지 크기에 맞게 리사이즈 (캐싱 사용)
+            return cls._grain_cache.get_or_create(
+                ('layer', grain_file, width, height),
+                lambda: cls._resize_grain(grain_array, width, height)
+            )
+
+        except Exception as e:
+            logger.error(f"Grain overlay failed: {e}", exc_info=True)
+            return None
+
+    @staticmethod
+    def _apply_grain_overlay(
+        img: np.ndarray,
+        grain_layer: np.ndarray,
+        grain_intensity: float
+    ) -> np.ndarray:
+        """
+        필름 그레인 오버레이 적용
+
+        Args:
+            img (np.ndarray): Linear RGB 이미지 (0~1)
+            grain_layer (np.ndarray): 같은 크기의 그레인 레이어 (uint8, H×W)
+            grain_intensity (float): 그레인 강도
+
+        Returns:
+            np.ndarray: 그레인 적용된 이미지
+        """
+        try:
+            # 그레인을 3채널로 확장 (broadcast)
+            grain_3ch = (grain_layer.astype(np.float32) / 255.0)[:, :, np.newaxis]
 
             # Overlay blend mode (정확한 Photoshop Overlay 공식)
             # if base < 0.5: 2 * base * blend
@@ -377,24 +988,126 @@ class ImageProcessor:
             logger.error(f"Grain overlay failed: {e}", exc_info=True)
             return img
 
+    @classmethod
+    def grain_cache_stats(cls) -> Dict[str, Any]:
+        """
+        그레인 캐시 통계 반환
+
+        Returns:
+            Dict[str, Any]: 항목 수, 사용량, 적중/실패/제거 횟수
+        """
+        return cls._grain_cache.stats()
+
+    @classmethod
+    def _tile_grain(
+        cls,
+        grain_array: np.ndarray,
+        width: int,
+        height: int,
+        seed: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        그레인 텍스처를 원본 스케일 그대로 타일링
+
+        텍스처를 좌우/상하로 번갈아 뒤집어 이어 붙이므로(미러 타일링)
+        타일 경계에서 값이 끊기지 않는다. 시작 오프셋은 렌더링마다
+        랜덤이며 seed를 지정하면 재현 가능하다.
+        리샘플링 없이 인덱스 복사만 수행한다.
+
+        Args:
+            grain_array (np.ndarray): 그레인 텍스처 (uint8)
+            width (int): 목표 너비
+            height (int): 목표 높이
+            seed (Optional[int]): 오프셋 랜덤 시드
+
+        Returns:
+            np.ndarray: 그레인 레이어 (uint8, H×W)
+        """
+        tex_height, tex_width = grain_array.shape[:2]
+        rng = np.random.default_rng(seed)
+
+        rows = cls._mirror_indices(int(rng.integers(0, 2 * tex_height)), height, tex_height)
+        cols = cls._mirror_indices(int(rng.integers(0, 2 * tex_width)), width, tex_width)
+
+        return np.take(np.take(grain_array, rows, axis=0), cols, axis=1)
+
+    @staticmethod
+    def _mirror_indices(offset: int, length: int, period: int) -> np.ndarray:
+        """
+        미러 타일링 인덱스 계산 (0, 1, ..., n-1, n-1, ..., 1, 0, 0, 1, ...)
+
+        Args:
+            offset (int): 시작 오프셋
+            length (int): 인덱스 개수
+            period (int): 텍스처 길이
+
+        Returns:
+            np.ndarray: 텍스처 인덱스 배열
+        """
+        positions = (np.arange(length, dtype=np.intp) + offset) % (2 * period)
+        return np.where(positions < period, positions, 2 * period - 1 - positions)
+
+    @staticmethod
+    def _resize_grain(grain_array: np.ndarray, width: int, height: int) -> np.ndarray:
+        """
+        그레인 텍스처를 이미지 크기로 리사이즈
+
+        Args:
+            grain_array (np.ndarray): 그레인 텍스처 (uint8)
+            width (int): 목표 너비
+            height (int): 목표 높이
+
+        Returns:
+            np.ndarray: 리사이즈된 그레인 레이어 (uint8, 읽기 전용)
+        """
+        with Image.fromarray(grain_array) as grain_img:
+            with grain_img.resize((width, height), Image.Resampling.LANCZOS) as grain_resized:
+                grain_layer = np.array(grain_resized, dtype=np.uint8)
+
+        grain_layer.setflags(write=False)
+        return grain_layer
+
     @classmethod
     def _load_grain_texture(cls, grain_file: str) -> Optional[np.ndarray]:
         """
         그레인 텍스처 로드 (캐싱 사용)
 
+        컴파일된 에셋(GrainAssets, .npy)이 있으면 메모리 매핑으로 읽고,
+        없으면 PNG를 디코딩해 그레인 캐시에 보관한다.
+
         Args:
             grain_file (str): 그레인 파일명
 
         Returns:
-            Optional[np.ndarray]: 그레인 배열 (0~1) 또는 None
+            Optional[np.ndarray]: 그레인 배열 (uint8, 읽기 전용) 또는 None
         """
-        # 캐시 확인
-        if grain_file in cls._grain_cache:
-            return cls._grain_cache[grain_file]
+        grain_array = cls._grain_assets.get(grain_file)
+        if grain_array is not None:
+            return grain_array
 
-        try:
-            from backend.config import Config
+        grain_array = GrainAssets.load(Config.BASE_DIR / 'data' / 'grain_overlays' / grain_file)
+        if grain_array is not None:
+            cls._grain_assets[grain_file] = grain_array
+            logger.debug(f"Grain texture mapped: {grain_file}")
+            return grain_array
+
+        return cls._grain_cache.get_or_create(
+            ('texture', grain_file),
+            lambda: cls._read_grain_texture(grain_file)
+        )
 
+    @staticmethod
+    def _read_grain_texture(grain_file: str) -> Optional[np.ndarray]:
+        """
+        그레인 텍스처 파일 읽기 (PNG 디코딩, 컴파일된 에셋이 없는 경우)
+
+        Args:
+            grain_file (str): 그레인 파일명
+
+        Returns:
+            Optional[np.ndarray]: 그레인 배열 (uint8, 읽기 전용) 또는 None
+        """
+        try:
             grain_folder = Config.BASE_DIR / 'data' / 'grain_overlays'
             grain_path = grain_folder / grain_file
 
@@ -403,15 +1116,10 @@ class ImageProcessor:
 
             # 그레인 이미지 로드
             with Image.open(grain_path) as grain_img:
-                grain_array = np.array(
-                    grain_img.convert('L'),
-                    dtype=np.float32
-                ) / 255.0
-
-            # 캐시에 저장
-            cls._grain_cache[grain_file] = grain_array
+                grain_array = np.array(grain_img.convert('L'), dtype=np.uint8)
 
-            logger.debug(f"Grain texture loaded and cached: {grain_file}")
+            grain_array.setflags(write=False)
+            logger.debug(f"Grain texture loaded: {grain_file}")
 
             return grain_array
 
@@ -419,6 +1127,23 @@ class ImageProcessor:
             logger.error(f"Failed to load grain texture {grain_file}: {e}")
             return None
 
+    @classmethod
+    def grain_texture_path(cls, film_recipe: Dict) -> Optional[Path]:
+        """
+        레시피가 사용하는 그레인 텍스처 PNG 경로
+
+        Args:
+            film_recipe (Dict): 필름 레시피 정보
+
+        Returns:
+            Optional[Path]: 텍스처 경로 (그레인 강도가 0이면 None)
+        """
+        if film_recipe.get('grain_intensity', 0.3) <= 0.0:
+            return None
+
+        grain_file = cls._get_grain_file(film_recipe.get('film_name', ''))
+        return Config.BASE_DIR / 'data' / 'grain_overlays' / grain_file
+
     @staticmethod
     def _get_grain_file(film_name: str) -> str:
         """
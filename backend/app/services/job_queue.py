@@ -0,0 +1,330 @@
+"""비동기 렌더링 작업 큐 및 작업 상태 저장"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from backend.config import Config
+
+logger = logging.getLogger(__name__)
+
+# fcntl은 POSIX에서만 제공 (없으면 프로세스 내 잠금만 사용)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class JobTracker:
+    """
+    단일 작업의 진행 상태를 job_folder/job.json에 기록하는 클래스
+
+    상태는 작업을 실행하는 스레드만 갱신하며, 파일은 임시 파일 작성 후
+    os.replace로 교체하므로 조회 요청은 항상 완전한 JSON을 읽는다.
+    작업이 끝날 때까지는 하트비트 스레드가 job.json의 수정 시각을 주기적으로
+    갱신하므로, 필름 하나의 렌더링이 STALE_AFTER보다 오래 걸려도 중단된
+    작업으로 보지 않는다 (프로세스가 죽으면 갱신이 멈춰 중단으로 판단됨).
+    """
+
+    STATE_FILENAME = 'job.json'
+
+    # 하트비트 주기 (초, JobQueue.STALE_AFTER보다 충분히 짧게)
+    HEARTBEAT_INTERVAL = 30
+
+    def __init__(self, job_folder: Path, job_id: str, films: List[Dict[str, Any]]):
+        """
+        Args:
+            job_folder (Path): Job 폴더
+            job_id (str): Job ID
+            films (List[Dict[str, Any]]): 필름별 초기 상태 (film_id, film_name, status 등)
+        """
+        self.path = job_folder / self.STATE_FILENAME
+        self._lock = threading.Lock()
+        self._heartbeat: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self.state: Dict[str, Any] = {
+            'job_id': job_id,
+            'status': 'queued',
+            'created_at': self._now(),
+            'updated_at': self._now(),
+            'started_at': None,
+            'finished_at': None,
+            'total': len(films),
+            'done': sum(1 for film in films if film.get('status') in ('success', 'failed')),
+            'films': films,
+            'result': None,
+        }
+
+    @staticmethod
+    def _now() -> str:
+        """현재 시각 (UTC ISO 8601)"""
+        return datetime.now(timezone.utc).isoformat()
+
+    def save(self) -> None:
+        """상태를 job.json에 원자적으로 기록"""
+        with self._lock:
+            self.state['updated_at'] = self._now()
+            self.state['progress'] = round(self.state['done'] / self.state['total'], 3) \
+                if self.state['total'] else 1.0
+
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix='.job.', suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self.state, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+    def start_heartbeat(self) -> None:
+        """작업이 끝날 때까지 job.json 수정 시각을 HEARTBEAT_INTERVAL마다 갱신"""
+        if self._heartbeat is not None:
+            return
+
+        self._heartbeat = threading.Thread(
+            target=self._beat,
+            name=f"job-heartbeat-{self.state['job_id']}",
+            daemon=True
+        )
+        self._heartbeat.start()
+
+    def stop_heartbeat(self) -> None:
+        """하트비트 중지"""
+        self._stopped.set()
+
+    def _beat(self) -> None:
+        """하트비트 스레드 본체"""
+        while not self._stopped.wait(self.HEARTBEAT_INTERVAL):
+            with self._lock:
+                try:
+                    os.utime(self.path)
+                except OSError as e:
+                    logger.warning(f"Failed to refresh job heartbeat {self.path}: {e}")
+
+    def start(self) -> None:
+        """처리 시작 (대기 중인 필름을 processing으로 표시)"""
+        self.state['status'] = 'processing'
+        self.state['started_at'] = self._now()
+        for film in self.state['films']:
+            if film['status'] == 'queued':
+                film['status'] = 'processing'
+        self.save()
+
+    def update_film(self, index: int, result: Dict[str, Any]) -> None:
+        """
+        필름 하나의 처리 결과 반영
+
+        Args:
+            index (int): films 목록 인덱스
+            result (Dict[str, Any]): /api/process 응답의 필름별 결과 형식
+        """
+        self.state['films'][index] = result
+        self.state['done'] += 1
+        self.save()
+
+    def finish(self, result: Dict[str, Any]) -> None:
+        """
+        처리 완료
+
+        Args:
+            result (Dict[str, Any]): /api/process 동기 응답과 같은 형식의 최종 결과
+        """
+        self.state['status'] = 'completed'
+        self.state['finished_at'] = self._now()
+        self.state['done'] = self.state['total']
+        self.state['films'] = result['results']
+        self.state['result'] = result
+        try:
+            self.save()
+        finally:
+            self.stop_heartbeat()
+
+    def fail(self, error: str) -> None:
+        """
+        처리 실패 (끝나지 않은 필름은 모두 실패 처리)
+
+        Args:
+            error (str): 오류 메시지
+        """
+        self.state['status'] = 'failed'
+        self.state['finished_at'] = self._now()
+        self.state['error'] = error
+        for film in self.state['films']:
+            if film['status'] in ('queued', 'processing'):
+                film['status'] = 'failed'
+                film['error'] = error
+        self.state['done'] = self.state['total']
+        try:
+            self.save()
+        finally:
+            self.stop_heartbeat()
+
+
+class JobQueue:
+    """
+    렌더링 작업을 백그라운드 스레드에서 실행하는 큐
+
+    스레드 풀은 첫 작업 제출 시 (gunicorn fork 이후) 프로세스마다 생성된다.
+    작업 상태는 job.json에 기록되므로 어느 워커 프로세스에서든 조회할 수 있다.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _lock = threading.Lock()
+    _claim_lock = threading.Lock()
+
+    # 처리 중으로 남은 작업을 중단된 것으로 판단하는 기준 (초)
+    # (워커 재시작 등으로 하트비트가 더 이상 갱신되지 않는 경우)
+    STALE_AFTER = 600
+
+    # 작업 선점용 잠금 파일 (Job 폴더 안, 워커 프로세스 간 공유)
+    LOCK_FILENAME = '.job.lock'
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """
+        작업 스레드 풀 반환 (없으면 생성)
+
+        Returns:
+            ThreadPoolExecutor: 작업 스레드 풀
+        """
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=Config.JOB_WORKERS,
+                    thread_name_prefix='render-job'
+                )
+                logger.info(f"Job queue started: {Config.JOB_WORKERS} worker thread(s)")
+            return cls._executor
+
+    @classmethod
+    def submit(
+        cls,
+        job_id: str,
+        func: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any
+    ) -> Future:
+        """
+        작업 제출
+
+        Args:
+            job_id (str): Job ID (로그용)
+            func (Callable): 실행할 함수
+            *args, **kwargs: func 인자
+
+        Returns:
+            Future: 작업 Future
+        """
+        def run() -> Any:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Background job {job_id} failed: {e}", exc_info=True)
+                raise
+
+        logger.info(f"Job {job_id} queued")
+        return cls._get_executor().submit(run)
+
+    @staticmethod
+    def read_state(job_folder: Path) -> Optional[Dict[str, Any]]:
+        """
+        job.json 상태 조회
+
+        Args:
+            job_folder (Path): Job 폴더
+
+        Returns:
+            Optional[Dict[str, Any]]: 작업 상태 (없거나 읽을 수 없으면 None)
+        """
+        state_file = job_folder / JobTracker.STATE_FILENAME
+
+        try:
+            with open(state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read job state {state_file}: {e}")
+            return None
+
+        # 갱신이 멈춘 작업은 중단된 것으로 보고
+        if state.get('status') in ('queued', 'processing'):
+            try:
+                age = time.time() - state_file.stat().st_mtime
+            except OSError:
+                age = 0
+
+            if age > JobQueue.STALE_AFTER:
+                state['status'] = 'failed'
+                state['error'] = 'Job interrupted (no progress reported)'
+
+        return state
+
+    @classmethod
+    @contextmanager
+    def _job_lock(cls, job_folder: Path) -> Iterator[None]:
+        """
+        Job 폴더 단위 배타 잠금 (같은 프로세스의 스레드와 다른 워커 프로세스 모두)
+
+        Args:
+            job_folder (Path): Job 폴더
+        """
+        with cls._claim_lock:
+            if fcntl is None:
+                yield
+                return
+
+            with open(job_folder / cls.LOCK_FILENAME, 'a') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @classmethod
+    def claim(cls, tracker: JobTracker) -> bool:
+        """
+        Job 폴더에 진행 중인 작업이 없으면 tracker의 작업으로 선점
+
+        진행 여부 확인과 job.json 기록을 같은 잠금 안에서 수행하므로
+        같은 Job을 동시에 요청해도 한 요청만 선점한다. 선점에 성공하면
+        작업이 끝날 때까지 (finish/fail) 하트비트를 갱신한다.
+
+        Args:
+            tracker (JobTracker): 새 작업의 상태 기록기 (queued 상태)
+
+        Returns:
+            bool: 선점 성공 여부 (이미 진행 중인 작업이 있으면 False)
+        """
+        job_folder = tracker.path.parent
+
+        with cls._job_lock(job_folder):
+            if cls.is_active(job_folder):
+                return False
+            tracker.save()
+
+        tracker.start_heartbeat()
+        return True
+
+    @classmethod
+    def is_active(cls, job_folder: Path) -> bool:
+        """
+        대기 또는 처리 중인 작업이 있는지 확인
+
+        Args:
+            job_folder (Path): Job 폴더
+
+        Returns:
+            bool: 진행 중인 작업 존재 여부
+        """
+        state = cls.read_state(job_folder)
+        return state is not None and state.get('status') in ('queued', 'processing')
@@ -0,0 +1,180 @@
+"""양자화된 EXIF 격자에 대한 필름 매칭 결과 사전 계산 테이블"""
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Tuple
+import itertools
+import logging
+import time
+
+import numpy as np
+
+from backend.app.services.recipe_catalog import RecipeColumns, RecipeEntry
+
+logger = logging.getLogger(__name__)
+
+
+class MatchTable:
+    """
+    카탈로그 스냅샷 하나에 대한 (ISO, 조리개, 셔터, WB, 색온도) 격자별 상위 매칭 결과
+
+    - 조리개/셔터 속도: 점수 규칙의 경계값으로 구간을 나누므로 어떤 값이든
+      같은 구간이면 점수가 같다 (격자 밖이 없음).
+    - ISO: 표준 1/3 스톱 값, 색온도: EXIFExtractor가 만드는 값만 격자에 포함한다.
+      (ISO 감점과 색온도 차이는 연속 값이라 구간으로 묶을 수 없음)
+    - 화이트 밸런스: 점수 규칙이 구분하는 세 그룹 (텅스텐/주광/기타)
+
+    셀마다 반올림 전 점수와 레시피 인덱스를 점수 순으로 DEPTH개까지 저장하며,
+    격자 밖의 입력이나 DEPTH보다 큰 limit은 lookup()이 None을 반환한다.
+    """
+
+    # 셀별 저장할 상위 결과 수 (limit이 이보다 크면 직접 계산)
+    DEPTH = 10
+
+    ISO_STOPS = (
+        25, 32, 40, 50, 64, 80, 100, 125, 160, 200, 250, 320, 400, 500, 640, 800,
+        1000, 1250, 1600, 2000, 2500, 3200, 4000, 5000, 6400, 8000, 10000, 12800,
+        16000, 20000, 25600, 32000, 40000, 51200, 64000, 80000, 102400,
+    )
+    COLOR_TEMPERATURES = (3200, 4000, 5500, 6500, 7500)
+
+    # 점수 규칙의 경계값 (경계값 자체와 경계 사이 구간이 각각 하나의 구간)
+    APERTURE_BREAKS = (2.8, 4.0, 5.6, 8.0)
+    SHUTTER_BREAKS = (0.001, 1.0 / 60.0, 0.1)
+
+    # 구간 대표값 (구간 순서: 첫 경계 미만, 첫 경계, 사이, 두 번째 경계, ... 마지막 경계 초과)
+    APERTURE_SAMPLES = (2.0, 2.8, 3.5, 4.0, 4.5, 5.6, 6.3, 8.0, 11.0)
+    SHUTTER_SAMPLES = (1 / 2000, 0.001, 1 / 125, 1.0 / 60.0, 1 / 30, 0.1, 1.0)
+
+    # WB 그룹 대표값 (텅스텐, 주광, 기타)
+    WB_SAMPLES = ('Tungsten', 'Daylight', 'Cloudy')
+
+    def __init__(
+        self,
+        entries: Tuple[RecipeEntry, ...],
+        columns: RecipeColumns,
+        score_matrix: Callable[[List[Dict], RecipeColumns], np.ndarray],
+        rank: Callable[[np.ndarray, int], List[List[Tuple[int, float]]]],
+        tungsten_wb: Tuple[str, ...],
+        daylight_wb: Tuple[str, ...]
+    ):
+        """
+        Args:
+            entries (Tuple[RecipeEntry, ...]): 카탈로그 스냅샷
+            columns (RecipeColumns): 스냅샷의 열 배치
+            score_matrix (Callable): EXIF 목록 × 레시피 점수 행렬 계산 함수
+            rank (Callable): 점수 행렬의 행별 상위 (레시피 인덱스, 점수) 선택 함수
+            tungsten_wb (Tuple[str, ...]): 텅스텐 그룹 WB 문자열
+            daylight_wb (Tuple[str, ...]): 주광 그룹 WB 문자열
+        """
+        start = time.perf_counter()
+
+        self.entries = entries
+        self._tungsten_wb = tungsten_wb
+        self._daylight_wb = daylight_wb
+        self._iso_index = {iso: i for i, iso in enumerate(self.ISO_STOPS)}
+        self._temp_index = {temp: i for i, temp in enumerate(self.COLOR_TEMPERATURES)}
+        self.shape = (
+            len(self.ISO_STOPS), len(self.APERTURE_SAMPLES), len(self.SHUTTER_SAMPLES),
+            len(self.WB_SAMPLES), len(self.COLOR_TEMPERATURES),
+        )
+
+        # 셀 대표 EXIF (C 순서로 나열, 셀 번호 = np.ravel_multi_index)
+        grid = [
+            {
+                'iso': iso, 'aperture': aperture, 'shutter_speed': shutter,
+                'white_balance': wb, 'color_temperature': temp,
+            }
+            for iso, aperture, shutter, wb, temp in itertools.product(
+                self.ISO_STOPS, self.APERTURE_SAMPLES, self.SHUTTER_SAMPLES,
+                self.WB_SAMPLES, self.COLOR_TEMPERATURES
+            )
+        ]
+
+        self.depth = min(self.DEPTH, len(entries))
+        self.indices = np.full((len(grid), self.depth), -1, dtype=np.int32)
+        self.scores = np.zeros((len(grid), self.depth), dtype=np.float64)
+
+        if entries:
+            ranked = rank(score_matrix(grid, columns), self.depth)
+            for cell, row in enumerate(ranked):
+                for slot, (index, score) in enumerate(row):
+                    self.indices[cell, slot] = index
+                    self.scores[cell, slot] = score
+
+        self.indices.setflags(write=False)
+        self.scores.setflags(write=False)
+
+        logger.info(
+            f"Match table built: {len(grid)} cells x {self.depth} for {len(entries)} recipe(s) "
+            f"in {time.perf_counter() - start:.2f}s "
+            f"({(self.indices.nbytes + self.scores.nbytes) / 1024 / 1024:.1f}MB)"
+        )
+
+    @staticmethod
+    def _bucket(value: float, breaks: Tuple[float, ...]) -> int:
+        """경계값 기준 구간 번호 (경계 미만 0, 첫 경계 1, 사이 2, ...)"""
+        position = bisect_left(breaks, value)
+        if position < len(breaks) and breaks[position] == value:
+            return 2 * position + 1
+        return 2 * position
+
+    def cell(self, exif_data: Dict) -> Optional[int]:
+        """
+        EXIF 데이터의 셀 번호
+
+        Args:
+            exif_data (Dict): EXIF 메타데이터 (누락 항목은 점수 계산과 같은 기본값)
+
+        Returns:
+            Optional[int]: 셀 번호 (격자 밖이면 None)
+        """
+        iso_index = self._iso_index.get(exif_data.get('iso', 200))
+        temp_index = self._temp_index.get(exif_data.get('color_temperature', 5500))
+        if iso_index is None or temp_index is None:
+            return None
+
+        wb = exif_data.get('white_balance', 'Auto')
+        if wb in self._tungsten_wb:
+            wb_index = 0
+        elif wb in self._daylight_wb:
+            wb_index = 1
+        else:
+            wb_index = 2
+
+        try:
+            aperture_index = self._bucket(exif_data.get('aperture', 5.6), self.APERTURE_BREAKS)
+            shutter_index = self._bucket(
+                exif_data.get('shutter_speed', 0.008), self.SHUTTER_BREAKS
+            )
+        except TypeError:
+            return None
+
+        return int(np.ravel_multi_index(
+            (iso_index, aperture_index, shutter_index, wb_index, temp_index), self.shape
+        ))
+
+    def lookup(self, exif_data: Dict, limit: int) -> Optional[List[Tuple[RecipeEntry, float]]]:
+        """
+        상위 매칭 결과 조회
+
+        Args:
+            exif_data (Dict): EXIF 메타데이터
+            limit (int): 반환할 개수
+
+        Returns:
+            Optional[List[Tuple[RecipeEntry, float]]]: (레시피, 반올림 전 점수) 목록 - 점수 순
+                (격자 밖이거나 limit이 저장 범위를 넘으면 None)
+        """
+        if limit < 0 or (limit > self.depth and len(self.entries) > self.depth):
+            return None
+
+        cell = self.cell(exif_data)
+        if cell is None:
+            return None
+
+        count = min(limit, self.depth)
+        return [
+            (self.entries[index], score)
+            for index, score in zip(
+                self.indices[cell, :count].tolist(), self.scores[cell, :count].tolist()
+            )
+        ]
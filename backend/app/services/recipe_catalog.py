@@ -0,0 +1,251 @@
+"""필름 매칭용 레시피 카탈로그 (프로세스별 불변 스냅샷)"""
+from typing import Any, Optional, Tuple
+import logging
+import threading
+import time
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload
+
+from backend.config import Config
+from backend.app.models.film import Film
+from backend.app.models.recipe import FilmRecipe
+
+logger = logging.getLogger(__name__)
+
+
+class RecipeEntry:
+    """
+    매칭에 필요한 필름/레시피 속성과 점수 규칙을 미리 풀어 둔 레코드
+
+    ORM 객체와 달리 지연 로딩이나 DB 세션이 필요 없고,
+    필름 이름 부분 문자열 검사는 생성 시 한 번만 수행한다.
+    """
+
+    __slots__ = (
+        'film_id', 'film_name', 'manufacturer', 'tier', 'film_type', 'iso_base',
+        'recipe_id', 'recipe_name', 'matching_reason',
+        'iso_min', 'iso_max', 'iso_divisor', 'film_temp',
+        'is_color', 'is_tungsten', 'has_reciprocity',
+        'aperture_rule', 'low_light_rule',
+    )
+
+    # 조리개 점수 규칙 (필름 이름 부분 문자열, 규칙 이름) - 위에서부터 먼저 일치한 규칙 적용
+    APERTURE_RULES = (
+        (('Velvia',), 'landscape'),
+        (('Portra',), 'portrait'),
+        (('Provia',), 'versatile'),
+        (('Ektar',), 'landscape_fine'),
+        (('Ektachrome',), 'neutral'),
+        (('Gold', 'UltraMax'), 'consumer'),
+        (('ProImage',), 'budget'),
+        (('T-Max 400',), 'bw_fast'),
+        (('Rollei', 'RPX'), 'bw_classic'),
+    )
+
+    def __init__(self, recipe: FilmRecipe, film: Film):
+        """
+        Args:
+            recipe (FilmRecipe): 레시피 (세션이 열려 있는 동안 호출)
+            film (Film): 레시피의 필름
+        """
+        name = film.name or ''
+
+        self.film_id = recipe.film_id
+        self.film_name = film.name
+        self.manufacturer = film.manufacturer
+        self.tier = film.tier
+        self.film_type = film.type
+        self.iso_base = film.iso_base
+        self.recipe_id = recipe.id
+        self.recipe_name = recipe.recipe_name
+        self.matching_reason = recipe.matching_reason
+
+        # ISO 범위 (레시피 값이 없으면 필름 기준 감도)
+        self.iso_min = recipe.iso_min or film.iso_base
+        self.iso_max = recipe.iso_max or film.iso_base
+        self.iso_divisor = film.iso_base or 100  # Division by zero 방지
+
+        self.film_temp = recipe.color_temperature or 5500
+        self.is_color = film.type == 'color'
+        self.is_tungsten = 'Vision3' in name and '500T' in name
+        self.has_reciprocity = bool(recipe.reciprocity_failure)
+
+        self.aperture_rule = next(
+            (rule for keywords, rule in self.APERTURE_RULES if any(k in name for k in keywords)),
+            'default'
+        )
+
+        if self.is_tungsten:
+            self.low_light_rule = 'tungsten'
+        elif 'Portra' in name and film.iso_base == 400:
+            self.low_light_rule = 'portra_400'
+        elif film.iso_base < 200:
+            self.low_light_rule = 'slow'
+        else:
+            self.low_light_rule = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # 생성자에서 한 번만 설정 (스냅샷 불변성 유지)
+        if hasattr(self, name):
+            raise AttributeError(f"RecipeEntry is immutable: {name}")
+        object.__setattr__(self, name, value)
+
+    def __repr__(self):
+        return f'<RecipeEntry {self.recipe_name} for {self.film_name}>'
+
+
+class RecipeColumns:
+    """
+    스냅샷의 레시피 속성을 열(NumPy 배열)로 배치한 레코드 (배치 매칭용)
+
+    규칙 속성은 APERTURE_RULES/LOW_LIGHT_RULES의 인덱스로 인코딩한다.
+    """
+
+    __slots__ = (
+        'iso_min', 'iso_max', 'iso_divisor', 'iso_base', 'film_temp',
+        'is_color', 'is_tungsten', 'has_reciprocity',
+        'aperture_rule', 'low_light_rule',
+    )
+
+    APERTURE_RULES = ('default',) + tuple(rule for _, rule in RecipeEntry.APERTURE_RULES)
+    LOW_LIGHT_RULES = (None, 'tungsten', 'portra_400', 'slow')
+
+    def __init__(self, entries: Tuple[RecipeEntry, ...]):
+        """
+        Args:
+            entries (Tuple[RecipeEntry, ...]): 카탈로그 레코드
+        """
+        def column(values, dtype):
+            array = np.array(values, dtype=dtype)
+            array.setflags(write=False)
+            return array
+
+        self.iso_min = column([e.iso_min for e in entries], np.int64)
+        self.iso_max = column([e.iso_max for e in entries], np.int64)
+        self.iso_divisor = column([e.iso_divisor for e in entries], np.int64)
+        self.iso_base = column([e.iso_base for e in entries], np.int64)
+        self.film_temp = column([e.film_temp for e in entries], np.int64)
+        self.is_color = column([e.is_color for e in entries], bool)
+        self.is_tungsten = column([e.is_tungsten for e in entries], bool)
+        self.has_reciprocity = column([e.has_reciprocity for e in entries], bool)
+        self.aperture_rule = column(
+            [self.APERTURE_RULES.index(e.aperture_rule) for e in entries], np.intp
+        )
+        self.low_light_rule = column(
+            [self.LOW_LIGHT_RULES.index(e.low_light_rule) for e in entries], np.intp
+        )
+
+
+class RecipeCatalog:
+    """
+    활성 레시피의 불변 스냅샷을 프로세스별로 보관하는 클래스
+
+    스냅샷은 첫 매칭 시 한 번의 조인 쿼리로 만들어지며, 이후 매칭은
+    SQL 없이 스냅샷만 사용한다. CATALOG_CHECK_INTERVAL초마다 레시피/필름의
+    개수와 updated_at 최댓값을 확인해 바뀌었으면 다시 만든다.
+    invalidate()를 호출하면 다음 조회에서 즉시 다시 만든다.
+    """
+
+    _entries: Optional[Tuple[RecipeEntry, ...]] = None
+    _columns: Optional[Tuple[Tuple[RecipeEntry, ...], RecipeColumns]] = None
+    _fingerprint: Optional[Tuple] = None
+    _checked_at = 0.0
+    _version = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def entries(cls) -> Tuple[RecipeEntry, ...]:
+        """
+        현재 스냅샷 반환 (없거나 오래되었으면 다시 생성, 앱 컨텍스트 필요)
+
+        Returns:
+            Tuple[RecipeEntry, ...]: 활성 레시피 레코드 (레시피 ID 순)
+        """
+        entries = cls._entries
+        now = time.monotonic()
+
+        if entries is not None and now - cls._checked_at < Config.CATALOG_CHECK_INTERVAL:
+            return entries
+
+        with cls._lock:
+            if cls._entries is not None and now - cls._checked_at < Config.CATALOG_CHECK_INTERVAL:
+                return cls._entries
+
+            fingerprint = cls.fingerprint()
+            if cls._entries is None or fingerprint != cls._fingerprint:
+                cls._entries = cls._build()
+                cls._fingerprint = fingerprint
+                cls._version += 1
+                logger.info(
+                    f"Recipe catalog v{cls._version} built: {len(cls._entries)} active recipe(s)"
+                )
+
+            cls._checked_at = time.monotonic()
+            return cls._entries
+
+    @classmethod
+    def columns(cls) -> Tuple[Tuple[RecipeEntry, ...], RecipeColumns]:
+        """
+        현재 스냅샷과 열 배치 반환 (스냅샷이 바뀌면 다시 생성)
+
+        Returns:
+            Tuple[Tuple[RecipeEntry, ...], RecipeColumns]: (레코드, 열 배치) - 같은 스냅샷 기준
+        """
+        entries = cls.entries()
+        cached = cls._columns
+
+        if cached is None or cached[0] is not entries:
+            cached = (entries, RecipeColumns(entries))
+            cls._columns = cached
+
+        return cached
+
+    @classmethod
+    def version(cls) -> int:
+        """스냅샷 버전 (다시 만들 때마다 증가)"""
+        return cls._version
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """스냅샷 폐기 (다음 조회 시 다시 생성)"""
+        with cls._lock:
+            cls._entries = None
+            cls._fingerprint = None
+            cls._checked_at = 0.0
+
+    @staticmethod
+    def fingerprint() -> Tuple:
+        """
+        레시피/필름 변경 감지용 값 (개수, updated_at 최댓값, 앱 컨텍스트 필요)
+
+        카탈로그에서 파생된 다른 캐시(FilmCatalog 등)도 같은 값으로 변경을 감지한다.
+
+        Returns:
+            Tuple: 비교용 값
+        """
+        recipe_stats = FilmRecipe.query.with_entities(
+            func.count(FilmRecipe.id), func.max(FilmRecipe.updated_at)
+        ).one()
+        film_stats = Film.query.with_entities(
+            func.count(Film.id), func.max(Film.updated_at)
+        ).one()
+        return tuple(recipe_stats) + tuple(film_stats)
+
+    @staticmethod
+    def _build() -> Tuple[RecipeEntry, ...]:
+        """
+        활성 레시피와 필름을 한 번의 조인 쿼리로 읽어 레코드 생성
+
+        Returns:
+            Tuple[RecipeEntry, ...]: 활성 레시피 레코드
+        """
+        recipes = (
+            FilmRecipe.query
+            .options(joinedload(FilmRecipe.film))
+            .filter_by(is_active=True)
+            .order_by(FilmRecipe.id)
+            .all()
+        )
+        return tuple(RecipeEntry(recipe, recipe.film) for recipe in recipes)
@@ -0,0 +1,326 @@
+"""콘텐츠 주소 기반 렌더링 결과 캐시 (Job 간 공유)"""
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from backend.config import Config
+from backend.app.services.image_processor import ImageProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class RenderCache:
+    """
+    입력 이미지 바이트와 유효 렌더링 파라미터의 해시를 키로 하는 디스크 캐시
+
+    캐시 항목은 RENDER_CACHE_DIR/<키 앞 2자리>/<키><확장자>에 저장되며,
+    Job의 processed 폴더로는 하드 링크(불가능하면 복사)로 전달된다.
+    적중 시 파일 mtime을 갱신하고, 전체 크기가 RENDER_CACHE_MAX_BYTES를
+    넘으면 mtime이 가장 오래된 항목부터 삭제한다 (LRU).
+    디스크 기반이므로 gunicorn 워커 프로세스 간에 공유되며,
+    적중률 통계는 프로세스별로 집계된다.
+    """
+
+    # 렌더링 결과가 달라지는 파이프라인 변경 시 증가 (기존 캐시 무효화)
+    PIPELINE_VERSION = 1
+
+    # 해시 계산 시 읽기 단위
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    # 키에 포함되는 레시피 항목 (grain_mode/grain_seed는 make_key에서 정규화)
+    RECIPE_KEYS = (
+        'film_name', 'type', 'grain_intensity',
+        'bw_weight_r', 'bw_weight_g', 'bw_weight_b',
+        'tone_curve',
+    )
+
+    _lock = threading.Lock()
+    _current_bytes: Optional[int] = None
+
+    # 통계 (프로세스별)
+    hits = 0
+    misses = 0
+    stores = 0
+    evictions = 0
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """캐시 사용 여부 (RENDER_CACHE_MAX_BYTES > 0)"""
+        return Config.RENDER_CACHE_MAX_BYTES > 0
+
+    @classmethod
+    def file_digest(cls, path: Path) -> str:
+        """
+        파일 내용 SHA-256 해시
+
+        Args:
+            path (Path): 파일 경로
+
+        Returns:
+            str: 16진수 해시
+        """
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(cls.HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def is_cacheable(film_recipe: Dict[str, Any]) -> bool:
+        """
+        렌더링 결과가 입력과 파라미터만으로 정해지는지 확인
+
+        'tile' 모드에서 grain_seed가 없으면 렌더링마다 그레인 오프셋이 달라지므로
+        캐시하지 않는다 (캐시하면 첫 렌더링의 오프셋이 계속 재사용됨).
+
+        Args:
+            film_recipe (Dict[str, Any]): 필름 레시피 정보
+
+        Returns:
+            bool: 캐시 가능 여부
+        """
+        return not (
+            film_recipe.get('grain_mode', ImageProcessor.GRAIN_MODE) == 'tile'
+            and film_recipe.get('grain_seed') is None
+            and ImageProcessor.grain_texture_path(film_recipe) is not None
+        )
+
+    @staticmethod
+    def _grain_fingerprint(film_recipe: Dict[str, Any]) -> Optional[Tuple[str, int, int]]:
+        """
+        그레인 텍스처 식별 값 (파일명, 수정 시각, 크기)
+
+        텍스처를 다시 만들면 값이 바뀌므로 PIPELINE_VERSION을 올리지 않아도
+        이전 텍스처로 만든 렌더링은 적중하지 않는다 (.npy 에셋은 PNG에서 컴파일됨).
+
+        Args:
+            film_recipe (Dict[str, Any]): 필름 레시피 정보
+
+        Returns:
+            Optional[Tuple[str, int, int]]: 식별 값 (그레인 미사용이면 None, 파일이 없으면 크기 -1)
+        """
+        grain_path = ImageProcessor.grain_texture_path(film_recipe)
+        if grain_path is None:
+            return None
+
+        try:
+            stat = grain_path.stat()
+        except OSError:
+            return (grain_path.name, 0, -1)
+        return (grain_path.name, stat.st_mtime_ns, stat.st_size)
+
+    @classmethod
+    def make_key(
+        cls,
+        input_digest: str,
+        film_recipe: Dict[str, Any],
+        encoder: Dict[str, Any],
+        full_resolution: bool
+    ) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            input_digest (str): 입력 이미지 해시 (file_digest 결과)
+            film_recipe (Dict[str, Any]): 필름 레시피 정보
+            encoder (Dict[str, Any]): ImageEncoder.resolve() 설정
+            full_resolution (bool): 원본 해상도 렌더링 여부
+
+        Returns:
+            str: 캐시 키 (16진수 SHA-256)
+        """
+        recipe = {key: film_recipe.get(key) for key in cls.RECIPE_KEYS}
+        recipe['grain_mode'] = film_recipe.get('grain_mode', ImageProcessor.GRAIN_MODE)
+        # grain_seed는 'tile' 모드의 오프셋에만 영향 ('resize' 모드에서는 같은 결과)
+        recipe['grain_seed'] = film_recipe.get('grain_seed') if recipe['grain_mode'] == 'tile' else None
+
+        params = {
+            'version': cls.PIPELINE_VERSION,
+            'input': input_digest,
+            'recipe': recipe,
+            'grain': cls._grain_fingerprint(film_recipe),
+            'encoder': encoder,
+            'full_resolution': full_resolution,
+            'max_dimension': ImageProcessor.MAX_DIMENSION,
+            'gamma_mode': ImageProcessor.GAMMA_MODE,
+        }
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _entry_path(cls, key: str, suffix: str) -> Path:
+        """캐시 항목 경로"""
+        return Config.RENDER_CACHE_DIR / key[:2] / f"{key}{suffix}"
+
+    @classmethod
+    def fetch(cls, key: str, output_file: Path) -> bool:
+        """
+        캐시 적중 시 결과를 출력 경로로 링크 (또는 복사)
+
+        Args:
+            key (str): 캐시 키
+            output_file (Path): 출력 파일 경로 (확장자로 항목 구분)
+
+        Returns:
+            bool: 적중 여부
+        """
+        entry = cls._entry_path(key, output_file.suffix)
+
+        try:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            output_file.unlink(missing_ok=True)
+            cls._link_or_copy(entry, output_file)
+            # LRU 순서 갱신
+            os.utime(entry)
+        except FileNotFoundError:
+            with cls._lock:
+                cls.misses += 1
+            return False
+        except OSError as e:
+            logger.warning(f"Render cache read failed for {entry.name}: {e}")
+            with cls._lock:
+                cls.misses += 1
+            return False
+
+        with cls._lock:
+            cls.hits += 1
+        logger.debug(f"Render cache hit: {entry.name} -> {output_file.name}")
+        return True
+
+    @classmethod
+    def store(cls, key: str, output_file: Path) -> None:
+        """
+        렌더링 결과를 캐시에 저장 (실패해도 예외를 전달하지 않음)
+
+        Args:
+            key (str): 캐시 키
+            output_file (Path): 렌더링된 출력 파일
+        """
+        entry = cls._entry_path(key, output_file.suffix)
+
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry.parent, prefix='.entry.')
+            os.close(fd)
+            try:
+                os.unlink(tmp_path)
+                cls._link_or_copy(output_file, Path(tmp_path))
+                os.replace(tmp_path, entry)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+            size = entry.stat().st_size
+        except OSError as e:
+            logger.warning(f"Render cache store failed for {output_file.name}: {e}")
+            return
+
+        with cls._lock:
+            cls.stores += 1
+            if cls._current_bytes is not None:
+                cls._current_bytes += size
+            over_budget = cls._current_bytes is None \
+                or cls._current_bytes > Config.RENDER_CACHE_MAX_BYTES
+
+        if over_budget:
+            cls.evict()
+
+    @classmethod
+    def evict(cls) -> int:
+        """
+        예산을 넘는 만큼 가장 오래 사용되지 않은 항목 삭제
+
+        다른 워커 프로세스의 저장분도 반영되도록 디렉터리를 다시 스캔한다.
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        with cls._lock:
+            entries = cls._scan()
+            total = sum(size for _, _, size in entries)
+            removed = 0
+
+            for path, _, size in sorted(entries, key=lambda entry: entry[1]):
+                if total <= Config.RENDER_CACHE_MAX_BYTES:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Render cache eviction failed for {path.name}: {e}")
+                    continue
+                total -= size
+                removed += 1
+
+            cls._current_bytes = total
+            cls.evictions += removed
+
+        if removed:
+            logger.info(f"Render cache evicted {removed} entr(ies), {total / 1024 / 1024:.1f}MB in use")
+
+        return removed
+
+    @classmethod
+    def _scan(cls) -> List[Tuple[Path, float, int]]:
+        """
+        캐시 항목 목록
+
+        Returns:
+            List[Tuple[Path, float, int]]: (경로, mtime, 크기) 목록
+        """
+        entries = []
+        root = Config.RENDER_CACHE_DIR
+
+        if not root.is_dir():
+            return entries
+
+        for path in root.glob('*/*'):
+            if path.name.startswith('.'):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+
+        return entries
+
+    @staticmethod
+    def _link_or_copy(source: Path, target: Path) -> None:
+        """하드 링크 생성 (다른 파일 시스템 등으로 실패하면 복사)"""
+        try:
+            os.link(source, target)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            shutil.copyfile(source, target)
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        """
+        캐시 통계 (프로세스별)
+
+        Returns:
+            Dict[str, Any]: hits, misses, hit_rate, stores, evictions, bytes
+        """
+        with cls._lock:
+            lookups = cls.hits + cls.misses
+            return {
+                'hits': cls.hits,
+                'misses': cls.misses,
+                'hit_rate': round(cls.hits / lookups, 3) if lookups else 0.0,
+                'stores': cls.stores,
+                'evictions': cls.evictions,
+                'bytes': cls._current_bytes,
+            }
@@ -0,0 +1,460 @@
+"""필름 렌더링 프로세스 풀 (공유 메모리 입력)"""
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context, shared_memory
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+import signal
+import struct
+import threading
+import time
+
+import numpy as np
+
+from backend.config import Config
+from backend.app.services.image_processor import ImageProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class _RenderTimeout(BaseException):
+    """
+    워커 프로세스의 렌더링 제한 시간 초과 (SIGALRM 핸들러에서 발생)
+
+    처리 단계의 오류 변환(ImageProcessor._handle_errors)에 잡히지 않도록
+    KeyboardInterrupt처럼 BaseException을 상속한다.
+    """
+
+
+def _raise_timeout(signum: int, frame: Any) -> None:
+    """SIGALRM 핸들러"""
+    raise _RenderTimeout()
+
+
+def _render_task(
+    shm_name: str,
+    shape: Tuple[int, ...],
+    dtype: str,
+    output_path: str,
+    film_recipe: Dict,
+    memory_budget: Optional[int],
+    encoder: Optional[Dict[str, Any]] = None,
+    timeout: Optional[float] = None,
+    started: Optional[Tuple[str, int]] = None
+) -> Dict[str, Any]:
+    """
+    워커 프로세스에서 실행되는 단일 필름 렌더링
+
+    입력 이미지는 피클링하지 않고 공유 메모리 블록에 연결해 읽기 전용으로 사용한다.
+    제한 시간은 작업이 워커에서 시작될 때부터 계산하며 (SIGALRM 타이머),
+    초과하면 렌더링을 중단하고 쓰다 만 출력 파일을 삭제한 뒤 워커 슬롯을 반환한다.
+
+    Args:
+        shm_name (str): 공유 메모리 블록 이름
+        shape (Tuple[int, ...]): 입력 배열 shape
+        dtype (str): 입력 배열 dtype
+        output_path (str): 출력 이미지 경로
+        film_recipe (Dict): 필름 레시피 정보
+        memory_budget (Optional[int]): 밴드 작업 메모리 예산 (bytes)
+        encoder (Optional[Dict[str, Any]]): ImageEncoder.resolve() 설정
+        timeout (Optional[float]): 제한 시간 (초, None이면 제한 없음)
+        started (Optional[Tuple[str, int]]): 시작 시각을 기록할 (공유 메모리 블록 이름, 슬롯 번호)
+
+    Returns:
+        Dict[str, Any]: ImageProcessor.apply_film_simulations의 필름별 결과와 같은 형식
+    """
+    film_start = time.perf_counter()
+
+    # 호출 측이 실제 시작 시점부터 응답 대기 시간을 계산하도록 시작 시각 기록
+    if started is not None:
+        status = shared_memory.SharedMemory(name=started[0])
+        try:
+            struct.pack_into('d', status.buf, started[1] * 8, time.time())
+        finally:
+            status.close()
+
+    # 풀 워커는 작업을 메인 스레드에서 실행하므로 SIGALRM으로 중단할 수 있다
+    use_alarm = bool(timeout) and hasattr(signal, 'setitimer')
+
+    try:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, _raise_timeout)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+
+        return _render_shared(
+            shm_name, shape, dtype, Path(output_path), film_recipe, memory_budget, encoder
+        )
+
+    except _RenderTimeout:
+        # 인코더가 출력 경로에 직접 쓰므로 중단된 파일 삭제
+        Path(output_path).unlink(missing_ok=True)
+        return {
+            'output_path': output_path,
+            'status': 'failed',
+            'processing_time': time.perf_counter() - film_start,
+            'error': f'Render timed out after {timeout}s'
+        }
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _render_shared(
+    shm_name: str,
+    shape: Tuple[int, ...],
+    dtype: str,
+    output_file: Path,
+    film_recipe: Dict,
+    memory_budget: Optional[int],
+    encoder: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    공유 메모리 입력으로 필름 하나 렌더링 (_render_task 참고)
+
+    Returns:
+        Dict[str, Any]: 필름별 결과 (처리 단계 오류는 failed 결과로 반환)
+    """
+    film_start = time.perf_counter()
+    film_stages: Dict[str, float] = {}
+    shm = None
+
+    try:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        img_rgb = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        img_rgb.setflags(write=False)
+
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with ImageProcessor._handle_errors():
+            ImageProcessor._render_film(
+                img_rgb, output_file, film_recipe, film_stages,
+                memory_budget=memory_budget, encoder=encoder
+            )
+
+        del img_rgb
+        return {
+            'output_path': str(output_file),
+            'status': 'success',
+            'processing_time': time.perf_counter() - film_start,
+            'stages': film_stages
+        }
+
+    except Exception as e:
+        return {
+            'output_path': str(output_file),
+            'status': 'failed',
+            'processing_time': time.perf_counter() - film_start,
+            'error': str(e)
+        }
+    finally:
+        if shm is not None:
+            shm.close()
+
+
+class RenderExecutor:
+    """
+    필름 렌더링을 프로세스 풀로 병렬 처리하는 클래스
+
+    디코딩은 요청 프로세스에서 한 번만 수행하고, 디코딩된 uint8 버퍼를
+    multiprocessing.shared_memory로 워커에 전달한다.
+    풀은 첫 사용 시 생성되며 (gunicorn fork 이후) 프로세스마다 하나씩 존재한다.
+    """
+
+    _executor: Optional[ProcessPoolExecutor] = None
+    _lock = threading.Lock()
+
+    # 결과 대기 중 작업 완료 확인 주기 (초)
+    POLL_INTERVAL = 0.5
+    # 워커가 제한 시간을 넘기고도 응답하지 않을 때 풀을 교체하기 전 추가 대기 시간 (초)
+    UNRESPONSIVE_GRACE = 10.0
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """프로세스 풀 사용 여부 (RENDER_POOL_SIZE > 0)"""
+        return Config.RENDER_POOL_SIZE > 0
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        """
+        프로세스 풀 반환 (없으면 생성)
+
+        Returns:
+            ProcessPoolExecutor: 렌더링 프로세스 풀
+        """
+        with cls._lock:
+            if cls._executor is None:
+                max_tasks = Config.RENDER_WORKER_MAX_TASKS or None
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=Config.RENDER_POOL_SIZE,
+                    mp_context=get_context(Config.RENDER_POOL_START_METHOD),
+                    max_tasks_per_child=max_tasks
+                )
+                logger.info(
+                    f"Render pool started: {Config.RENDER_POOL_SIZE} worker(s), "
+                    f"recycle after {max_tasks or 'unlimited'} task(s)"
+                )
+            return cls._executor
+
+    @classmethod
+    def _reset_executor(cls, executor: ProcessPoolExecutor) -> None:
+        """
+        손상된 프로세스 풀 폐기 (다음 요청에서 다시 생성)
+
+        Args:
+            executor (ProcessPoolExecutor): 폐기할 풀 (이미 교체되었으면 새 풀은 유지)
+        """
+        with cls._lock:
+            if cls._executor is executor:
+                cls._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _terminate_executor(cls, executor: ProcessPoolExecutor) -> None:
+        """
+        응답 없는 워커를 포함해 프로세스 풀 강제 종료 (다음 요청에서 다시 생성)
+
+        이 풀을 함께 쓰던 다른 작업의 Future는 BrokenProcessPool로 끝난다.
+
+        Args:
+            executor (ProcessPoolExecutor): 종료할 풀
+        """
+        with cls._lock:
+            if cls._executor is executor:
+                cls._executor = None
+
+        terminate_workers = getattr(executor, 'terminate_workers', None)
+        if terminate_workers is not None:
+            terminate_workers()
+            logger.warning("Render pool terminated (unresponsive worker)")
+            return
+
+        # Python 3.14 이전에는 공개 API가 없어 워커 프로세스를 직접 종료
+        processes = list((getattr(executor, '_processes', None) or {}).values())
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(timeout=5)
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning("Render pool terminated (unresponsive worker)")
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """프로세스 풀 종료"""
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=True, cancel_futures=True)
+                cls._executor = None
+
+    @classmethod
+    def apply_film_simulations(
+        cls,
+        input_path: str,
+        outputs: List[Tuple[str, Dict]],
+        full_resolution: bool = False,
+        memory_budget: Optional[int] = None,
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        encoder: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        여러 필름 시뮬레이션을 프로세스 풀에서 병렬로 적용
+
+        ImageProcessor.apply_film_simulations와 같은 인자와 반환 형식을 사용한다.
+        필름별 타임아웃은 RENDER_TASK_TIMEOUT이며 작업이 워커에서 시작될 때부터
+        계산한다 (다른 Job의 작업이 풀을 차지해 대기한 시간은 포함하지 않음).
+
+        Args:
+            input_path (str): 입력 이미지 경로
+            outputs (List[Tuple[str, Dict]]): (출력 경로, 필름 레시피) 목록
+            full_resolution (bool): True면 MAX_DIMENSION 축소 없이 원본 해상도로 처리
+            memory_budget (Optional[int]): 밴드 작업 메모리 예산 (bytes)
+            on_result (Optional[Callable]): 필름 결과를 받을 때마다 (인덱스, 결과)로 호출
+            encoder (Optional[Dict[str, Any]]): ImageEncoder.resolve() 설정
+
+        Returns:
+            Dict[str, Any]: shared_time, stages, results
+
+        Raises:
+            ValueError: 입력 검증 실패
+            IOError: 파일 읽기 실패
+            RuntimeError: 공유 단계 처리 실패
+        """
+        input_file = Path(input_path)
+        ImageProcessor._validate_input_file(input_file)
+
+        stages: Dict[str, float] = {}
+        shared_start = time.perf_counter()
+
+        with ImageProcessor._handle_errors():
+            img_rgb = ImageProcessor._load_image(input_file, stages, full_resolution=full_resolution)
+
+        # 공유 메모리로 복사 (피클링 없이 워커에 전달)
+        share_start = time.perf_counter()
+        shm = shared_memory.SharedMemory(create=True, size=max(1, img_rgb.nbytes))
+
+        try:
+            shape, dtype = img_rgb.shape, img_rgb.dtype.str
+            shared = np.ndarray(shape, dtype=img_rgb.dtype, buffer=shm.buf)
+            shared[...] = img_rgb
+            del shared, img_rgb
+            stages['share'] = time.perf_counter() - share_start
+
+            shared_time = time.perf_counter() - shared_start
+            results = cls._run_tasks(
+                shm.name, shape, dtype, input_file, outputs, memory_budget,
+                on_result, encoder
+            )
+
+        finally:
+            shm.close()
+            shm.unlink()
+
+        return {
+            'shared_time': shared_time,
+            'stages': stages,
+            'results': results
+        }
+
+    @classmethod
+    def _run_tasks(
+        cls,
+        shm_name: str,
+        shape: Tuple[int, ...],
+        dtype: str,
+        input_file: Path,
+        outputs: List[Tuple[str, Dict]],
+        memory_budget: Optional[int],
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+        encoder: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        필름별 렌더링 작업 제출 및 결과 수집 (입력 순서 유지)
+
+        Args:
+            shm_name (str): 입력 이미지 공유 메모리 블록 이름
+            shape (Tuple[int, ...]): 입력 배열 shape
+            dtype (str): 입력 배열 dtype
+            input_file (Path): 입력 파일 경로 (로그용)
+            outputs (List[Tuple[str, Dict]]): (출력 경로, 필름 레시피) 목록
+            memory_budget (Optional[int]): 밴드 작업 메모리 예산 (bytes)
+            on_result (Optional[Callable]): 필름 결과를 받을 때마다 (인덱스, 결과)로 호출
+            encoder (Optional[Dict[str, Any]]): ImageEncoder.resolve() 설정
+
+        Returns:
+            List[Dict[str, Any]]: 필름별 결과
+        """
+        timeout = Config.RENDER_TASK_TIMEOUT
+        executor = cls._get_executor()
+
+        # 작업별 시작 시각 (워커가 기록, 0이면 아직 풀에서 대기 중)
+        status = shared_memory.SharedMemory(create=True, size=8 * max(1, len(outputs)))
+        status.buf[:] = bytes(status.size)
+
+        try:
+            futures: List[Future] = [
+                executor.submit(
+                    _render_task, shm_name, shape, dtype,
+                    output_path, film_recipe, memory_budget, encoder, timeout,
+                    (status.name, index)
+                )
+                for index, (output_path, film_recipe) in enumerate(outputs)
+            ]
+
+            results = cls._collect_results(executor, futures, status, input_file, outputs, on_result)
+        finally:
+            status.close()
+            status.unlink()
+
+        return results
+
+    @classmethod
+    def _collect_results(
+        cls,
+        executor: ProcessPoolExecutor,
+        futures: List[Future],
+        status: shared_memory.SharedMemory,
+        input_file: Path,
+        outputs: List[Tuple[str, Dict]],
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        완료되는 순서대로 필름별 결과 수집
+
+        제한 시간은 워커가 작업 시작 시점부터 직접 적용한다 (풀에서 대기한 시간 제외).
+        호출 측은 워커가 시작 후 RENDER_TASK_TIMEOUT + UNRESPONSIVE_GRACE가 지나도
+        응답하지 않으면 풀을 강제 종료하고 다시 만든다 (슬롯 점유와 늦은 출력 쓰기 방지).
+
+        Args:
+            executor (ProcessPoolExecutor): 작업을 제출한 풀
+            futures (List[Future]): 필름별 작업 Future
+            status (shared_memory.SharedMemory): 작업별 시작 시각 (time.time(), 0이면 대기 중)
+            input_file (Path): 입력 파일 경로 (로그용)
+            outputs (List[Tuple[str, Dict]]): (출력 경로, 필름 레시피) 목록
+            on_result (Optional[Callable]): 필름 결과를 받을 때마다 (인덱스, 결과)로 호출
+
+        Returns:
+            List[Dict[str, Any]]: 필름별 결과 (입력 순서)
+        """
+        timeout = Config.RENDER_TASK_TIMEOUT
+        pending = dict(enumerate(futures))
+        results: List[Optional[Dict[str, Any]]] = [None] * len(futures)
+        pool_broken = False
+        hung_outputs: List[str] = []
+
+        while pending:
+            done, _ = wait(list(pending.values()), timeout=cls.POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            now = time.time()
+
+            for index in list(pending):
+                future = pending[index]
+                output_path = outputs[index][0]
+                started_at = struct.unpack_from('d', status.buf, index * 8)[0]
+
+                if future in done:
+                    try:
+                        results[index] = future.result()
+                        if results[index].get('error', '').startswith('Render timed out'):
+                            logger.error(f"Render timed out for {output_path} ({input_file.name})")
+                    except BrokenProcessPool as e:
+                        pool_broken = True
+                        logger.error(f"Render worker crashed for {output_path}: {e}")
+                        results[index] = {
+                            'output_path': output_path,
+                            'status': 'failed',
+                            'error': 'Render worker crashed'
+                        }
+                    except Exception as e:
+                        # 워커 밖에서 난 오류 (작업 인자 피클링 실패 등)는 이 필름만 실패 처리
+                        logger.error(f"Render task failed for {output_path}: {e}", exc_info=True)
+                        results[index] = {
+                            'output_path': output_path,
+                            'status': 'failed',
+                            'error': str(e)
+                        }
+                elif timeout and started_at and now - started_at > timeout + cls.UNRESPONSIVE_GRACE:
+                    hung_outputs.append(output_path)
+                    logger.error(f"Render worker unresponsive for {output_path} ({input_file.name})")
+                    results[index] = {
+                        'output_path': output_path,
+                        'status': 'failed',
+                        'error': f'Render timed out after {timeout}s'
+                    }
+                else:
+                    continue
+
+                del pending[index]
+                if on_result is not None:
+                    on_result(index, results[index])
+
+            if hung_outputs:
+                # 응답 없는 워커는 슬롯을 계속 차지하고 나중에 출력을 쓸 수 있으므로
+                # 풀을 교체하고 쓰다 만 출력 삭제 (이 호출의 남은 작업은 BrokenProcessPool로 끝남)
+                cls._terminate_executor(executor)
+                for hung_output in hung_outputs:
+                    Path(hung_output).unlink(missing_ok=True)
+                hung_outputs.clear()
+
+        if pool_broken:
+            cls._reset_executor(executor)
+
+        return results
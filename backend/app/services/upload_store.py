@@ -0,0 +1,313 @@
+"""업로드 원본 콘텐츠 저장소 (해시 기반 중복 제거 + 분석 결과 메모)"""
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+
+from backend.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class UploadStore:
+    """
+    업로드 원본을 SHA-256 해시로 보관하는 저장소
+
+    원본은 업로드 확장자와 관계없이 UPLOAD_STORE_FOLDER/<해시 앞 2자리>/<해시>.upload에 저장되고
+    Job 폴더의 파일과 하드 링크로 공유된다. 같은 바이트가 다시 업로드되면
+    Job 폴더에 링크만 만들고, 해시별로 저장된 분석 결과(EXIF)를 재사용한다.
+    필름 매칭은 레시피 카탈로그에 따라 달라지므로 메모에 저장하지 않는다.
+    저장소 전체 크기가 UPLOAD_STORE_MAX_BYTES를 넘으면 해시 단위(원본 + 분석 메모)로
+    가장 오래 사용되지 않은 항목부터 삭제한다 (재사용 시 mtime 갱신, RenderCache와 같은 방식).
+    Job 폴더의 파일은 하드 링크이므로 저장소 항목을 삭제해도 영향을 받지 않는다. 저장소는 업로드 폴더와 같은 파일 시스템에 있어야 링크가 가능하며,
+    그렇지 않으면 복사로 대체된다.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    # 검증과 EXIF 추출용으로 메모리에 보관하는 파일 앞부분 크기
+    # (JPEG의 APP1 EXIF 세그먼트는 최대 64KB이며 항상 이미지 데이터 앞에 위치)
+    HEADER_BYTES = 512 * 1024
+
+    # 원본 항목 확장자 (같은 바이트가 .jpg/.jpeg, .tif/.tiff로 올라와도 한 항목)
+    ENTRY_SUFFIX = '.upload'
+
+    # 분석 결과 형식이 바뀌면 증가 (기존 메모 무시)
+    ANALYSIS_VERSION = 2
+
+    _lock = threading.Lock()
+    _current_bytes: Optional[int] = None
+    evictions = 0
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """저장소 사용 여부 (UPLOAD_STORE_MAX_BYTES > 0)"""
+        return Config.UPLOAD_STORE_MAX_BYTES > 0
+
+    @classmethod
+    def ingest(
+        cls,
+        stream: BinaryIO,
+        target: Path,
+        header_bytes: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        업로드 스트림을 한 번만 읽으면서 저장, 해시 계산, 헤더 캡처
+
+        헤더(앞부분 바이트)는 이미지 검증과 EXIF 추출에 쓰이며,
+        파일 전체가 header_bytes 이하이면 헤더가 곧 전체 내용이다.
+
+        Args:
+            stream (BinaryIO): 업로드 스트림
+            target (Path): 저장 경로
+            header_bytes (Optional[int]): 캡처할 앞부분 크기 (None이면 HEADER_BYTES)
+
+        Returns:
+            Dict[str, Any]: 수집 결과
+                - digest (str): 내용 SHA-256 해시 (16진수)
+                - header (bytes): 앞부분 바이트
+                - size (int): 전체 크기
+                - complete (bool): header가 파일 전체인지 여부
+        """
+        limit = cls.HEADER_BYTES if header_bytes is None else header_bytes
+        digest = hashlib.sha256()
+        header = bytearray()
+        size = 0
+
+        with open(target, 'wb') as f:
+            while True:
+                chunk = stream.read(cls.CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                f.write(chunk)
+                if len(header) < limit:
+                    header += chunk[:limit - len(header)]
+                size += len(chunk)
+
+        return {
+            'digest': digest.hexdigest(),
+            'header': bytes(header),
+            'size': size,
+            'complete': size <= limit
+        }
+
+    @classmethod
+    def _entry_path(cls, digest: str) -> Path:
+        """원본 항목 경로"""
+        return Config.UPLOAD_STORE_FOLDER / digest[:2] / f"{digest}{cls.ENTRY_SUFFIX}"
+
+    @classmethod
+    def _analysis_path(cls, digest: str) -> Path:
+        """분석 결과 메모 경로"""
+        return Config.UPLOAD_STORE_FOLDER / digest[:2] / f"{digest}.json"
+
+    @classmethod
+    def link_duplicate(cls, digest: str, target: Path) -> bool:
+        """
+        이미 저장된 내용이면 target을 저장소 항목의 링크로 교체
+
+        Args:
+            digest (str): 내용 해시
+            target (Path): 방금 저장한 업로드 파일
+
+        Returns:
+            bool: 중복 여부 (True면 target은 저장소 항목과 같은 파일)
+        """
+        entry = cls._entry_path(digest)
+
+        if not entry.is_file():
+            return False
+
+        tmp_path = target.with_name(f".{target.name}.link")
+        try:
+            cls._link_or_copy(entry, tmp_path)
+            os.replace(tmp_path, target)
+            # LRU 순서 갱신
+            os.utime(entry)
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Failed to link stored upload {entry.name}: {e}")
+            return False
+
+        return True
+
+    @classmethod
+    def add(cls, digest: str, source: Path) -> None:
+        """
+        검증된 업로드 파일을 저장소에 등록 (실패해도 예외를 전달하지 않음)
+
+        Args:
+            digest (str): 내용 해시
+            source (Path): 업로드 파일
+        """
+        if not cls.is_enabled():
+            return
+
+        entry = cls._entry_path(digest)
+
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry.with_name(f".{entry.name}.{os.getpid()}")
+            try:
+                cls._link_or_copy(source, tmp_path)
+                os.replace(tmp_path, entry)
+            except Exception:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+            size = entry.stat().st_size
+        except OSError as e:
+            logger.warning(f"Failed to add upload {source.name} to store: {e}")
+            return
+
+        cls._account(size)
+
+    @classmethod
+    def get_analysis(cls, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        해시별 분석 결과 조회
+
+        Args:
+            digest (str): 내용 해시
+
+        Returns:
+            Optional[Dict[str, Any]]: exif (없으면 None)
+        """
+        try:
+            with open(cls._analysis_path(digest), 'r', encoding='utf-8') as f:
+                analysis = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read upload analysis {digest[:12]}: {e}")
+            return None
+
+        if analysis.get('version') != cls.ANALYSIS_VERSION:
+            return None
+
+        return analysis
+
+    @classmethod
+    def put_analysis(cls, digest: str, analysis: Dict[str, Any]) -> None:
+        """
+        해시별 분석 결과 저장 (임시 파일 작성 후 os.replace로 교체)
+
+        Args:
+            digest (str): 내용 해시
+            analysis (Dict[str, Any]): exif
+        """
+        if not cls.is_enabled():
+            return
+
+        path = cls._analysis_path(digest)
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.analysis.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(dict(analysis, version=cls.ANALYSIS_VERSION), f, ensure_ascii=False)
+                os.replace(tmp_path, path)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+            size = path.stat().st_size
+        except OSError as e:
+            logger.warning(f"Failed to write upload analysis {digest[:12]}: {e}")
+            return
+
+        cls._account(size)
+
+    @classmethod
+    def _account(cls, size: int) -> None:
+        """저장한 크기를 반영하고 예산을 넘으면 삭제 실행"""
+        with cls._lock:
+            if cls._current_bytes is not None:
+                cls._current_bytes += size
+            over_budget = cls._current_bytes is None \
+                or cls._current_bytes > Config.UPLOAD_STORE_MAX_BYTES
+
+        if over_budget:
+            cls.evict()
+
+    @classmethod
+    def evict(cls) -> int:
+        """
+        예산을 넘는 만큼 가장 오래 사용되지 않은 해시의 원본과 분석 메모 삭제
+
+        다른 워커 프로세스의 저장분도 반영되도록 디렉터리를 다시 스캔한다.
+
+        Returns:
+            int: 삭제한 해시 수
+        """
+        with cls._lock:
+            groups = cls._scan()
+            total = sum(size for files, _ in groups.values() for _, size in files)
+            removed = 0
+
+            for files, _ in sorted(groups.values(), key=lambda group: group[1]):
+                if total <= Config.UPLOAD_STORE_MAX_BYTES:
+                    break
+                # 분석 메모를 먼저 삭제 (원본 없이 메모만 남아도 중복으로 처리되지 않음)
+                for path, size in sorted(files, key=lambda file: file[0].suffix != '.json'):
+                    try:
+                        path.unlink()
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        logger.warning(f"Upload store eviction failed for {path.name}: {e}")
+                        continue
+                    total -= size
+                removed += 1
+
+            cls._current_bytes = total
+            cls.evictions += removed
+
+        if removed:
+            logger.info(f"Upload store evicted {removed} upload(s), {total / 1024 / 1024:.1f}MB in use")
+
+        return removed
+
+    @classmethod
+    def _scan(cls) -> Dict[str, Tuple[List[Tuple[Path, int]], float]]:
+        """
+        해시별 저장소 항목 (원본과 분석 메모를 묶음)
+
+        Returns:
+            Dict[str, Tuple[List[Tuple[Path, int]], float]]: 해시 → ((경로, 크기) 목록, 최근 mtime)
+        """
+        groups: Dict[str, Tuple[List[Tuple[Path, int]], float]] = {}
+        root = Config.UPLOAD_STORE_FOLDER
+
+        if not root.is_dir():
+            return groups
+
+        for path in root.glob('*/*'):
+            if path.name.startswith('.'):
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files, mtime = groups.get(path.stem, ([], 0.0))
+            files.append((path, stat.st_size))
+            groups[path.stem] = (files, max(mtime, stat.st_mtime))
+
+        return groups
+
+    @staticmethod
+    def _link_or_copy(source: Path, target: Path) -> None:
+        """하드 링크 생성 (다른 파일 시스템 등으로 실패하면 복사)"""
+        try:
+            os.link(source, target)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            shutil.copyfile(source, target)
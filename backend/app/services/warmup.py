@@ -0,0 +1,212 @@
+"""서버 시작 시 공유 상태 미리 준비 (gunicorn --preload 시 워커 fork 전 실행)"""
+from typing import Any, Callable, Dict
+import gc
+import importlib
+import logging
+import threading
+import time
+
+from flask import Flask
+from sqlalchemy.orm import selectinload
+
+from backend.config import Config
+from backend.app import db
+from backend.app.models.film import Film
+from backend.app.services.film_catalog import FilmCatalog
+from backend.app.services.film_matcher import FilmMatcher
+from backend.app.services.image_processor import ImageProcessor
+from backend.app.services.recipe_catalog import RecipeCatalog
+from backend.app.utils.grain_assets import GrainAssets
+
+logger = logging.getLogger(__name__)
+
+
+class Warmup:
+    """
+    첫 요청에서 지연 생성되던 상태를 서버 시작 시 미리 만드는 클래스
+
+    - 무거운 모듈 import와 PIL 플러그인 등록
+    - 감마 변환 LUT, 그레인 텍스처, 필름별 컴파일된 프로파일
+    - 매칭 레시피 카탈로그(열 배치, 사전 계산 테이블)와 필름 목록 응답 캐시
+
+    WARMUP 설정:
+    - 'preload': create_app에서 동기 실행. gunicorn --preload와 함께 쓰면 마스터
+      프로세스에서 한 번만 실행되고, 워커는 fork로 이 메모리 페이지를 copy-on-write로
+      공유한다. fork 전에 DB 연결 풀을 비우고 gc.freeze()로 준비된 객체를
+      GC 대상에서 제외한다 (GC가 객체 헤더를 건드려 페이지가 복사되는 것을 방지).
+    - 'background': 프로세스마다 백그라운드 스레드에서 실행 (preload 없이 실행하는 경우)
+    - 'off': 실행하지 않음 (기존처럼 첫 요청에서 지연 생성)
+
+    단계별 실패는 기록만 하고 계속 진행한다 (해당 상태는 첫 요청에서 지연 생성됨).
+    """
+
+    MODES = ('off', 'preload', 'background')
+
+    # 미리 import할 모듈 (첫 렌더링/그레인 생성 시 import되는 모듈 포함)
+    HEAVY_MODULES = ('numpy', 'scipy.ndimage', 'cv2', 'PIL.Image', 'exifread')
+
+    _ready = threading.Event()
+    _status: Dict[str, Any] = {
+        'mode': 'off',
+        'status': 'pending',
+        'stages': {},
+        'errors': {},
+        'duration': None,
+    }
+
+    @classmethod
+    def start(cls, app: Flask) -> None:
+        """
+        WARMUP 설정에 따라 준비 단계 실행
+
+        Args:
+            app (Flask): 애플리케이션 (앱 컨텍스트 생성용)
+        """
+        mode = Config.WARMUP if Config.WARMUP in cls.MODES else 'off'
+        cls._status['mode'] = mode
+
+        if mode == 'preload':
+            cls.run(app)
+            cls._prepare_fork(app)
+        elif mode == 'background':
+            threading.Thread(target=cls.run, args=(app,), name='warmup', daemon=True).start()
+        else:
+            cls._status['status'] = 'disabled'
+            cls._ready.set()
+
+    @classmethod
+    def run(cls, app: Flask) -> Dict[str, Any]:
+        """
+        모든 준비 단계 실행 (단계별 소요 시간 기록)
+
+        Args:
+            app (Flask): 애플리케이션
+
+        Returns:
+            Dict[str, Any]: status()와 같은 형식의 결과
+        """
+        start = time.perf_counter()
+        cls._status['status'] = 'warming_up'
+
+        cls._stage('imports', cls._import_modules)
+        cls._stage('gamma_luts', cls._build_gamma_luts)
+        cls._stage('grain_textures', cls._load_grain_textures)
+
+        with app.app_context():
+            cls._stage('film_profiles', cls._compile_film_profiles)
+            cls._stage('recipe_catalog', RecipeCatalog.columns)
+            if Config.MATCH_TABLE:
+                cls._stage('match_table', FilmMatcher.match_table)
+            cls._stage('film_list', lambda: FilmCatalog.response('mvp', 'all'))
+
+        cls._status['duration'] = round(time.perf_counter() - start, 3)
+        cls._status['status'] = 'ready'
+        cls._ready.set()
+
+        logger.info(
+            f"Warm-up finished in {cls._status['duration']:.2f}s ({cls._status['mode']}): "
+            + ', '.join(f"{stage} {elapsed:.2f}s" for stage, elapsed in cls._status['stages'].items())
+        )
+        return cls.status()
+
+    @classmethod
+    def _stage(cls, name: str, func: Callable[[], Any]) -> None:
+        """준비 단계 하나 실행 (실패해도 다음 단계 계속)"""
+        stage_start = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            logger.warning(f"Warm-up stage '{name}' failed: {e}", exc_info=True)
+            cls._status['errors'][name] = str(e)
+        cls._status['stages'][name] = round(time.perf_counter() - stage_start, 3)
+
+    @classmethod
+    def _import_modules(cls) -> None:
+        """
+        무거운 모듈 import 및 PIL 이미지 플러그인 전체 등록
+
+        Raises:
+            ImportError: import하지 못한 모듈이 있는 경우 (나머지 모듈은 모두 시도한 뒤)
+        """
+        missing = []
+        for module in cls.HEAVY_MODULES:
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                missing.append(module)
+
+        from PIL import Image
+        Image.init()
+
+        if missing:
+            raise ImportError(f"Failed to import: {', '.join(missing)}")
+
+    @staticmethod
+    def _build_gamma_luts() -> None:
+        """감마 변환 테이블 생성 (lru_cache에 보관)"""
+        ImageProcessor._gamma_decode_lut()
+        ImageProcessor._gamma_encode_lut(ImageProcessor.GAMMA_ENCODE_LUT_SIZE)
+
+    @staticmethod
+    def _load_grain_textures() -> None:
+        """그레인 에셋 컴파일(없거나 오래된 것만) 후 폴더의 텍스처를 모두 로드 (메모리 매핑)"""
+        grain_folder = Config.BASE_DIR / 'data' / 'grain_overlays'
+        if not grain_folder.is_dir():
+            return
+
+        GrainAssets.compile_all(grain_folder)
+        for grain_path in sorted(grain_folder.glob('*.png')):
+            ImageProcessor._load_grain_texture(grain_path.name)
+
+    @staticmethod
+    def _compile_film_profiles() -> None:
+        """
+        필름별 렌더링 프로파일 컴파일 (/api/process와 같은 FilmRecipe.to_render_dict 사용)
+
+        프로파일 캐시 키는 톤 단계 값만 사용하므로 그레인 옵션과 관계없이 재사용된다.
+        """
+        films = Film.query.options(selectinload(Film.recipes)).all()
+
+        for film in films:
+            if not film.recipes:
+                continue
+
+            ImageProcessor.get_film_profile(film.recipes[0].to_render_dict(Config.GRAIN_MODE))
+
+    @staticmethod
+    def _prepare_fork(app: Flask) -> None:
+        """
+        워커 fork 전 정리
+
+        - DB 연결 풀 비우기 (부모의 연결을 여러 워커가 공유하지 않도록)
+        - 준비된 객체를 GC 영구 세대로 이동 (워커에서 GC가 공유 페이지를 건드리지 않도록)
+        """
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+        gc.collect()
+        gc.freeze()
+        logger.info(f"Warm-up state frozen for fork: {gc.get_freeze_count()} object(s)")
+
+    @classmethod
+    def is_ready(cls) -> bool:
+        """준비 완료 여부 (WARMUP='off'이면 항상 True)"""
+        return cls._ready.is_set()
+
+    @classmethod
+    def status(cls) -> Dict[str, Any]:
+        """
+        준비 상태 조회
+
+        Returns:
+            Dict[str, Any]: ready, mode, status, 단계별 소요 시간(초), 실패 단계, 전체 소요 시간
+        """
+        return {
+            'ready': cls.is_ready(),
+            'mode': cls._status['mode'],
+            'status': cls._status['status'],
+            'stages': dict(cls._status['stages']),
+            'errors': dict(cls._status['errors']),
+            'duration': cls._status['duration'],
+        }
@@ -0,0 +1,181 @@
+"""바이트 크기 기준 LRU 캐시 유틸리티"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ByteLRUCache:
+    """
+    전체 바이트 크기로 제한되는 스레드 안전 LRU 캐시
+
+    numpy 배열처럼 크기를 알 수 있는 값을 저장하며,
+    용량을 넘으면 가장 오래 사용되지 않은 항목부터 제거한다.
+    """
+
+    def __init__(self, max_bytes: int, name: str = 'cache'):
+        """
+        Args:
+            max_bytes (int): 최대 저장 크기 (bytes)
+            name (str): 로그용 캐시 이름
+        """
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be non-negative, got: {max_bytes}")
+
+        self.max_bytes = max_bytes
+        self.name = name
+
+        self._items: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self._pending: Dict[Hashable, threading.Event] = {}
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        캐시 조회 (조회된 항목은 최근 사용으로 갱신)
+
+        Args:
+            key (Hashable): 캐시 키
+            default (Any): 항목이 없을 때 반환값
+
+        Returns:
+            Any: 캐시 값 또는 default
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any, nbytes: Optional[int] = None) -> None:
+        """
+        캐시 저장
+
+        단일 항목이 전체 용량보다 크면 저장하지 않는다.
+
+        Args:
+            key (Hashable): 캐시 키
+            value (Any): 저장할 값
+            nbytes (Optional[int]): 값 크기 (bytes). 없으면 value.nbytes 사용
+        """
+        size = int(nbytes if nbytes is not None else getattr(value, 'nbytes', 0))
+
+        if size > self.max_bytes:
+            logger.debug(f"[{self.name}] Item too large to cache: {key} ({size} bytes)")
+            return
+
+        with self._lock:
+            if key in self._items:
+                self._current_bytes -= self._sizes.pop(key)
+                del self._items[key]
+
+            self._items[key] = value
+            self._sizes[key] = size
+            self._current_bytes += size
+
+            # 용량 초과 시 오래된 항목 제거
+            while self._current_bytes > self.max_bytes and self._items:
+                old_key, _ = self._items.popitem(last=False)
+                self._current_bytes -= self._sizes.pop(old_key)
+                self.evictions += 1
+                logger.debug(f"[{self.name}] Evicted: {old_key}")
+
+    def get_or_create(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        nbytes: Optional[int] = None
+    ) -> Any:
+        """
+        캐시 조회 후 없으면 생성하여 저장
+
+        같은 키를 여러 스레드가 동시에 요청하면 한 스레드만 생성하고
+        나머지는 생성이 끝날 때까지 기다린다.
+
+        Args:
+            key (Hashable): 캐시 키
+            factory (Callable[[], Any]): 값 생성 함수 (None 반환 시 저장하지 않음)
+            nbytes (Optional[int]): 값 크기 (bytes)
+
+        Returns:
+            Any: 캐시 값
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+
+            self.misses += 1
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = threading.Event()
+                is_owner = True
+            else:
+                is_owner = False
+
+        if not is_owner:
+            # 다른 스레드의 생성 완료 대기
+            pending.wait()
+            with self._lock:
+                if key in self._items:
+                    self._items.move_to_end(key)
+                    return self._items[key]
+            # 저장되지 않은 값 (None 또는 용량 초과)은 직접 생성
+            return factory()
+
+        try:
+            value = factory()
+            if value is not None:
+                self.put(key, value, nbytes)
+            return value
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+            pending.set()
+
+    def clear(self) -> None:
+        """모든 항목 제거 (통계는 유지)"""
+        with self._lock:
+            self._items.clear()
+            self._sizes.clear()
+            self._current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            Dict[str, Any]: 항목 수, 사용량, 적중/실패/제거 횟수
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'name': self.name,
+                'items': len(self._items),
+                'bytes': self._current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
@@ -0,0 +1,152 @@
+"""컴파일된 그레인 텍스처 에셋 (메모리 매핑용 .npy)"""
+from pathlib import Path
+from typing import List, Optional
+import logging
+import os
+import tempfile
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+class GrainAssets:
+    """
+    그레인 텍스처 PNG를 디코딩된 uint8 배열(.npy)로 컴파일하고 메모리 매핑으로 읽는 클래스
+
+    PNG는 워커 프로세스마다 디코딩되어 각자의 메모리에 복사본이 생기지만,
+    .npy는 np.load(mmap_mode='r')로 읽으므로 디코딩 없이 파일 페이지 캐시를
+    모든 워커가 공유한다 (텍스처가 늘어도 워커별 전용 메모리는 늘지 않음).
+    에셋은 PNG 옆에 같은 이름으로 저장하며, PNG보다 오래된 에셋은 사용하지 않는다.
+    """
+
+    ASSET_SUFFIX = '.npy'
+    SOURCE_PATTERN = '*.png'
+
+    @classmethod
+    def asset_path(cls, texture_path: Path) -> Path:
+        """
+        텍스처 PNG에 대응하는 에셋 경로
+
+        Args:
+            texture_path (Path): 그레인 텍스처 경로
+
+        Returns:
+            Path: 같은 폴더의 .npy 경로
+        """
+        return texture_path.with_suffix(cls.ASSET_SUFFIX)
+
+    @classmethod
+    def is_current(cls, texture_path: Path) -> bool:
+        """
+        에셋이 텍스처보다 최신인지 확인
+
+        Args:
+            texture_path (Path): 그레인 텍스처 경로
+
+        Returns:
+            bool: 에셋이 있고 텍스처 이후에 만들어졌으면 True
+        """
+        asset_path = cls.asset_path(texture_path)
+        try:
+            return asset_path.stat().st_mtime >= texture_path.stat().st_mtime
+        except OSError:
+            return False
+
+    @classmethod
+    def compile(cls, texture_path: Path) -> Path:
+        """
+        텍스처 PNG를 그레이스케일 uint8 .npy 에셋으로 컴파일
+
+        임시 파일에 쓴 뒤 교체하므로 다른 프로세스가 쓰다 만 에셋을 읽지 않는다.
+
+        Args:
+            texture_path (Path): 그레인 텍스처 경로
+
+        Returns:
+            Path: 에셋 경로
+
+        Raises:
+            IOError: 텍스처 읽기 또는 에셋 저장 실패 시
+        """
+        asset_path = cls.asset_path(texture_path)
+
+        try:
+            with Image.open(texture_path) as grain_img:
+                grain_array = np.ascontiguousarray(grain_img.convert('L'), dtype=np.uint8)
+
+            fd, temp_path = tempfile.mkstemp(
+                dir=asset_path.parent, prefix=f'.{asset_path.stem}.', suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    np.save(f, grain_array, allow_pickle=False)
+                os.chmod(temp_path, 0o644)  # mkstemp는 0600 (다른 사용자로 실행되는 워커도 읽을 수 있도록)
+                os.replace(temp_path, asset_path)
+            except BaseException:
+                Path(temp_path).unlink(missing_ok=True)
+                raise
+
+        except Exception as e:
+            logger.error(f"Failed to compile grain asset {texture_path.name}: {e}", exc_info=True)
+            raise IOError(f"Failed to compile grain asset: {e}")
+
+        logger.info(f"Grain asset compiled: {asset_path.name} {grain_array.shape[1]}x{grain_array.shape[0]}")
+        return asset_path
+
+    @classmethod
+    def compile_all(cls, grain_folder: Path, force: bool = False) -> List[Path]:
+        """
+        폴더의 텍스처 중 에셋이 없거나 오래된 것만 컴파일
+
+        Args:
+            grain_folder (Path): 그레인 텍스처 폴더
+            force (bool): True면 모든 텍스처를 다시 컴파일
+
+        Returns:
+            List[Path]: 새로 컴파일한 에셋 경로 목록
+        """
+        if not grain_folder.is_dir():
+            return []
+
+        compiled = []
+        for texture_path in sorted(grain_folder.glob(cls.SOURCE_PATTERN)):
+            if force or not cls.is_current(texture_path):
+                try:
+                    compiled.append(cls.compile(texture_path))
+                except IOError:
+                    continue
+
+        return compiled
+
+    @classmethod
+    def load(cls, texture_path: Path) -> Optional[np.ndarray]:
+        """
+        에셋을 메모리 매핑으로 읽기
+
+        Args:
+            texture_path (Path): 그레인 텍스처 경로
+
+        Returns:
+            Optional[np.ndarray]: 그레인 배열 (uint8, H×W, 읽기 전용 매핑) 또는 None
+                (에셋이 없거나 오래되었거나 형식이 맞지 않으면 None - PNG를 직접 디코딩)
+        """
+        if not cls.is_current(texture_path):
+            return None
+
+        asset_path = cls.asset_path(texture_path)
+        try:
+            grain_array = np.load(asset_path, mmap_mode='r', allow_pickle=False)
+        except Exception as e:
+            logger.warning(f"Failed to map grain asset {asset_path.name}: {e}")
+            return None
+
+        if grain_array.dtype != np.uint8 or grain_array.ndim != 2:
+            logger.warning(
+                f"Unexpected grain asset format {asset_path.name}: {grain_array.dtype} {grain_array.shape}"
+            )
+            return None
+
+        # np.memmap 하위 클래스 대신 일반 배열 뷰 반환 (연산 결과가 memmap으로 전파되지 않도록)
+        return grain_array.view(np.ndarray)
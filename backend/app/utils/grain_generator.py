@@ -6,6 +6,8 @@ from pathlib import Path
 from typing import Tuple, Optional
 import logging
 
+from backend.app.utils.grain_assets import GrainAssets
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,7 +29,7 @@ class GrainGenerator:
             size (Tuple[int, int]): 텍스처 크기 (width, height)
             grain_size (int): 그레인 입자 크기 (RMS Granularity 또는 PGI 값, 1-100)
             intensity (float): 그레인 강도 (0.0 ~ 1.0)
-            output_path (Optional[str]): 저장 경로 (선택적)
+            output_path (Optional[str]): 저장 경로 (선택적, 메모리 매핑용 .npy 에셋도 함께 생성)
             random_seed (Optional[int]): 랜덤 시드 (재현성용, 선택적)
 
         Returns:
@@ -99,6 +101,9 @@ class GrainGenerator:
 
                 grain_img.save(str(output_path))
                 logger.info(f"Grain texture saved: {output_path}")
+
+                # 메모리 매핑용 에셋 (워커 간 공유, 디코딩 생략)
+                GrainAssets.compile(output_path_obj)
             except Exception as e:
                 logger.error(f"Failed to save grain texture to {output_path}: {e}", exc_info=True)
                 raise IOError(f"Failed to save grain texture: {e}")
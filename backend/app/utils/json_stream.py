@@ -0,0 +1,159 @@
+"""JSON 배열 / NDJSON 요청 본문 스트리밍 파서"""
+from typing import Any, BinaryIO, Iterator
+import codecs
+import json
+
+
+class JSONStreamError(ValueError):
+    """스트림 형식 오류 (이후 항목을 더 읽을 수 없음)"""
+
+
+class JSONStreamReader:
+    """
+    요청 본문을 CHUNK_SIZE 단위로 읽으며 항목을 하나씩 꺼내는 클래스
+
+    본문 전체를 메모리에 올리지 않으므로 입력 크기와 관계없이
+    버퍼는 항목 하나(최대 max_item_bytes)와 읽기 청크 정도만 유지한다.
+    - iter_lines(): NDJSON (줄 단위 문자열, 빈 줄 제외, 해석은 호출자가 수행)
+    - iter_array(): JSON 배열 (항목을 하나씩 해석)
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    MAX_ITEM_BYTES = 64 * 1024
+
+    def __init__(self, stream: BinaryIO, max_item_bytes: int = MAX_ITEM_BYTES):
+        """
+        Args:
+            stream (BinaryIO): 요청 본문 스트림
+            max_item_bytes (int): 항목(줄) 하나의 최대 크기
+        """
+        self._stream = stream
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._max_item = max_item_bytes
+        # 아직 소비하지 않은 데이터는 _buffer[_pos:] (항목마다 문자열을 복사하지 않도록 위치만 이동)
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """
+        소비한 앞부분을 버리고 버퍼에 다음 청크 추가
+
+        Returns:
+            bool: 데이터를 더 읽었는지 여부 (False면 스트림 끝)
+        """
+        if self._eof:
+            return False
+
+        chunk = self._stream.read(self.CHUNK_SIZE)
+        try:
+            if not chunk:
+                self._eof = True
+                text = self._decoder.decode(b'', final=True)
+            else:
+                text = self._decoder.decode(chunk)
+        except UnicodeDecodeError as e:
+            raise JSONStreamError(f'Request body is not valid UTF-8: {e}')
+
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+        return bool(chunk)
+
+    def _pending(self) -> int:
+        """소비하지 않은 데이터 길이"""
+        return len(self._buffer) - self._pos
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        NDJSON 줄 단위 반복 (앞뒤 공백 제거, 빈 줄 제외)
+
+        Raises:
+            JSONStreamError: 잘못된 인코딩 또는 max_item_bytes를 넘는 줄
+        """
+        while True:
+            newline = self._buffer.find('\n', self._pos)
+
+            if newline < 0:
+                if self._pending() > self._max_item:
+                    raise JSONStreamError(f'Line exceeds {self._max_item} bytes')
+                if self._fill():
+                    continue
+                line = self._buffer[self._pos:].strip()
+                self._buffer, self._pos = '', 0
+                if line:
+                    yield line
+                return
+
+            line = self._buffer[self._pos:newline].strip()
+            self._pos = newline + 1
+            if line:
+                yield line
+
+    def _skip_whitespace(self) -> bool:
+        """
+        공백 건너뛰기 (필요하면 더 읽음)
+
+        Returns:
+            bool: 공백이 아닌 문자가 남아 있는지 여부 (False면 스트림 끝)
+        """
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return True
+            if not self._fill() and self._pos >= len(self._buffer):
+                return False
+
+    def _expect(self, expected: str) -> str:
+        """다음 문자가 expected 중 하나인지 확인하고 소비"""
+        if not self._skip_whitespace():
+            raise JSONStreamError('Unexpected end of JSON array')
+
+        char = self._buffer[self._pos]
+        if char not in expected:
+            raise JSONStreamError(f"Expected one of {list(expected)} in JSON array, got {char!r}")
+
+        self._pos += 1
+        return char
+
+    def iter_array(self) -> Iterator[Any]:
+        """
+        JSON 배열 항목 반복
+
+        Raises:
+            JSONStreamError: 배열이 아니거나 잘못된 JSON, max_item_bytes를 넘는 항목
+        """
+        decoder = json.JSONDecoder()
+        self._expect('[')
+
+        if not self._skip_whitespace():
+            raise JSONStreamError('Unexpected end of JSON array')
+        if self._buffer[self._pos] == ']':
+            self._pos += 1
+            return
+
+        while True:
+            if not self._skip_whitespace():
+                raise JSONStreamError('Unexpected end of JSON array')
+
+            while True:
+                try:
+                    item, end = decoder.raw_decode(self._buffer, self._pos)
+                except json.JSONDecodeError as e:
+                    # 항목이 청크 경계에서 잘렸을 수 있으므로 더 읽고 다시 시도
+                    if self._pending() > self._max_item:
+                        raise JSONStreamError(f'Invalid or oversized JSON array item: {e}')
+                    if not self._fill():
+                        raise JSONStreamError(f'Invalid JSON array item: {e}')
+                    continue
+
+                # 버퍼 끝에서 끝난 숫자 등은 다음 청크에서 이어질 수 있음
+                if end == len(self._buffer) and self._fill():
+                    continue
+                break
+
+            self._pos = end
+            yield item
+
+            if self._expect(',]') == ']':
+                return
@@ -0,0 +1,153 @@
+"""무압축(ZIP_STORED) ZIP 스트리밍 유틸리티"""
+from pathlib import Path
+from typing import Iterator, List, Optional
+import logging
+import os
+import tempfile
+import zipfile
+
+logger = logging.getLogger(__name__)
+
+
+class _ChunkSink:
+    """ZipFile 출력을 모아 두었다가 청크 단위로 꺼내는 쓰기 전용 스트림 (seek 불가)"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> Iterator[bytes]:
+        """지금까지 쓰인 데이터를 반환하고 비움"""
+        chunks, self._chunks = self._chunks, []
+        return iter(chunks)
+
+
+class StoredZipStream:
+    """
+    파일 목록을 무압축 ZIP으로 스트리밍하는 클래스
+
+    JPEG/WebP 등 이미 압축된 이미지는 deflate로 거의 줄지 않으므로
+    ZIP_STORED로 그대로 담는다. 아카이브 전체를 메모리에 만들지 않고
+    파일을 CHUNK_SIZE 단위로 읽어 바로 내보내며, 출력이 seek 불가능하므로
+    항목마다 데이터 디스크립터(CRC, 크기)가 데이터 뒤에 붙는다.
+    ZIP64가 필요 없는 크기에서는 전체 길이를 미리 계산할 수 있다.
+    """
+
+    CHUNK_SIZE = 256 * 1024
+
+    # ZIP 구조 크기 (ZIP64 미사용 기준)
+    LOCAL_HEADER_SIZE = 30
+    DATA_DESCRIPTOR_SIZE = 16
+    CENTRAL_HEADER_SIZE = 46
+    END_RECORD_SIZE = 22
+
+    def __init__(self, files: List[Path], arcnames: Optional[List[str]] = None):
+        """
+        Args:
+            files (List[Path]): 담을 파일 목록
+            arcnames (Optional[List[str]]): ZIP 내부 파일명 (None이면 파일명만 사용)
+        """
+        self.files = list(files)
+        self.arcnames = list(arcnames) if arcnames is not None else [f.name for f in self.files]
+
+    def content_length(self) -> Optional[int]:
+        """
+        스트리밍될 아카이브의 전체 바이트 수
+
+        Returns:
+            Optional[int]: 전체 크기 (ZIP64가 필요한 크기면 None)
+        """
+        total = self.END_RECORD_SIZE
+
+        for path, arcname in zip(self.files, self.arcnames):
+            size = path.stat().st_size
+            # zipfile은 크기 × 1.05가 한계를 넘으면 ZIP64 헤더를 사용
+            if size * 1.05 > zipfile.ZIP64_LIMIT:
+                return None
+
+            name_size = len(self._encode_name(arcname))
+            total += (
+                self.LOCAL_HEADER_SIZE + name_size + size + self.DATA_DESCRIPTOR_SIZE
+                + self.CENTRAL_HEADER_SIZE + name_size
+            )
+
+        # 오프셋이나 항목 수가 ZIP64 한계를 넘으면 계산하지 않음
+        if total > zipfile.ZIP64_LIMIT or len(self.files) >= zipfile.ZIP_FILECOUNT_LIMIT:
+            return None
+
+        return total
+
+    def __iter__(self) -> Iterator[bytes]:
+        """
+        아카이브 바이트를 청크 단위로 생성
+
+        읽을 수 없는 파일은 로그를 남기고 건너뛴다
+        (이 경우 content_length()와 실제 크기가 달라진다).
+
+        Yields:
+            bytes: 아카이브 데이터 청크
+        """
+        sink = _ChunkSink()
+
+        with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_STORED) as archive:
+            for path, arcname in zip(self.files, self.arcnames):
+                try:
+                    with open(path, 'rb') as src:
+                        zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                        zinfo.compress_type = zipfile.ZIP_STORED
+
+                        with archive.open(zinfo, 'w') as dest:
+                            while True:
+                                chunk = src.read(self.CHUNK_SIZE)
+                                if not chunk:
+                                    break
+                                dest.write(chunk)
+                                yield from sink.drain()
+
+                except OSError as e:
+                    logger.error(f"Failed to add {path.name} to ZIP: {e}")
+                    continue
+
+                yield from sink.drain()
+
+        # 중앙 디렉터리 + 종료 레코드
+        yield from sink.drain()
+
+    def write_to(self, output_path: Path) -> int:
+        """
+        아카이브를 파일로 저장 (임시 파일 작성 후 os.replace로 교체)
+
+        Args:
+            output_path (Path): 저장 경로
+
+        Returns:
+            int: 저장된 아카이브 크기 (bytes)
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            dir=output_path.parent, prefix='.archive.', suffix='.zip'
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in self:
+                    f.write(chunk)
+            os.replace(tmp_path, output_path)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        return output_path.stat().st_size
+
+    @staticmethod
+    def _encode_name(arcname: str) -> bytes:
+        """ZIP 헤더에 기록되는 파일명 바이트 (ASCII 외 문자는 UTF-8)"""
+        try:
+            return arcname.encode('ascii')
+        except UnicodeEncodeError:
+            return arcname.encode('utf-8')
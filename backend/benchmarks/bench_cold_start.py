@@ -0,0 +1,188 @@
+"""콜드 스타트 벤치마크 (준비 없는 워커 vs 준비된 마스터에서 fork한 워커)"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import logging
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+logging.basicConfig(level=logging.WARNING, format='%(message)s')
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# 첫 요청 측정용 입력 이미지 크기
+IMAGE_SIZE = (1920, 1280)
+
+
+def _memory_kb() -> dict:
+    """현재 프로세스의 공유/전용 메모리 (Linux smaps_rollup, 없으면 빈 dict)"""
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            lines = f.read().splitlines()[1:]  # 첫 줄은 주소 범위
+    except OSError:
+        return {}
+
+    fields = {}
+    for line in lines:
+        name, _, value = line.partition(':')
+        fields[name] = int(value.split()[0])
+
+    def kb(name: str) -> int:
+        return fields.get(name, 0)
+
+    return {
+        'rss': kb('Rss'),
+        'shared': kb('Shared_Clean') + kb('Shared_Dirty'),
+        'private': kb('Private_Clean') + kb('Private_Dirty'),
+    }
+
+
+def _first_requests(app, workdir: Path) -> dict:
+    """
+    워커의 첫 요청 처리 시간 (필름 목록, 필름 매칭, 필름 1장 렌더링)
+
+    Returns:
+        dict: 요청별 소요 시간 (ms)와 요청 처리 후 메모리
+    """
+    client = app.test_client()
+    timings = {}
+
+    start = time.perf_counter()
+    client.get('/api/films')
+    timings['films'] = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    client.post('/api/match/batch', json=[{'iso': 400, 'aperture': 2.8, 'shutter_speed': 1 / 125}]).get_data()
+    timings['match'] = (time.perf_counter() - start) * 1000
+
+    from PIL import Image
+    from backend.app.models.film import Film
+    from backend.app.routes.process import _prepare_film_jobs
+    from backend.app.services.image_processor import ImageProcessor
+    from backend.config import Config
+
+    input_file = workdir / 'input.jpg'
+    Image.new('RGB', IMAGE_SIZE, (150, 120, 90)).save(input_file, quality=90)
+
+    start = time.perf_counter()
+    with app.app_context():
+        film = Film.query.order_by(Film.id).first()
+        jobs, _ = _prepare_film_jobs([film.id], Config.GRAIN_MODE, None) if film else ([], [])
+    for job in jobs:
+        ImageProcessor.apply_film_simulation(str(input_file), str(workdir / 'output.jpg'), job['recipe'])
+    timings['render'] = (time.perf_counter() - start) * 1000
+
+    return {'first_request_ms': timings, 'memory_kb': _memory_kb()}
+
+
+def probe(mode: str) -> dict:
+    """
+    서버 프로세스 하나를 흉내 내 시작 시간과 첫 요청 시간 측정 (하위 프로세스에서 실행)
+
+    - off: gunicorn 워커처럼 앱을 만든 뒤 바로 첫 요청 처리
+    - preload: gunicorn --preload 마스터처럼 앱을 만들고 준비한 뒤 fork한 자식이 첫 요청 처리
+
+    Args:
+        mode (str): 'off' 또는 'preload'
+
+    Returns:
+        dict: 시작 시간, 준비 단계 결과, 첫 요청 시간 (ms)
+    """
+    start = time.perf_counter()
+    from backend.app import create_app
+    from backend.app.services.warmup import Warmup
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    result = {'startup_ms': (time.perf_counter() - start) * 1000, 'warmup': Warmup.status()}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        if mode != 'preload':
+            result.update(_first_requests(app, Path(workdir)))
+            # 같은 프로세스의 두 번째 요청 (모든 상태가 준비된 기준값)
+            result['steady_ms'] = _first_requests(app, Path(workdir))['first_request_ms']
+            return result
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            with os.fdopen(write_fd, 'w') as pipe:
+                json.dump(_first_requests(app, Path(workdir)), pipe)
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            result.update(json.load(pipe))
+        os.waitpid(pid, 0)
+
+    return result
+
+
+def _run_probe(mode: str) -> dict:
+    """새 인터프리터에서 probe 실행 (import 캐시 없는 콜드 상태)"""
+    env = dict(os.environ, WARMUP=mode)
+    output = subprocess.run(
+        [sys.executable, __file__, '--probe', mode],
+        env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_benchmark() -> bool:
+    """
+    WARMUP=off와 WARMUP=preload(fork 후 워커)의 첫 요청 시간 비교
+    (steady: WARMUP=off 프로세스의 두 번째 요청, 준비 비용이 없는 하한)
+
+    앱이 사용하는 DB(DATABASE_URL)에 필름 데이터가 있어야 한다 (init_db.py).
+    """
+    if not hasattr(os, 'fork'):
+        logger.error("os.fork is not available on this platform")
+        return False
+
+    results = {mode: _run_probe(mode) for mode in ('off', 'preload')}
+
+    preload = results['preload']['warmup']
+    logger.info(f"Warm-up (master, before fork): {preload['duration']:.2f}s")
+    for stage, elapsed in preload['stages'].items():
+        logger.info(f"  {stage:>15}: {elapsed * 1000:8.1f} ms")
+    for stage, error in preload['errors'].items():
+        logger.warning(f"  {stage:>15}: failed ({error})")
+
+    requests = list(results['off']['first_request_ms'])
+    logger.info(f"{'mode':>8} | {'startup (ms)':>12} | " + ' | '.join(f"{name + ' (ms)':>12}" for name in requests))
+    for mode, result in results.items():
+        logger.info(
+            f"{mode:>8} | {result['startup_ms']:>12.1f} | "
+            + ' | '.join(f"{result['first_request_ms'][name]:>12.1f}" for name in requests)
+        )
+    logger.info(
+        f"{'steady':>8} | {'-':>12} | "
+        + ' | '.join(f"{results['off']['steady_ms'][name]:>12.1f}" for name in requests)
+    )
+
+    off_total = sum(results['off']['first_request_ms'].values())
+    preload_total = sum(results['preload']['first_request_ms'].values())
+    logger.info(f"first requests: {off_total:.0f}ms → {preload_total:.0f}ms ({off_total / preload_total:.1f}x)")
+
+    memory = results['preload']['memory_kb']
+    if memory:
+        logger.info(
+            f"forked worker memory: rss {memory['rss'] / 1024:.0f}MB, "
+            f"shared {memory['shared'] / 1024:.0f}MB, private {memory['private'] / 1024:.0f}MB"
+        )
+
+    return not preload['errors']
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2 and sys.argv[1] == '--probe':
+        print(json.dumps(probe(sys.argv[2])))
+        sys.exit(0)
+
+    success = run_benchmark()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,159 @@
+"""EXIF 추출 벤치마크 (exifread 전체 해석 vs 필요한 태그만 읽는 경량 파서)"""
+import io
+import random
+import sys
+import time
+import logging
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import exifread
+from PIL import Image, TiffImagePlugin
+
+from backend.app.services.exif_extractor import EXIFExtractor
+from backend.app.services.exif_reader import ExifHeaderReader
+from backend.app.services.upload_store import UploadStore
+
+logging.basicConfig(level=logging.WARNING, format='%(message)s')
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+CORPUS_EXTENSIONS = {'.jpg', '.jpeg', '.tif', '.tiff', '.dng', '.png', '.webp'}
+REPEAT = 20
+
+# 생성 코퍼스용 카메라 프로파일 (제조사, 모델, 렌즈, MakerNote 크기)
+CAMERAS = [
+    ('Canon', 'Canon EOS R5', 'RF24-70mm F2.8 L IS USM', 40000),
+    ('NIKON CORPORATION', 'NIKON Z 6_2', 'NIKKOR Z 50mm f/1.8 S', 30000),
+    ('SONY', 'ILCE-7M4', 'FE 35mm F1.4 GM', 35000),
+    ('FUJIFILM', 'X-T5', 'XF33mmF1.4 R LM WR', 20000),
+    ('Apple', 'iPhone 15 Pro', 'iPhone 15 Pro back camera 6.86mm f/1.78', 4000),
+]
+
+
+def generate_corpus(count: int = 50, seed: int = 7) -> list:
+    """
+    실제 카메라 헤더와 비슷한 구조의 JPEG 생성 (IFD0, EXIF, GPS IFD, 큰 MakerNote)
+
+    Returns:
+        list: (이름, 파일 바이트) 목록
+    """
+    rng = random.Random(seed)
+    corpus = []
+
+    for i in range(count):
+        make, model, lens, maker_note_size = CAMERAS[i % len(CAMERAS)]
+
+        exif = Image.Exif()
+        exif[0x010F] = make
+        exif[0x0110] = model
+        exif[0x0132] = '2024:05:01 12:00:00'
+
+        exif_ifd = exif.get_ifd(0x8769)
+        exif_ifd[0x8827] = rng.choice([100, 200, 400, 800, 1600, 3200, 6400])
+        exif_ifd[0x829A] = TiffImagePlugin.IFDRational(1, rng.choice([30, 60, 125, 250, 1000, 4000]))
+        exif_ifd[0x829D] = TiffImagePlugin.IFDRational(rng.choice([14, 18, 28, 40, 56, 80, 110]), 10)
+        exif_ifd[0x920A] = TiffImagePlugin.IFDRational(rng.choice([24, 35, 50, 70, 85]), 1)
+        exif_ifd[0xA403] = rng.choice([0, 1])
+        exif_ifd[0x9208] = rng.choice([0, 1, 2, 3, 4, 9, 10])
+        exif_ifd[0xA434] = lens
+        exif_ifd[0x9003] = '2024:05:01 12:00:00'
+        exif_ifd[0x927C] = bytes(rng.getrandbits(8) for _ in range(maker_note_size))
+
+        gps_ifd = exif.get_ifd(0x8825)
+        gps_ifd[1] = 'N'
+        gps_ifd[2] = (TiffImagePlugin.IFDRational(37, 1), TiffImagePlugin.IFDRational(33, 1),
+                      TiffImagePlugin.IFDRational(0, 1))
+
+        buffer = io.BytesIO()
+        Image.new('RGB', (640, 426), (i % 256, 128, 64)).save(
+            buffer, format='JPEG', quality=85, exif=exif.tobytes()
+        )
+        corpus.append((f'{make.split()[0].lower()}_{i:03d}.jpg', buffer.getvalue()))
+
+    return corpus
+
+
+def load_corpus(folder: Path) -> list:
+    """폴더의 이미지 파일 헤더 읽기 (업로드 시 캡처하는 크기만큼)"""
+    corpus = []
+    for path in sorted(folder.rglob('*')):
+        if path.is_file() and path.suffix.lower() in CORPUS_EXTENSIONS:
+            with open(path, 'rb') as f:
+                corpus.append((path.name, f.read(UploadStore.HEADER_BYTES)))
+    return corpus
+
+
+def _exifread_parse(header: bytes) -> dict:
+    """기존 경로: exifread로 헤더 전체 해석"""
+    try:
+        tags = exifread.process_file(io.BytesIO(header), details=False)
+    except Exception:
+        tags = {}
+    return EXIFExtractor._parse_tags(tags)
+
+
+def _fast_parse(header: bytes) -> dict:
+    """경량 경로: 필요한 태그만 읽고, 불가능하면 exifread로 대체"""
+    tags = ExifHeaderReader.read_tags(header)
+    if tags is None:
+        return _exifread_parse(header)
+    return EXIFExtractor._parse_tags(tags)
+
+
+def _measure(func, corpus: list, repeat: int = REPEAT) -> float:
+    """헤더 1개당 평균 처리 시간 (ms)"""
+    for _, header in corpus:
+        func(header)  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _, header in corpus:
+            func(header)
+    return (time.perf_counter() - start) / (repeat * len(corpus)) * 1000
+
+
+def run_benchmark(folder: Path = None) -> bool:
+    """
+    두 경로의 결과 일치 여부와 처리 시간 비교
+
+    Args:
+        folder (Path): 실제 카메라 이미지 폴더 (None이면 코퍼스 생성)
+    """
+    corpus = load_corpus(folder) if folder else generate_corpus()
+    if not corpus:
+        logger.error(f"No images found in {folder}")
+        return False
+
+    source = str(folder) if folder else 'generated'
+    logger.info(f"Corpus: {len(corpus)} header(s) ({source})")
+
+    fallbacks = 0
+    mismatches = 0
+    for name, header in corpus:
+        if ExifHeaderReader.read_tags(header) is None:
+            fallbacks += 1
+        expected = _exifread_parse(header)
+        actual = _fast_parse(header)
+        if actual != expected:
+            mismatches += 1
+            diff = {k: (expected[k], actual[k]) for k in expected if expected[k] != actual[k]}
+            logger.warning(f"Result mismatch for {name}: {diff}")
+
+    exifread_ms = _measure(_exifread_parse, corpus)
+    fast_ms = _measure(_fast_parse, corpus)
+
+    logger.info(f"{'path':>10} | {'ms/header':>10}")
+    logger.info(f"{'exifread':>10} | {exifread_ms:>10.3f}")
+    logger.info(f"{'fast':>10} | {fast_ms:>10.3f}")
+    logger.info(f"speedup: {exifread_ms / fast_ms:.1f}x, "
+                f"fallbacks: {fallbacks}/{len(corpus)}, mismatches: {mismatches}")
+
+    return mismatches == 0
+
+
+if __name__ == '__main__':
+    success = run_benchmark(Path(sys.argv[1]) if len(sys.argv) > 1 else None)
+    sys.exit(0 if success else 1)
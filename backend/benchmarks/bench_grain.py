@@ -0,0 +1,124 @@
+"""그레인 벤치마크 (텍스처 로드: PNG 디코딩 vs 메모리 매핑 에셋, 배치 방식: resize vs tile)"""
+import sys
+import time
+import logging
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from backend.config import Config
+from backend.app.services.image_processor import ImageProcessor
+from backend.app.utils.grain_assets import GrainAssets
+
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+logger = logging.getLogger(__name__)
+
+# 벤치마크 대상 출력 크기 (width, height)
+SIZES = [
+    (1920, 1080),
+    (4096, 2731),
+    (6000, 4000),
+]
+GRAIN_FILE = 'grain_pgi_37.png'
+REPEAT = 5
+
+
+def _measure(func, repeat: int = REPEAT) -> float:
+    """평균 실행 시간 (ms)"""
+    func()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def _anonymous_kb() -> int:
+    """현재 프로세스의 익명 메모리 (프로세스 전용 힙, Linux smaps_rollup, 없으면 0)"""
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                if line.startswith('Anonymous:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def run_texture_benchmark() -> bool:
+    """
+    텍스처 로드 비용 비교 (모든 텍스처 1회 로드 기준)
+
+    - png: 워커마다 PNG 디코딩 (프로세스 전용 메모리에 복사본)
+    - mmap: 컴파일된 .npy 에셋 메모리 매핑 (페이지 캐시 공유, 전용 메모리 증가 없음)
+    """
+    grain_folder = Config.BASE_DIR / 'data' / 'grain_overlays'
+    textures = sorted(grain_folder.glob(GrainAssets.SOURCE_PATTERN))
+    if not textures:
+        logger.error(f"No grain textures in {grain_folder} (run init_db.py first)")
+        return False
+
+    GrainAssets.compile_all(grain_folder)
+
+    # 두 경로의 배열이 같은지 확인 (전체 페이지를 읽어 매핑 비용도 함께 반영)
+    for texture in textures:
+        if not np.array_equal(ImageProcessor._read_grain_texture(texture.name), GrainAssets.load(texture)):
+            logger.error(f"Grain asset differs from texture: {texture.name}")
+            return False
+
+    results = {}
+    for name, load in (('png', lambda t: ImageProcessor._read_grain_texture(t.name)), ('mmap', GrainAssets.load)):
+        before = _anonymous_kb()
+        start = time.perf_counter()
+        arrays = [load(texture) for texture in textures]
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        results[name] = (elapsed_ms, _anonymous_kb() - before)
+        del arrays
+
+    logger.info(f"Textures: {len(textures)} file(s)")
+    logger.info(f"{'load':>12} | {'total (ms)':>12} | {'private (MB)':>12}")
+    for name, (elapsed_ms, private_kb) in results.items():
+        logger.info(f"{name:>12} | {elapsed_ms:>12.2f} | {private_kb / 1024:>12.1f}")
+    logger.info("")
+
+    return True
+
+
+def run_benchmark() -> bool:
+    """
+    그레인 레이어 준비 비용 비교
+
+    - resize: 캐시 없이 매번 LANCZOS 리사이즈 (캐시 미스 비용)
+    - tile: 미러 타일링 + 랜덤 오프셋 (매 렌더링마다 실행되는 비용)
+    - overlay: 준비된 레이어를 합성하는 비용 (두 방식 공통)
+    """
+    grain_array = ImageProcessor._load_grain_texture(GRAIN_FILE)
+    if grain_array is None:
+        logger.error(f"Grain texture not found: {GRAIN_FILE} (run init_db.py first)")
+        return False
+
+    logger.info(f"Grain texture: {GRAIN_FILE} {grain_array.shape[1]}x{grain_array.shape[0]}")
+    logger.info(f"{'size':>12} | {'resize (ms)':>12} | {'tile (ms)':>10} | {'overlay (ms)':>12} | {'speedup':>8}")
+
+    for width, height in SIZES:
+        resize_ms = _measure(lambda: ImageProcessor._resize_grain(grain_array, width, height))
+        tile_ms = _measure(lambda: ImageProcessor._tile_grain(grain_array, width, height))
+
+        img = np.full((height, width, 3), 0.4, dtype=np.float32)
+        layer = ImageProcessor._tile_grain(grain_array, width, height, seed=0)
+        overlay_ms = _measure(lambda: ImageProcessor._apply_grain_overlay(img, layer, 0.3), repeat=2)
+
+        logger.info(
+            f"{width:>5}x{height:<6} | {resize_ms:>12.1f} | {tile_ms:>10.1f} | "
+            f"{overlay_ms:>12.1f} | {resize_ms / tile_ms:>7.1f}x"
+        )
+
+    return True
+
+
+if __name__ == '__main__':
+    success = run_texture_benchmark() and run_benchmark()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,124 @@
+"""필름 매칭 처리량 벤치마크 (카탈로그 스냅샷 재생성 vs 재사용, 배치 매칭, 사전 계산 테이블)"""
+import random
+import sys
+import time
+import logging
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app import create_app
+from backend.app.services.film_matcher import FilmMatcher
+from backend.app.services.recipe_catalog import RecipeCatalog
+
+logging.basicConfig(level=logging.WARNING, format='%(message)s')
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# 대표 EXIF 샘플 (주광 풍경, 인물, 텅스텐 저조도, 장노출)
+SAMPLES = [
+    {'iso': 100, 'aperture': 11.0, 'shutter_speed': 1 / 250, 'white_balance': 'Daylight', 'color_temperature': 5500},
+    {'iso': 400, 'aperture': 1.8, 'shutter_speed': 1 / 125, 'white_balance': 'Auto', 'color_temperature': 5200},
+    {'iso': 3200, 'aperture': 2.0, 'shutter_speed': 1 / 30, 'white_balance': 'Tungsten', 'color_temperature': 3200},
+    {'iso': 50, 'aperture': 16.0, 'shutter_speed': 2.0, 'white_balance': 'Auto', 'color_temperature': 5500},
+]
+DURATION = 2.0  # 측정 시간 (초)
+
+# 배치 측정용 EXIF 코퍼스 (표준 스톱 값 조합)
+CORPUS_SIZE = 5000
+CORPUS_SEED = 42
+ISO_STOPS = [50, 64, 100, 125, 160, 200, 320, 400, 640, 800, 1600, 3200, 6400, 12800]
+APERTURE_STOPS = [1.4, 1.8, 2.0, 2.8, 3.5, 4.0, 5.6, 8.0, 11.0, 16.0, 22.0]
+SHUTTER_STOPS = [1 / 8000, 1 / 1000, 1 / 500, 1 / 250, 1 / 125, 1 / 60, 1 / 30, 1 / 10, 0.5, 2.0, 30.0]
+WHITE_BALANCES = ['Auto', 'Daylight', 'Tungsten', 'Manual', 'Flash', 'Fine Weather', 'Fluorescent', 'Cloudy']
+COLOR_TEMPERATURES = [2800, 3200, 3500, 3800, 4000, 4500, 4800, 5000, 5500, 6500, 7500]
+
+
+def generate_corpus(size: int = CORPUS_SIZE, seed: int = CORPUS_SEED) -> list:
+    """무작위 EXIF 코퍼스 생성 (일부 항목은 누락시켜 기본값 경로도 포함)"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        exif = {
+            'iso': rng.choice(ISO_STOPS),
+            'aperture': rng.choice(APERTURE_STOPS),
+            'shutter_speed': rng.choice(SHUTTER_STOPS),
+            'white_balance': rng.choice(WHITE_BALANCES),
+            'color_temperature': rng.choice(COLOR_TEMPERATURES),
+        }
+        if rng.random() < 0.1:
+            del exif[rng.choice(list(exif))]
+        corpus.append(exif)
+    return corpus
+
+
+def _matches_per_second(func, duration: float = DURATION) -> float:
+    """duration 동안 반복 실행한 매칭 횟수 / 초"""
+    func(SAMPLES[0])  # 워밍업
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration:
+        func(SAMPLES[count % len(SAMPLES)])
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def run_benchmark() -> bool:
+    """
+    FilmMatcher 처리량 비교
+
+    - rebuild: 매칭마다 스냅샷을 폐기 (매번 DB 조회, 카탈로그 도입 전과 같은 SQL 비용)
+    - direct: 프로세스별 스냅샷 재사용, 레시피별 직접 계산 (매칭 중 SQL 없음)
+    - table: 격자별 사전 계산 테이블 조회
+    - batch: match_many로 코퍼스 전체를 한 번에 매칭
+
+    결과 동일성(table/batch == direct)은 tests/test_matcher.py에서 검증한다.
+    """
+    app = create_app('development')
+
+    with app.app_context():
+        if not RecipeCatalog.entries():
+            logger.error("No active recipes found (run init_db.py first)")
+            return False
+
+        logger.info(f"Active recipes: {len(RecipeCatalog.entries())}")
+
+        def rebuild(exif):
+            RecipeCatalog.invalidate()
+            return FilmMatcher.match(exif, limit=5, use_table=False)
+
+        def direct(exif):
+            return FilmMatcher.match(exif, limit=5, use_table=False)
+
+        def table(exif):
+            return FilmMatcher.match(exif, limit=5)
+
+        corpus = generate_corpus()
+
+        rebuild_rate = _matches_per_second(rebuild)
+        direct_rate = _matches_per_second(direct)
+        FilmMatcher.match_table()  # 재생성된 스냅샷의 테이블 준비
+        table_rate = _matches_per_second(table)
+
+        FilmMatcher.match_many(corpus[:10], limit=5)  # 워밍업
+        start = time.perf_counter()
+        FilmMatcher.match_many(corpus, limit=5)
+        batch_rate = len(corpus) / (time.perf_counter() - start)
+
+    logger.info(f"{'mode':>10} | {'matches/s':>10}")
+    logger.info(f"{'rebuild':>10} | {rebuild_rate:>10.0f}")
+    logger.info(f"{'direct':>10} | {direct_rate:>10.0f}")
+    logger.info(f"{'table':>10} | {table_rate:>10.0f}")
+    logger.info(f"{'batch':>10} | {batch_rate:>10.0f}")
+    logger.info(f"speedup: {direct_rate / rebuild_rate:.1f}x (direct vs rebuild), "
+                f"{table_rate / direct_rate:.1f}x (table vs direct), "
+                f"{batch_rate / direct_rate:.1f}x (batch vs direct)")
+
+    return True
+
+
+if __name__ == '__main__':
+    success = run_benchmark()
+    sys.exit(0 if success else 1)
@@ -24,6 +24,51 @@ class Config:
     UPLOAD_FOLDER = BASE_DIR / 'data' / 'temp'
     MAX_CONTENT_LENGTH = 50 * 1024 * 1024  # 50MB
     ALLOWED_EXTENSIONS = {'jpg', 'jpeg', 'png', 'tiff', 'tif'}
+    # 업로드 원본 콘텐츠 저장소 (해시 기반 중복 제거, 하드 링크를 위해 업로드 폴더 안에 둠)
+    UPLOAD_STORE_FOLDER = UPLOAD_FOLDER / '_store'
+    # 업로드 저장소 크기 상한 (원본 + 분석 메모, 넘으면 오래 사용되지 않은 해시부터 삭제, 0이면 저장하지 않음)
+    UPLOAD_STORE_MAX_BYTES = int(os.getenv('UPLOAD_STORE_MAX_MB', '2048')) * 1024 * 1024
+    # 업로드 파일별 분석(검증, EXIF, 필름 매칭) 동시 실행 스레드 수 (gunicorn 워커 프로세스당)
+    UPLOAD_WORKERS = int(os.getenv('UPLOAD_WORKERS', '4'))
+
+    # 이미지 처리 설정
+    # 원본 해상도 렌더링 (False면 4096px로 축소 후 처리)
+    FULL_RESOLUTION_RENDER = os.getenv('FULL_RESOLUTION_RENDER', 'False').lower() == 'true'
+    # 필름 미리보기 렌더링 크기 (긴 변 기준 px, /api/preview 기본값)
+    PREVIEW_SIZE = int(os.getenv('PREVIEW_SIZE', '1024'))
+    # 행 단위 밴드 렌더링 작업 메모리 예산
+    RENDER_MEMORY_BUDGET = int(os.getenv('RENDER_MEMORY_BUDGET_MB', '256')) * 1024 * 1024
+    # 그레인 배치 방식 ('resize': 이미지 크기로 리사이즈, 'tile': 원본 스케일 타일링)
+    GRAIN_MODE = os.getenv('GRAIN_MODE', 'resize')
+    # 필름 렌더링 프로세스 풀 크기 (0이면 요청 처리 프로세스에서 순차 렌더링)
+    # gunicorn 워커마다 풀이 생성되므로 워커 수 × 풀 크기가 CPU 코어 수를 넘지 않도록 설정
+    RENDER_POOL_SIZE = int(os.getenv('RENDER_POOL_SIZE', '0'))
+    # 렌더링 워커 시작 방식 ('forkserver' 또는 'spawn')
+    RENDER_POOL_START_METHOD = os.getenv('RENDER_POOL_START_METHOD', 'forkserver')
+    # 필름 1장당 렌더링 제한 시간 (초)
+    RENDER_TASK_TIMEOUT = int(os.getenv('RENDER_TASK_TIMEOUT', '90'))
+    # 렌더링 워커 재시작 주기 (처리 작업 수, 0이면 재시작 안 함)
+    RENDER_WORKER_MAX_TASKS = int(os.getenv('RENDER_WORKER_MAX_TASKS', '50'))
+    # 렌더링 결과 캐시 (입력 해시 + 레시피 기준, Job 간 공유, 0이면 사용 안 함)
+    RENDER_CACHE_DIR = Path(os.getenv('RENDER_CACHE_DIR', str(BASE_DIR / 'data' / 'render_cache')))
+    RENDER_CACHE_MAX_BYTES = int(os.getenv('RENDER_CACHE_MAX_MB', '2048')) * 1024 * 1024
+    # 비동기 처리 작업 스레드 수 (gunicorn 워커 프로세스당)
+    JOB_WORKERS = int(os.getenv('JOB_WORKERS', '2'))
+    # 다중 이미지 렌더링 시 동시에 처리할 이미지 수 (gunicorn 워커 프로세스당, 필름은 이미지별로 묶어 처리)
+    BATCH_WORKERS = int(os.getenv('BATCH_WORKERS', '2'))
+    # 동시에 처리 중인 이미지의 추정 메모리 합계 상한 (0이면 BATCH_WORKERS로만 제한)
+    BATCH_MEMORY_BUDGET = int(os.getenv('BATCH_MEMORY_BUDGET_MB', '1024')) * 1024 * 1024
+    # 디코딩 1메가픽셀당 추정 메모리 (디코딩 버퍼, PIL 원본, 밴드 렌더링 임시 배열, 인코딩 버퍼)
+    BATCH_BYTES_PER_MEGAPIXEL = int(os.getenv('BATCH_MB_PER_MEGAPIXEL', '32')) * 1024 * 1024
+
+    # 서버 시작 시 공유 상태 준비 ('preload': create_app에서 실행 - gunicorn --preload와 함께 사용,
+    # 'background': 프로세스마다 백그라운드 스레드에서 실행, 'off': 첫 요청에서 지연 생성)
+    WARMUP = os.getenv('WARMUP', 'off').lower()
+
+    # 필름 매칭 레시피 카탈로그 변경 확인 주기 (초, 0이면 매칭마다 확인)
+    CATALOG_CHECK_INTERVAL = int(os.getenv('CATALOG_CHECK_INTERVAL', '30'))
+    # 양자화된 EXIF 격자별 매칭 결과 사전 계산 (카탈로그 스냅샷마다 생성, 격자 밖은 직접 계산)
+    MATCH_TABLE = os.getenv('MATCH_TABLE', 'True').lower() == 'true'
 
     # 보안 설정
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
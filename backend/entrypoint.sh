@@ -31,6 +31,10 @@ else
     echo "✓ Grain textures already exist"
 fi
 
+# 그레인 에셋 컴파일 (메모리 매핑용 .npy, 없거나 텍스처보다 오래된 것만)
+python -c "from backend.app.utils.grain_assets import GrainAssets; from pathlib import Path; GrainAssets.compile_all(Path('/app/data/grain_overlays'))"
+echo "✓ Grain assets ready"
+
 # 임시 폴더 권한 설정
 mkdir -p /app/data/temp
 chmod 777 /app/data/temp
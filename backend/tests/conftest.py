@@ -0,0 +1,23 @@
+"""pytest 공통 설정"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가 (backend 패키지 import)
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.app import create_app, db
+
+
+@pytest.fixture
+def app():
+    """테스트 설정(메모리 DB)의 애플리케이션 (테이블 생성 후 앱 컨텍스트 유지)"""
+    app = create_app('test')
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
@@ -0,0 +1,57 @@
+"""감마 인코딩 테이블('lut' 모드) 정확도 테스트"""
+import numpy as np
+import pytest
+
+from backend.app.services.image_processor import ImageProcessor
+
+
+@pytest.fixture
+def gamma_mode(monkeypatch):
+    """GAMMA_MODE를 바꿔 인코딩하는 함수 (테스트 후 원래 모드로 복원)"""
+    def encode(mode: str, img: np.ndarray) -> np.ndarray:
+        monkeypatch.setattr(ImageProcessor, 'GAMMA_MODE', mode)
+        return ImageProcessor._gamma_encode(img.copy())
+    return encode
+
+
+def test_lut_matches_exact_within_one_lsb(gamma_mode):
+    """[0, 1] 전 범위에서 'lut'와 'exact'의 차이는 최대 1"""
+    img = np.linspace(0.0, 1.0, 1_000_001, dtype=np.float32)
+
+    lut = gamma_mode('lut', img)
+    exact = gamma_mode('exact', img)
+
+    assert lut.dtype == np.uint8
+    assert np.abs(lut.astype(np.int16) - exact.astype(np.int16)).max() <= 1
+
+
+def test_lut_clips_out_of_range(gamma_mode):
+    """범위를 벗어난 값은 0 또는 1과 같게 인코딩"""
+    img = np.array([-1.0, -1e-6, 0.0, 1.0, 1.0 + 1e-6, 2.0], dtype=np.float32)
+
+    lut = gamma_mode('lut', img)
+
+    assert (lut[:3] == lut[2]).all()
+    assert (lut[3:] == lut[3]).all()
+
+
+def test_lut_encodes_nan_as_black(gamma_mode):
+    """NaN은 인덱싱 오류 없이 0으로 인코딩"""
+    img = np.array([[np.nan, 0.5], [np.nan, 1.0]], dtype=np.float32)
+
+    lut = gamma_mode('lut', img)
+
+    assert lut.shape == img.shape
+    assert lut[0, 0] == 0 and lut[1, 0] == 0
+    finite = gamma_mode('exact', np.array([0.5, 1.0], dtype=np.float32))
+    assert np.abs(lut[:, 1].astype(np.int16) - finite.astype(np.int16)).max() <= 1
+
+
+def test_lut_handles_infinity(gamma_mode):
+    """무한대는 범위 끝으로 잘림"""
+    img = np.array([-np.inf, np.inf], dtype=np.float32)
+
+    lut = gamma_mode('lut', img)
+
+    assert lut[0] == 0
+    assert lut[1] >= 254
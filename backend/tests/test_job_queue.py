@@ -0,0 +1,123 @@
+"""작업 선점(JobQueue.claim)과 하트비트 테스트"""
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from backend.app.services.job_queue import JobQueue, JobTracker
+
+
+def _tracker(job_folder, job_id='job'):
+    return JobTracker(job_folder, job_id, [{'film_id': 1, 'status': 'queued'}])
+
+
+def _claim_in_child(job_folder, start, results):
+    start.wait()
+    tracker = _tracker(job_folder)
+    results.put(JobQueue.claim(tracker))
+    tracker.stop_heartbeat()
+
+
+@pytest.fixture
+def slow_check(monkeypatch):
+    """진행 여부 확인을 느리게 해 확인과 기록 사이의 경쟁 구간을 넓힘"""
+    is_active = JobQueue.is_active
+
+    def slow_is_active(job_folder):
+        active = is_active(job_folder)
+        time.sleep(0.05)
+        return active
+
+    monkeypatch.setattr(JobQueue, 'is_active', slow_is_active)
+
+
+@pytest.fixture
+def fast_heartbeat(monkeypatch):
+    """하트비트 0.05초, 중단 판단 0.5초"""
+    monkeypatch.setattr(JobTracker, 'HEARTBEAT_INTERVAL', 0.05)
+    monkeypatch.setattr(JobQueue, 'STALE_AFTER', 0.5)
+
+
+def test_claim_is_exclusive_until_finished(tmp_path):
+    first = _tracker(tmp_path)
+    assert JobQueue.claim(first)
+    assert JobQueue.is_active(tmp_path)
+
+    second = _tracker(tmp_path)
+    assert not JobQueue.claim(second)
+
+    first.finish({'results': []})
+    assert not JobQueue.is_active(tmp_path)
+    assert JobQueue.claim(second)
+    second.fail('stop')
+
+
+def test_concurrent_claims_in_threads(tmp_path, slow_check):
+    trackers = [_tracker(tmp_path) for _ in range(8)]
+    barrier = threading.Barrier(len(trackers))
+    results = []
+
+    def claim(tracker):
+        barrier.wait()
+        results.append(JobQueue.claim(tracker))
+
+    threads = [threading.Thread(target=claim, args=(t,)) for t in trackers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(True) == 1
+    for tracker in trackers:
+        tracker.stop_heartbeat()
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires fork')
+def test_concurrent_claims_across_processes(tmp_path, slow_check):
+    """다른 워커 프로세스의 동시 요청도 하나만 선점"""
+    context = multiprocessing.get_context('fork')
+    start = context.Event()
+    results = context.Queue()
+    processes = [
+        context.Process(target=_claim_in_child, args=(tmp_path, start, results))
+        for _ in range(6)
+    ]
+    for process in processes:
+        process.start()
+    start.set()
+    for process in processes:
+        process.join(10)
+
+    assert sorted(results.get(timeout=5) for _ in processes) == [False] * 5 + [True]
+
+
+def test_heartbeat_keeps_long_job_active(tmp_path, fast_heartbeat):
+    tracker = _tracker(tmp_path)
+    assert JobQueue.claim(tracker)
+    tracker.start()
+
+    # 진행 보고 없이 STALE_AFTER보다 오래 실행
+    time.sleep(1.0)
+    assert JobQueue.read_state(tmp_path)['status'] == 'processing'
+
+    tracker.finish({'results': []})
+    mtime = tracker.path.stat().st_mtime
+    time.sleep(0.2)
+    assert tracker.path.stat().st_mtime == mtime
+
+
+def test_stale_job_can_be_reclaimed(tmp_path, fast_heartbeat):
+    """하트비트가 멈춘 작업(프로세스 종료)은 중단으로 보고 다시 선점 가능"""
+    crashed = _tracker(tmp_path)
+    assert JobQueue.claim(crashed)
+    crashed.stop_heartbeat()
+    time.sleep(0.7)
+
+    state = JobQueue.read_state(tmp_path)
+    assert state['status'] == 'failed'
+
+    tracker = _tracker(tmp_path)
+    assert JobQueue.claim(tracker)
+    tracker.fail('stop')
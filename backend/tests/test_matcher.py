@@ -0,0 +1,145 @@
+"""필름 매칭 결과 동일성 테스트 (직접 계산 vs 배치 매칭, 사전 계산 테이블)"""
+import itertools
+
+import numpy as np
+import pytest
+
+from backend.app import db
+from backend.app.models.film import Film
+from backend.app.models.recipe import FilmRecipe
+from backend.app.services.film_matcher import FilmMatcher
+from backend.app.services.match_table import MatchTable
+from backend.app.services.recipe_catalog import RecipeCatalog
+
+# (이름, 제조사, 종류, 기준 감도, ISO 범위, 색온도, 상반칙 불궤 데이터) - 모든 조리개/저조도 규칙 포함
+FILMS = [
+    ('Velvia 50', 'Fujifilm', 'color', 50, (50, 100), 5500, '{"1": 0.5}'),
+    ('Portra 400', 'Kodak', 'color', 400, (200, 800), 5500, None),
+    ('Provia 100F', 'Fujifilm', 'color', 100, (100, 200), 5500, None),
+    ('Ektar 100', 'Kodak', 'color', 100, (100, 200), 5500, None),
+    ('Ektachrome E100', 'Kodak', 'color', 100, (None, None), 5500, '{"10": 1.0}'),
+    ('Gold 200', 'Kodak', 'color', 200, (100, 400), 5500, None),
+    ('UltraMax 400', 'Kodak', 'color', 400, (200, 800), 4800, None),
+    ('ProImage 100', 'Kodak', 'color', 100, (100, 200), None, None),
+    ('Vision3 500T', 'Kodak', 'color', 500, (250, 1000), 3200, '{"1": 0.3}'),
+    ('T-Max 400', 'Kodak', 'bw', 400, (200, 1600), None, None),
+    ('Rollei RPX 25', 'Rollei', 'bw', 25, (25, 50), None, None),
+    ('HP5 Plus', 'Ilford', 'bw', 400, (400, 3200), None, None),
+]
+
+# 점수 규칙 경계값과 그 양옆 값 (격자 구간이 바뀌는 지점)
+SHUTTER_EDGES = (0.001, 1.0 / 60.0, 0.1)
+APERTURE_EDGES = (2.8, 4.0, 5.6, 8.0)
+
+
+def _around(values):
+    """경계값과 바로 아래/위의 부동소수점 값"""
+    return sorted({
+        float(v) for edge in values
+        for v in (np.nextafter(edge, -np.inf), edge, np.nextafter(edge, np.inf))
+    })
+
+
+SHUTTERS = _around(SHUTTER_EDGES) + [1 / 8000, 1 / 125, 1 / 30, 2.0]
+APERTURES = _around(APERTURE_EDGES) + [1.4, 3.5, 4.5, 11.0]
+ISOS = [640, 800, 1000]  # 저조도 판단 경계 (ISO 800)
+WHITE_BALANCES = ['Tungsten', 'Auto', 'Cloudy']
+COLOR_TEMPERATURES = [3200, 5500]
+
+
+@pytest.fixture
+def catalog(app):
+    """FILMS로 채운 DB와 새 카탈로그 스냅샷"""
+    for name, manufacturer, film_type, iso_base, (iso_min, iso_max), temp, reciprocity in FILMS:
+        film = Film(name=name, manufacturer=manufacturer, type=film_type, iso_base=iso_base)
+        db.session.add(film)
+        db.session.flush()
+        db.session.add(FilmRecipe(
+            film_id=film.id, recipe_name=f'{name} Standard', process_type='C-41',
+            iso_min=iso_min, iso_max=iso_max, color_temperature=temp,
+            reciprocity_failure_data=reciprocity, matching_reason=f'{name} 특성',
+        ))
+
+    # 비활성 레시피는 매칭에서 제외
+    db.session.add(FilmRecipe(
+        film_id=film.id, recipe_name='Inactive', process_type='C-41', is_active=False
+    ))
+    db.session.commit()
+
+    RecipeCatalog.invalidate()
+    FilmMatcher._table = None
+    yield RecipeCatalog.entries()
+    RecipeCatalog.invalidate()
+    FilmMatcher._table = None
+
+
+def _grid():
+    """경계값 조합 EXIF 목록 (기본값 경로용 누락 항목 포함)"""
+    exif_list = [
+        {
+            'iso': iso, 'aperture': aperture, 'shutter_speed': shutter,
+            'white_balance': wb, 'color_temperature': temp,
+        }
+        for iso, aperture, shutter, wb, temp in itertools.product(
+            ISOS, APERTURES, SHUTTERS, WHITE_BALANCES, COLOR_TEMPERATURES
+        )
+    ]
+    exif_list.append({})
+    exif_list.append({'iso': 799, 'shutter_speed': 1.0 / 60.0})
+    return exif_list
+
+
+def test_catalog_has_all_recipes(catalog):
+    assert len(catalog) == len(FILMS)
+    assert len(catalog) > MatchTable.DEPTH
+
+
+@pytest.mark.parametrize('limit', [1, 5, 100])
+def test_match_many_equals_direct(catalog, limit):
+    """match_many 결과가 EXIF별 직접 계산(match) 결과와 같음"""
+    exif_list = _grid()
+
+    batch = FilmMatcher.match_many(exif_list, limit=limit)
+
+    assert len(batch) == len(exif_list)
+    for exif, result in zip(exif_list, batch):
+        assert result == FilmMatcher.match(exif, limit=limit, use_table=False), exif
+
+
+@pytest.mark.parametrize('limit', [1, 5, MatchTable.DEPTH])
+def test_match_table_equals_direct(catalog, limit):
+    """사전 계산 테이블 조회 결과가 경계값과 그 양옆에서 직접 계산 결과와 같음"""
+    table = FilmMatcher.match_table()
+
+    for exif in _grid()[:-2]:
+        ranked = table.lookup(exif, limit)
+        assert ranked is not None, exif
+
+        expected = FilmMatcher.match(exif, limit=limit, use_table=False)
+        assert [(recipe.recipe_id, round(score, 1)) for recipe, score in ranked] == [
+            (item['recipe_id'], item['score']) for item in expected
+        ], exif
+        assert FilmMatcher.match(exif, limit=limit) == expected, exif
+
+
+def test_match_table_buckets_split_at_edges(catalog):
+    """경계값 자체와 바로 아래/위 값은 서로 다른 구간"""
+    table = FilmMatcher.match_table()
+    base = {'iso': 800, 'aperture': 5.6, 'shutter_speed': 1 / 125, 'white_balance': 'Auto'}
+
+    for key, edges in (('shutter_speed', SHUTTER_EDGES), ('aperture', APERTURE_EDGES)):
+        for edge in edges:
+            cells = [
+                table.cell(dict(base, **{key: value}))
+                for value in (np.nextafter(edge, -np.inf), edge, np.nextafter(edge, np.inf))
+            ]
+            assert len(set(cells)) == 3, (key, edge)
+
+
+def test_match_table_falls_back_off_grid(catalog):
+    """격자 밖 입력(ISO 799 등)은 직접 계산 결과를 반환"""
+    table = FilmMatcher.match_table()
+
+    for exif in ({'iso': 799, 'shutter_speed': 1.0 / 60.0}, {'iso': 800, 'color_temperature': 5000}):
+        assert table.lookup(exif, 5) is None
+        assert FilmMatcher.match(exif, limit=5) == FilmMatcher.match(exif, limit=5, use_table=False)
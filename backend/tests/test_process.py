@@ -0,0 +1,18 @@
+"""이미지 처리 요청 옵션 검증 테스트"""
+import pytest
+
+from backend.app.routes.process import _validate_grain_options
+
+
+@pytest.mark.parametrize('grain_seed', [None, 0, 42])
+def test_valid_grain_seed(grain_seed):
+    assert _validate_grain_options('tile', grain_seed) is None
+
+
+@pytest.mark.parametrize('grain_seed', [True, False, -1, 1.5, '7'])
+def test_invalid_grain_seed(grain_seed):
+    assert _validate_grain_options('tile', grain_seed) == 'grain_seed must be a non-negative integer'
+
+
+def test_invalid_grain_mode():
+    assert _validate_grain_options('stretch', None).startswith('Invalid grain_mode')
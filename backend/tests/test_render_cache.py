@@ -0,0 +1,52 @@
+"""렌더 캐시 키 테스트 (그레인 모드/시드, 그레인 텍스처 변경)"""
+import os
+
+import pytest
+
+from backend.app.services.image_processor import ImageProcessor
+from backend.app.services.render_cache import RenderCache
+
+ENCODER = {'format': 'jpeg', 'quality': 95}
+RECIPE = {'film_name': 'Portra 400', 'type': 'color', 'grain_intensity': 0.3}
+
+
+@pytest.fixture
+def grain_texture(tmp_path, monkeypatch):
+    """임시 그레인 텍스처 (레시피와 관계없이 같은 파일)"""
+    texture = tmp_path / 'grain.png'
+    texture.write_bytes(b'grain')
+    monkeypatch.setattr(ImageProcessor, 'grain_texture_path', classmethod(
+        lambda cls, recipe: texture if recipe.get('grain_intensity', 0.3) > 0 else None
+    ))
+    return texture
+
+
+def _key(**recipe):
+    return RenderCache.make_key('digest', dict(RECIPE, **recipe), ENCODER, False)
+
+
+def test_seed_ignored_in_resize_mode(grain_texture):
+    assert _key(grain_mode='resize', grain_seed=1) == _key(grain_mode='resize', grain_seed=2)
+    assert _key(grain_seed=1) == _key()
+
+
+def test_seed_splits_tile_mode(grain_texture):
+    assert _key(grain_mode='tile', grain_seed=1) != _key(grain_mode='tile', grain_seed=2)
+    assert _key(grain_mode='tile', grain_seed=1) != _key(grain_mode='resize', grain_seed=1)
+
+
+def test_unseeded_tile_is_not_cacheable(grain_texture):
+    assert not RenderCache.is_cacheable(dict(RECIPE, grain_mode='tile', grain_seed=None))
+    assert RenderCache.is_cacheable(dict(RECIPE, grain_mode='tile', grain_seed=7))
+    assert RenderCache.is_cacheable(dict(RECIPE, grain_mode='resize'))
+    # 그레인이 없으면 오프셋과 무관
+    assert RenderCache.is_cacheable(dict(RECIPE, grain_mode='tile', grain_intensity=0.0))
+
+
+def test_regenerated_texture_changes_key(grain_texture):
+    before = _key()
+
+    stat = grain_texture.stat()
+    os.utime(grain_texture, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert _key() != before
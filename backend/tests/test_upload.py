@@ -0,0 +1,60 @@
+"""업로드 이미지 검증 테스트 (헤더 기반 검증과 전체 파일 검증)"""
+import io
+
+import numpy as np
+from PIL import Image
+
+from backend.config import Config
+from backend.app.routes.upload import verify_image_header
+from backend.app.services.upload_store import UploadStore
+
+
+def _ingest(tmp_path, data: bytes, name: str) -> dict:
+    """업로드와 같은 방식으로 저장하고 헤더 캡처 (헤더 크기 4KB)"""
+    return UploadStore.ingest(io.BytesIO(data), tmp_path / name, header_bytes=4096)
+
+
+def _encode(fmt: str) -> bytes:
+    """헤더보다 큰 노이즈 이미지 (압축되지 않도록 무작위 픽셀)"""
+    pixels = np.random.default_rng(0).integers(0, 256, (128, 128, 3), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def test_large_jpeg_passes_on_header(tmp_path):
+    ingested = _ingest(tmp_path, _encode('JPEG'), 'photo.jpg')
+
+    assert not ingested['complete']
+    assert verify_image_header(ingested['header'], ingested['complete'], tmp_path / 'photo.jpg')
+
+
+def test_large_png_verifies_whole_file(tmp_path):
+    """헤더 뒤쪽이 손상된 PNG는 전체 파일 검증(CRC)에서 실패"""
+    data = bytearray(_encode('PNG'))
+    data[-100] ^= 0xFF
+    ingested = _ingest(tmp_path, bytes(data), 'photo.png')
+
+    assert not ingested['complete']
+    assert not verify_image_header(ingested['header'], ingested['complete'], tmp_path / 'photo.png')
+
+
+def test_large_png_passes_when_intact(tmp_path):
+    ingested = _ingest(tmp_path, _encode('PNG'), 'photo.png')
+
+    assert verify_image_header(ingested['header'], ingested['complete'], tmp_path / 'photo.png')
+
+
+def test_store_dedupes_across_suffix_aliases(tmp_path, monkeypatch):
+    """같은 바이트가 .jpg와 .jpeg로 올라와도 저장소 항목은 하나"""
+    monkeypatch.setattr(Config, 'UPLOAD_STORE_FOLDER', tmp_path / 'store')
+
+    data = _encode('JPEG')
+    first = _ingest(tmp_path, data, 'a.jpg')
+    assert not UploadStore.link_duplicate(first['digest'], tmp_path / 'a.jpg')
+    UploadStore.add(first['digest'], tmp_path / 'a.jpg')
+
+    second = _ingest(tmp_path, data, 'b.jpeg')
+    assert UploadStore.link_duplicate(second['digest'], tmp_path / 'b.jpeg')
+    assert (tmp_path / 'b.jpeg').read_bytes() == data
+    assert len(list((tmp_path / 'store').glob('*/*'))) == 1
@@ -0,0 +1,28 @@
+"""준비 단계(Warmup) 테스트"""
+from backend.app import db
+from backend.app.models.film import Film
+from backend.app.models.recipe import FilmRecipe
+from backend.app.routes.process import _prepare_film_jobs
+from backend.app.services.image_processor import ImageProcessor
+from backend.app.services.warmup import Warmup
+
+
+def test_compiled_profiles_match_process_recipes(app, monkeypatch):
+    """준비 단계가 /api/process와 같은 프로파일 캐시 키를 컴파일"""
+    film = Film(name='T-Max 400', manufacturer='Kodak', type='bw', iso_base=400)
+    db.session.add(film)
+    db.session.flush()
+    db.session.add(FilmRecipe(
+        film_id=film.id, recipe_name='Standard', process_type='B&W',
+        bw_weight_r=0.3, bw_weight_g=0.6, bw_weight_b=0.1, grain_intensity=0.2,
+    ))
+    db.session.commit()
+
+    monkeypatch.setattr(ImageProcessor, '_profile_cache', {})
+    Warmup._compile_film_profiles()
+    warmed = set(ImageProcessor._profile_cache)
+
+    film_jobs, failed = _prepare_film_jobs([film.id], 'tile', 7)
+
+    assert not failed
+    assert ImageProcessor._profile_cache_key(film_jobs[0]['recipe']) in warmed